@@ -2,24 +2,36 @@
 
 import json
 import logging
+from datetime import timedelta
+from functools import partial
 from pathlib import Path
 
 from homeassistant.components.frontend import add_extra_js_url
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 
+from .broadcast import async_cancel_broadcasts
 from .const import (
     DATA_ADDERS,
+    DATA_BROADCASTS,
     DATA_CONFIG_ENTRY,
     DATA_DISPLAYS,
+    DISPLAY_EVICTION_INTERVAL,
     DOMAIN,
     FRONTEND_SCRIPT_URL,
 )
+from .intent_listener import async_get_intent_listener
+from .last_seen import async_get_last_seen
+from .presence import async_load_presence, async_unload_presence
+from .remote_assist_display import apply_option_changes, evict_idle_displays
+from .routing import async_load_routes
+from .scheduler import DisplayScheduler
 from .service import async_setup_services
 from .ws_api import async_setup_ws_api
 
@@ -50,6 +62,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType):
     hass.data[DOMAIN] = {
         DATA_DISPLAYS: {},
         DATA_ADDERS: {},
+        DATA_BROADCASTS: {},
     }
 
     version = await hass.async_add_executor_job(get_version, hass)
@@ -79,20 +92,70 @@ async def async_setup(hass: HomeAssistant, config: ConfigType):
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Remote Assist Display Controller from a config entry."""
     hass.data[DOMAIN][DATA_CONFIG_ENTRY] = entry
+    async_load_routes(hass, entry.options.get("intent_routes"))
+    await async_get_last_seen(hass).async_load()
+    scheduler = DisplayScheduler(hass)
+    await scheduler.async_load()
+    entry.async_on_unload(scheduler.async_stop)
+    async_load_presence(hass, entry.options.get("presence"))
+    entry.async_on_unload(partial(async_unload_presence, hass))
+    entry.async_on_unload(partial(async_cancel_broadcasts, hass))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     async_setup_services(hass)
     await async_setup_ws_api(hass)
 
+    previous_options = dict(entry.options)
+    cancel_eviction = None
+
+    @callback
+    def _async_evict_idle_displays(now) -> None:
+        """Unload displays that have been idle for too long."""
+        evict_idle_displays(hass)
+
+    @callback
+    def _async_schedule_eviction() -> None:
+        """Only sweep for idle displays while an idle TTL is configured."""
+        nonlocal cancel_eviction
+        if cancel_eviction is not None:
+            cancel_eviction()
+            cancel_eviction = None
+        if entry.options.get("idle_display_ttl"):
+            cancel_eviction = async_track_time_interval(
+                hass,
+                _async_evict_idle_displays,
+                timedelta(seconds=DISPLAY_EVICTION_INTERVAL),
+            )
+
     async def _handle_config_update(hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Handle options update."""
-        displays = hass.data[DOMAIN][DATA_DISPLAYS]
-        # Update all active displays with new settings
-        for display in displays.values():
-            display.update(hass, {"settings": entry.options})
-
+        nonlocal previous_options
+        # Only update the displays and entities affected by the changed options
+        changed = apply_option_changes(hass, previous_options, entry.options)
+        previous_options = dict(entry.options)
+        if "idle_display_ttl" in changed:
+            _async_schedule_eviction()
+
+    @callback
+    def _async_cancel_eviction() -> None:
+        """Stop sweeping for idle displays."""
+        if cancel_eviction is not None:
+            cancel_eviction()
+
+    _async_schedule_eviction()
+    entry.async_on_unload(_async_cancel_eviction)
+    entry.async_on_unload(async_get_intent_listener(hass).async_stop)
     entry.async_on_unload(entry.add_update_listener(_handle_config_update))
     return True
 
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry.
+
+    The timers and listeners started by async_setup_entry are stopped by the
+    callbacks it registered with async_on_unload, which only run once this
+    returns True.
+    """
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
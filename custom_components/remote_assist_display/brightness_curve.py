@@ -0,0 +1,114 @@
+"""Brightness curves for the Remote Assist Display backlight."""
+
+from datetime import datetime, time
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def _same_axis(points):
+    """Validate every point is keyed by time, or every one by sun elevation."""
+    axes = {"time" if "time" in point else "elevation" for point in points}
+    if len(axes) > 1:
+        raise vol.Invalid("Curve points must all use time or all use elevation")
+    return points
+
+
+CURVE_POINT_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive("time", "axis"): cv.time,
+            vol.Exclusive("elevation", "axis"): vol.All(
+                vol.Coerce(float), vol.Range(min=-90, max=90)
+            ),
+            vol.Required("brightness"): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=255)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key("time", "elevation"),
+)
+
+CURVE_POINTS_SCHEMA = vol.All(
+    cv.ensure_list, vol.Length(min=2), [CURVE_POINT_SCHEMA], _same_axis
+)
+
+
+def build_curve(points, latitude=None, longitude=None):
+    """Return the curve setting sent to the client for validated points.
+
+    Levels are converted to the client's 0.0 to 1.0 scale and the points are
+    sorted along their axis. Sun curves carry the location, so the client can
+    work out the sun's elevation on its own.
+    """
+    if "time" in points[0]:
+        return {
+            "source": "time",
+            "points": sorted(
+                (
+                    {"time": p["time"].isoformat(), "level": p["brightness"] / 255.0}
+                    for p in points
+                ),
+                key=lambda p: p["time"],
+            ),
+        }
+    return {
+        "source": "sun",
+        "latitude": latitude,
+        "longitude": longitude,
+        "points": sorted(
+            (
+                {"elevation": p["elevation"], "level": p["brightness"] / 255.0}
+                for p in points
+            ),
+            key=lambda p: p["elevation"],
+        ),
+    }
+
+
+def _interpolate(points, x, period=None):
+    """Interpolate linearly between (x, level) points sorted by x.
+
+    With a period the curve wraps around, otherwise it is flat past its ends.
+    """
+    if period is not None:
+        points = [(points[-1][0] - period, points[-1][1]), *points,
+                  (points[0][0] + period, points[0][1])]
+    if x <= points[0][0]:
+        return points[0][1]
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        if x <= x1:
+            return y0 if x1 == x0 else y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    return points[-1][1]
+
+
+def curve_level(curve, now: datetime | None = None, elevation=None):
+    """Return the level of a curve, between 0.0 and 1.0.
+
+    Args:
+        curve: Curve setting as returned by build_curve
+        now: Time to evaluate a time curve at, defaults to the current time
+        elevation: Sun elevation to evaluate a sun curve at
+
+    Returns:
+        float: The level, or None when a sun curve has no elevation
+
+    """
+    if curve["source"] == "sun":
+        if elevation is None:
+            return None
+        return _interpolate(
+            [(p["elevation"], p["level"]) for p in curve["points"]], elevation
+        )
+
+    local = dt_util.as_local(now or dt_util.utcnow())
+    seconds = local.hour * 3600 + local.minute * 60 + local.second
+    points = []
+    for point in curve["points"]:
+        at = time.fromisoformat(point["time"])
+        points.append((at.hour * 3600 + at.minute * 60 + at.second, point["level"]))
+    return _interpolate(points, seconds, SECONDS_PER_DAY)
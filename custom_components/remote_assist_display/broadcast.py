@@ -0,0 +1,158 @@
+"""Scheduled broadcasts for Remote Assist Display commands."""
+
+from collections import OrderedDict
+from functools import partial
+import logging
+import random
+from uuid import uuid4
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_BROADCAST_HISTORY, DATA_BROADCASTS, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of finished broadcasts whose progress can still be looked up
+FINISHED_BROADCASTS = 16
+
+
+def plan_waves(targets, stagger=0, wave_size=None, jitter=False):
+    """Split targets into waves spread over a time window.
+
+    Args:
+        targets: List of (display_id, display) tuples
+        stagger: Number of seconds to spread the waves over
+        wave_size: Number of displays per wave, defaults to one
+        jitter: Randomize each wave's offset within its slot
+
+    Returns:
+        list: (delay, wave) tuples, ordered by wave index
+
+    """
+    if not stagger or not targets:
+        return [(0, list(targets))]
+
+    wave_size = wave_size or 1
+    waves = [targets[i : i + wave_size] for i in range(0, len(targets), wave_size)]
+    slot = stagger / len(waves)
+    return [
+        (index * slot + (random.uniform(0, slot) if jitter else 0), wave)
+        for index, wave in enumerate(waves)
+    ]
+
+
+class ScheduledBroadcast:
+    """A command sent to many displays in timed waves.
+
+    Each wave is sent from its own timer, so the broadcast can be cancelled
+    until its last wave has gone out.
+    """
+
+    def __init__(self, hass: HomeAssistant, frame, waves) -> None:
+        """Initialize the broadcast.
+
+        Args:
+            hass: HomeAssistant instance
+            frame: CommandFrame to send
+            waves: (delay, wave) tuples as returned by plan_waves
+
+        """
+        self.hass = hass
+        self.broadcast_id = uuid4().hex
+        self.frame = frame
+        self._waves = waves
+        self._unsubs = {}
+        self.total = sum(len(wave) for _, wave in waves)
+        self.sent = 0
+        self.waves_sent = 0
+        self.cancelled = False
+
+    @property
+    def done(self):
+        """Return True once every wave was sent or the broadcast was cancelled."""
+        return self.cancelled or self.waves_sent == len(self._waves)
+
+    @callback
+    def async_start(self):
+        """Send the first wave and schedule the remaining ones."""
+        self.hass.data[DOMAIN].setdefault(DATA_BROADCASTS, {})[
+            self.broadcast_id
+        ] = self
+        for index, (delay, _) in enumerate(self._waves):
+            if delay <= 0:
+                self._send_wave(index)
+            else:
+                self._unsubs[index] = async_call_later(
+                    self.hass, delay, partial(self._async_fire_wave, index)
+                )
+
+    @callback
+    def async_cancel(self):
+        """Cancel all waves that have not been sent yet."""
+        for unsub in self._unsubs.values():
+            unsub()
+        self._unsubs.clear()
+        self.cancelled = True
+        self._finish()
+
+    @callback
+    def _async_fire_wave(self, index, _now):
+        """Send a wave when its timer fires."""
+        self._unsubs.pop(index, None)
+        self._send_wave(index)
+
+    @callback
+    def _send_wave(self, index):
+        """Send the command to every display in a wave."""
+        _, wave = self._waves[index]
+        for _, display in wave:
+            display.send_frame(self.frame)
+        self.sent += len(wave)
+        self.waves_sent += 1
+        _LOGGER.debug(
+            "Broadcast %s sent wave %s/%s", self.broadcast_id, index + 1, len(self._waves)
+        )
+        if self.done:
+            self._finish()
+
+    @callback
+    def _finish(self):
+        """Move the broadcast to the history once it has no pending waves."""
+        data = self.hass.data[DOMAIN]
+        if data.get(DATA_BROADCASTS, {}).pop(self.broadcast_id, None) is None:
+            return
+        history = data.setdefault(DATA_BROADCAST_HISTORY, OrderedDict())
+        history[self.broadcast_id] = self
+        while len(history) > FINISHED_BROADCASTS:
+            history.popitem(last=False)
+
+    def as_dict(self):
+        """Return the progress of the broadcast."""
+        return {
+            "broadcast_id": self.broadcast_id,
+            "command": self.frame.command,
+            "total": self.total,
+            "sent": self.sent,
+            "pending": 0 if self.cancelled else self.total - self.sent,
+            "waves": len(self._waves),
+            "waves_sent": self.waves_sent,
+            "cancelled": self.cancelled,
+            "done": self.done,
+        }
+
+
+@callback
+def async_get_broadcast(hass: HomeAssistant, broadcast_id):
+    """Return a pending or recently finished broadcast, or None."""
+    data = hass.data[DOMAIN]
+    return data.get(DATA_BROADCASTS, {}).get(broadcast_id) or data.get(
+        DATA_BROADCAST_HISTORY, {}
+    ).get(broadcast_id)
+
+
+@callback
+def async_cancel_broadcasts(hass: HomeAssistant):
+    """Cancel the pending waves of every broadcast."""
+    for broadcast in list(hass.data[DOMAIN].get(DATA_BROADCASTS, {}).values()):
+        broadcast.async_cancel()
@@ -10,12 +10,17 @@ from homeassistant.config_entries import (
     OptionsFlow,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.selector import ObjectSelector
 
 from .const import (
     DEFAULT_DEVICE_NAME_STORAGE_KEY,
     DEFAULT_HOME_ASSISTANT_DASHBOARD,
+    DEFAULT_IDLE_DISPLAY_TTL,
+    DEFAULT_MAX_DISPLAYS,
     DOMAIN,
 )
+from .presence import PRESENCE_LINKS_SCHEMA
+from .routing import RoutingTable
 
 
 def empty_str_to_default(default_value: str) -> Any:
@@ -60,6 +65,30 @@ def remote_assist_display_config_option_schema(
                 "hide_sidebar",
                 default=options.get("hide_sidebar", False),
             ): bool,
+            vol.Required(
+                "pipeline_status",
+                default=options.get("pipeline_status", False),
+            ): bool,
+            vol.Optional(
+                "intent_routes",
+                default=options.get("intent_routes", []),
+            ): ObjectSelector(),
+            vol.Optional(
+                "presence",
+                default=options.get("presence", []),
+            ): ObjectSelector(),
+            vol.Optional(
+                "idle_display_ttl",
+                default=options.get("idle_display_ttl", DEFAULT_IDLE_DISPLAY_TTL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                "max_displays",
+                default=options.get("max_displays", DEFAULT_MAX_DISPLAYS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Required(
+                "purge_idle_displays",
+                default=options.get("purge_idle_displays", False),
+            ): bool,
         }
     )
 
@@ -72,6 +101,7 @@ class RemoteAssistDisplayOptionsFlowHandler(OptionsFlow):
     ) -> ConfigFlowResult:
         """Manage the options."""
 
+        errors = {}
         if user_input is not None:
             # Transform empty strings to defaults
             if not user_input.get("default_dashboard_path", "").strip():
@@ -79,14 +109,23 @@ class RemoteAssistDisplayOptionsFlowHandler(OptionsFlow):
             if not user_input.get("device_name_storage_key", "").strip():
                 user_input["device_name_storage_key"] = DEFAULT_DEVICE_NAME_STORAGE_KEY
 
-            return self.async_create_entry(
-                title="Remote Assist Display",
-                data=user_input,
-            )
-
-        options: dict[str, Any] = self.config_entry.options
+            try:
+                RoutingTable(user_input.get("intent_routes") or ())
+            except vol.Invalid:
+                errors["intent_routes"] = "invalid_routes"
+            try:
+                PRESENCE_LINKS_SCHEMA(user_input.get("presence") or [])
+            except vol.Invalid:
+                errors["presence"] = "invalid_presence"
+            if not errors:
+                return self.async_create_entry(
+                    title="Remote Assist Display",
+                    data=user_input,
+                )
+
+        options: dict[str, Any] = user_input or self.config_entry.options
         schema = remote_assist_display_config_option_schema(self.hass, options)
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
 
 
 class RemoteAssistDisplayConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -8,19 +8,67 @@ LOGGER = logging.getLogger(__package__)
 NAVIGATE_SERVICE = "navigate"
 NAVIGATE_URL_SERVICE = "navigate_url"
 REFRESH_SERVICE = "refresh"
+APPLY_SETTINGS_SERVICE = "apply_settings"
+CANCEL_BROADCAST_SERVICE = "cancel_broadcast"
+BROADCAST_STATUS_SERVICE = "broadcast_status"
+PREFETCH_SERVICE = "prefetch"
+PURGE_SERVICE = "purge"
+SCHEDULE_SERVICE = "schedule"
+UNSCHEDULE_SERVICE = "unschedule"
+START_PLAYLIST_SERVICE = "start_playlist"
+STOP_PLAYLIST_SERVICE = "stop_playlist"
+SET_BRIGHTNESS_CURVE_SERVICE = "set_brightness_curve"
 NAVIGATE_WS_COMMAND = f"{WS_ROOT}/navigate"
 NAVIGATE_URL_WS_COMMAND = f"{WS_ROOT}/navigate_url"
 REGISTER_WS_COMMAND = f"{WS_ROOT}/register"
 SETTINGS_WS_COMMAND = f"{WS_ROOT}/settings"
 CONNECT_WS_COMMAND = f"{WS_ROOT}/connect"
+CONNECT_MANY_WS_COMMAND = f"{WS_ROOT}/connect_many"
+SUBSCRIBE_FLEET_WS_COMMAND = f"{WS_ROOT}/subscribe_fleet"
 REFRESH_WS_COMMAND = f"{WS_ROOT}/refresh"
 PING_WS_COMMAND = f"{WS_ROOT}/ping"
 UPDATE_WS_COMMAND = f"{WS_ROOT}/update"
+BATCH_WS_COMMAND = f"{WS_ROOT}/batch"
+UPDATE_SETTINGS_WS_COMMAND = f"{WS_ROOT}/update_settings"
+PREFETCH_WS_COMMAND = f"{WS_ROOT}/prefetch"
+INTENT_WS_COMMAND = f"{WS_ROOT}/intent"
+PIPELINE_WS_COMMAND = f"{WS_ROOT}/pipeline"
+BACKLIGHT_WS_COMMAND = f"{WS_ROOT}/backlight"
+WAKE_WS_COMMAND = f"{WS_ROOT}/wake"
 DATA_DISPLAYS = "displays"
+DATA_UNLOADING = "unloading"
 DATA_ADDERS = "adders"
+DATA_BROADCASTS = "broadcasts"
+DATA_BROADCAST_HISTORY = "broadcast_history"
+DATA_GATEWAYS = "gateways"
+DATA_FLEET = "fleet"
+DATA_LAST_SEEN = "last_seen"
+DATA_ROUTES = "routes"
+DATA_INTENT_LISTENER = "intent_listener"
+DATA_SCHEDULER = "scheduler"
+DATA_PRESENCE = "presence"
 DEFAULT_HOME_ASSISTANT_DASHBOARD = "lovelace"
 DEFAULT_DEVICE_NAME_STORAGE_KEY = "browser_mod-browser-id"
 DATA_CONFIG_ENTRY = "config_entry"
 FRONTEND_SCRIPT_URL = "/remote_assist_display/remote_assist_display"
 
-MIN_VERSION_BACKLIGHT = "1.2.0"
\ No newline at end of file
+MIN_VERSION_BACKLIGHT = "1.2.0"
+MIN_VERSION_BRIGHTNESS_CURVE = "1.3.0"
+MIN_VERSION_TRANSITION = "1.4.0"
+MIN_VERSION_CONNECT_FRAME = "1.5.0"
+MIN_VERSION_PLAYLIST = "1.6.0"
+MIN_VERSION_WAKE = "1.7.0"
+
+NAVIGATION_HISTORY_SIZE = 10
+DEFAULT_PREFETCH_HISTORY = 3
+
+DEFAULT_IDLE_DISPLAY_TTL = 0
+DEFAULT_MAX_DISPLAYS = 0
+DISPLAY_EVICTION_INTERVAL = 300
+
+FLEET_UPDATE_INTERVAL = 1
+
+SCHEDULER_TICK = 1
+
+# Seconds between re-evaluations of an active brightness curve
+BRIGHTNESS_CURVE_INTERVAL = 60
@@ -0,0 +1,32 @@
+"""Diagnostics support for Remote Assist Display."""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_DISPLAYS, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Return diagnostics for a config entry."""
+    displays = hass.data[DOMAIN][DATA_DISPLAYS]
+    return {
+        "options": dict(entry.options),
+        "displays": {
+            display_id: {
+                "connections": len(display.connection),
+                "revision": display.revision,
+                "acked_revision": display.acked_revision,
+                "outbound": {
+                    "queued": len(display.outbound),
+                    "size": display.outbound.size,
+                    "superseded": display.outbound.superseded,
+                    "dropped": display.outbound.dropped,
+                },
+                "pending": display.pending.as_dict(),
+                "playlist": display.playlist,
+            }
+            for display_id, display in displays.items()
+        },
+    }
@@ -0,0 +1,104 @@
+"""Push dispatcher for Remote Assist Display data updates."""
+
+from homeassistant.core import HomeAssistant, callback
+
+
+class _ListenerRemover:
+    """Callable that removes a dispatcher listener.
+
+    Every entity of every display holds one, and a slotted object is a
+    fraction of the size of a closure marked as a callback.
+    """
+
+    __slots__ = ("_dispatcher", "_update_callback", "_keys")
+
+    def __init__(self, dispatcher, update_callback, keys) -> None:
+        """Initialize the remover."""
+        self._dispatcher = dispatcher
+        self._update_callback = update_callback
+        self._keys = keys
+
+    def __call__(self):
+        """Remove the listener."""
+        self._dispatcher._async_remove_listener(self._update_callback, self._keys)
+
+
+class DisplayDispatcher:
+    """Push-only data holder that notifies listeners of display updates.
+
+    Nothing is ever polled for a display, so this replaces a
+    DataUpdateCoordinator with just the data and its listeners. Listeners
+    can subscribe to specific data keys and are only called when one of
+    those keys is part of an update.
+    """
+
+    __slots__ = ("hass", "display_id", "data", "_listeners", "_key_listeners")
+
+    def __init__(self, hass: HomeAssistant, display_id: str) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            hass: HomeAssistant instance.
+            display_id: Identifier for the display.
+
+        """
+        self.hass = hass
+        self.display_id = display_id
+        self.data = None
+        self._listeners = []
+        self._key_listeners = {}
+
+    @callback
+    def async_add_listener(self, update_callback, keys=None):
+        """Listen for data updates.
+
+        Args:
+            update_callback: Callback invoked without arguments on updates.
+            keys: Optional data keys to limit the updates the listener gets.
+
+        Returns:
+            Callable that removes the listener.
+
+        """
+        if keys is None:
+            self._listeners.append(update_callback)
+        else:
+            for key in keys:
+                self._key_listeners.setdefault(key, []).append(update_callback)
+
+        return _ListenerRemover(self, update_callback, keys)
+
+    @callback
+    def _async_remove_listener(self, update_callback, keys):
+        """Stop calling a listener on updates."""
+        if keys is None:
+            self._listeners.remove(update_callback)
+            return
+        for key in keys:
+            listeners = self._key_listeners[key]
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._key_listeners[key]
+
+    @callback
+    def async_set_updated_data(self, data, keys=None):
+        """Store new data and notify the listeners affected by it.
+
+        Args:
+            data: The display data.
+            keys: Optional data keys that changed. All listeners are notified
+                when omitted.
+
+        """
+        self.data = data
+        if keys is None:
+            keys = self._key_listeners
+
+        # A listener subscribed to several changed keys is only called once
+        listeners = dict.fromkeys(self._listeners)
+        for key in keys:
+            if key_listeners := self._key_listeners.get(key):
+                listeners.update(dict.fromkeys(key_listeners))
+
+        for update_callback in listeners:
+            update_callback()
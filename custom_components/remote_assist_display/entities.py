@@ -1,48 +1,127 @@
 """Entities for Remote Assist Display integration."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 import logging
+from typing import Any
 
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class RADEntity(CoordinatorEntity):
-    """Entity class for Remote Assist Display integration."""
+@dataclass(frozen=True, slots=True)
+class RADStateSnapshot:
+    """Immutable view of an entity's state for a single state write."""
+
+    available: bool
+    value: Any
+    attributes: Mapping[str, Any]
+
+
+class RADEntity(Entity):
+    """Entity class for Remote Assist Display integration.
+
+    Home Assistant reads the state properties several times per state write,
+    so they are computed once into a snapshot for each display update and
+    served from it until the next one.
+    """
+
+    _attr_should_poll = False
+
+    # Display data keys the entity's state depends on
+    _listen_keys = frozenset({"connected"})
 
     def __init__(self, coordinator, display_id, name, icon=None) -> None:
         """Initialize the Remote Assist Display entity."""
-        super().__init__(coordinator)
+        self.coordinator = coordinator
         self.display_id = display_id
         self._name = name
         self._icon = icon
+        self._unique_id = f"{display_id}-{name.replace(' ', '_')}"
+        self._device_info = {
+            "identifiers": {(DOMAIN, display_id)},
+            "name": display_id,
+        }
+        self._base_attributes = {
+            "type": "remote_assist_display",
+            "display_id": display_id,
+        }
+        self._snapshot = None
+
+    async def async_added_to_hass(self):
+        """Subscribe to the display updates the entity depends on."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, self._listen_keys
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from the display."""
+        self._snapshot = self._build_snapshot()
+        super().async_write_ha_state()
 
     @property
     def _data(self):
         return self.coordinator.data or {}
 
+    def _compute_value(self):
+        """Return the entity's primary value."""
+        return None
+
+    def effective_value(self):
+        """Return the entity's primary value as computed from the current data.
+
+        Unlike the state properties, this does not use the snapshot, so it also
+        reflects options the entity falls back on that changed since.
+        """
+        return self._compute_value()
+
+    def _compute_attributes(self):
+        """Return the state attributes."""
+        return self._base_attributes
+
+    def _build_snapshot(self):
+        """Compute the state served to Home Assistant."""
+        return RADStateSnapshot(
+            available=self._data.get("connected", False),
+            value=self._compute_value(),
+            attributes=self._compute_attributes(),
+        )
+
+    @property
+    def _current_snapshot(self):
+        """Return the snapshot of the last display update."""
+        if self._snapshot is None:
+            self._snapshot = self._build_snapshot()
+        return self._snapshot
+
+    @callback
+    def async_write_ha_state(self):
+        """Write the state after a change made outside a display update."""
+        self._snapshot = self._build_snapshot()
+        super().async_write_ha_state()
+
     @property
     def device_info(self):
         """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.display_id)},
-            "name": self.display_id,
-        }
+        return self._device_info
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        return {
-            "type": "remote_assist_display",
-            "display_id": self.display_id,
-        }
+        return self._current_snapshot.attributes
 
     @property
     def available(self):
         """Return if entity is available."""
-        return self._data.get("connected", False)
+        return self._current_snapshot.available
 
     @property
     def name(self):
@@ -57,7 +136,7 @@ class RADEntity(CoordinatorEntity):
     @property
     def unique_id(self):
         """Return a unique ID to use for this entity."""
-        return f"{self.display_id}-{self._name.replace(' ', '_')}"
+        return self._unique_id
 
     @property
     def icon(self):
@@ -0,0 +1,130 @@
+"""Fleet status subscriptions for Remote Assist Display."""
+
+import logging
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_DISPLAYS, DATA_FLEET, DOMAIN, FLEET_UPDATE_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+# Display data keys the fleet summary is built from
+FLEET_DATA_KEYS = frozenset({"connected", "display", "client_version", "brightness"})
+
+
+def display_summary(display):
+    """Return the compact status of a display."""
+    return {
+        "connected": bool(display.data.get("connected")),
+        "current_url": (display.data.get("display") or {}).get("current_url"),
+        "client_version": display.data.get("client_version"),
+        "brightness": display.data.get("brightness"),
+        "last_seen": display.settings.get("last_seen"),
+    }
+
+
+class FleetStatus:
+    """Stream the status of every display to fleet subscribers.
+
+    Subscribers receive one snapshot of all displays, then only the fields
+    that changed, coalesced over FLEET_UPDATE_INTERVAL. Nothing is tracked
+    while nobody is subscribed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fleet status."""
+        self.hass = hass
+        self._subscribers = set()
+        self._last = {}
+        self._dirty = set()
+        self._unsub_flush = None
+
+    @callback
+    def async_subscribe(self, connection, cid):
+        """Send a snapshot to a new subscriber and stream it the changes.
+
+        Returns:
+            Callable that removes the subscriber.
+
+        """
+        # Bring existing subscribers up to date before taking the snapshot
+        self._async_flush()
+        displays = self.hass.data[DOMAIN][DATA_DISPLAYS]
+        self._last = {
+            display_id: display_summary(display)
+            for display_id, display in displays.items()
+        }
+        self._subscribers.add((connection, cid))
+        connection.send_message(
+            websocket_api.event_message(cid, {"snapshot": self._last})
+        )
+
+        @callback
+        def unsubscribe():
+            self._subscribers.discard((connection, cid))
+            if not self._subscribers:
+                self._async_reset()
+
+        return unsubscribe
+
+    @callback
+    def async_mark_dirty(self, display_id):
+        """Note that a display's status may have changed."""
+        if not self._subscribers:
+            return
+        self._dirty.add(display_id)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, FLEET_UPDATE_INTERVAL, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now=None):
+        """Send the changes of the dirty displays to every subscriber."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        if not self._dirty:
+            return
+
+        displays = self.hass.data[DOMAIN][DATA_DISPLAYS]
+        delta = {}
+        for display_id in self._dirty:
+            display = displays.get(display_id)
+            if display is None:
+                if self._last.pop(display_id, None) is not None:
+                    delta[display_id] = None
+                continue
+            summary = display_summary(display)
+            previous = self._last.get(display_id, {})
+            changed = {k: v for k, v in summary.items() if previous.get(k) != v}
+            if changed or display_id not in self._last:
+                delta[display_id] = changed
+                self._last[display_id] = summary
+        self._dirty.clear()
+
+        if not delta:
+            return
+        _LOGGER.debug("Sending fleet changes for %s displays", len(delta))
+        for connection, cid in self._subscribers:
+            connection.send_message(websocket_api.event_message(cid, {"delta": delta}))
+
+    @callback
+    def _async_reset(self):
+        """Stop tracking once the last subscriber has left."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._last = {}
+        self._dirty.clear()
+
+
+@callback
+def async_get_fleet_status(hass: HomeAssistant):
+    """Return the fleet status shared by every subscriber."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (fleet := data.get(DATA_FLEET)) is None:
+        fleet = data[DATA_FLEET] = FleetStatus(hass)
+    return fleet
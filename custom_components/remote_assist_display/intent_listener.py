@@ -0,0 +1,87 @@
+"""Shared intent event listener for Remote Assist Display."""
+
+import logging
+
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DATA_CONFIG_ENTRY, DATA_INTENT_LISTENER, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntentEventListener:
+    """Single bus listener for the intent events of every display.
+
+    The listener's event filter only accepts events from satellites that are
+    linked to a display, so the event bus drops every other event before any
+    integration code runs. Matching events are dispatched to the linked
+    displays through a lookup by satellite device id.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the listener."""
+        self.hass = hass
+        self.event_type = None
+        self._unsub = None
+        self._satellites = {}
+        self._links = {}
+
+    @callback
+    def async_set_event_type(self, event_type):
+        """Listen for a new event type, or stop listening."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self.event_type = event_type or None
+        if self.event_type:
+            _LOGGER.debug("Listening for intent events of type %s", self.event_type)
+            self._unsub = self.hass.bus.async_listen(
+                self.event_type, self._async_handle_event, event_filter=self._async_filter
+            )
+
+    @callback
+    def async_stop(self):
+        """Stop listening and drop the listener with its config entry."""
+        self.async_set_event_type(None)
+        self.hass.data[DOMAIN].pop(DATA_INTENT_LISTENER, None)
+
+    @callback
+    def async_link(self, display, satellite_id):
+        """Link a display to the satellite whose intents it shows."""
+        self.async_unlink(display)
+        if satellite_id is None:
+            return
+        self._links[display.display_id] = satellite_id
+        self._satellites.setdefault(satellite_id, {})[display.display_id] = display
+
+    @callback
+    def async_unlink(self, display):
+        """Stop sending intents to a display."""
+        satellite_id = self._links.pop(display.display_id, None)
+        if satellite_id is None:
+            return
+        linked = self._satellites[satellite_id]
+        linked.pop(display.display_id, None)
+        if not linked:
+            del self._satellites[satellite_id]
+
+    @callback
+    def _async_filter(self, event_data):
+        """Accept only events from satellites linked to a display."""
+        return event_data.get("device_id") in self._satellites
+
+    @callback
+    def _async_handle_event(self, event: Event):
+        """Dispatch an intent event to the displays of its satellite."""
+        for display in list(self._satellites.get(event.data.get("device_id"), {}).values()):
+            display.handle_intent_event(event.data)
+
+
+@callback
+def async_get_intent_listener(hass: HomeAssistant):
+    """Return the intent listener shared by every display."""
+    data = hass.data[DOMAIN]
+    if (listener := data.get(DATA_INTENT_LISTENER)) is None:
+        listener = data[DATA_INTENT_LISTENER] = IntentEventListener(hass)
+        listener.async_set_event_type(data[DATA_CONFIG_ENTRY].options.get("event_type"))
+    return listener
@@ -0,0 +1,73 @@
+"""Persistent record of when each Remote Assist Display was last seen."""
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_LAST_SEEN, DOMAIN
+
+STORAGE_KEY = f"{DOMAIN}.last_seen"
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+
+class LastSeenStore:
+    """When each display was last seen, kept across restarts.
+
+    Displays are only loaded into memory while their client talks to Home
+    Assistant, so this is the only record of when a display that was unloaded,
+    or has not reconnected since a restart, was last seen. The store also
+    records when it started keeping times, so a display without a time is
+    known not to have been seen since then.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._last_seen = {}
+        self._since = None
+
+    @property
+    def since(self):
+        """Return when the store started keeping times, now if it is not loaded."""
+        return self._since or dt_util.utcnow()
+
+    async def async_load(self):
+        """Restore the stored times, or start keeping them now."""
+        if (data := await self._store.async_load()) is None:
+            self._since = dt_util.utcnow()
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+        self._since = dt_util.parse_datetime(data["since"])
+        self._last_seen = data["last_seen"]
+
+    def get(self, display_id):
+        """Return when a display was last seen, or None if it is unknown."""
+        return dt_util.parse_datetime(self._last_seen.get(display_id) or "")
+
+    @callback
+    def async_touch(self, display_id, when=None):
+        """Record that a display was seen, now unless given a time."""
+        self._last_seen[display_id] = (when or dt_util.utcnow()).isoformat()
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_forget(self, display_id):
+        """Drop the record of a removed display."""
+        if self._last_seen.pop(display_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self):
+        """Return the data to store."""
+        return {"since": self.since.isoformat(), "last_seen": self._last_seen}
+
+
+@callback
+def async_get_last_seen(hass: HomeAssistant):
+    """Return the last seen store shared by every display."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (store := data.get(DATA_LAST_SEEN)) is None:
+        store = data[DATA_LAST_SEEN] = LastSeenStore(hass)
+    return store
@@ -1,16 +1,31 @@
 """Light platform for Remote Assist Display integration."""
 
+from datetime import timedelta
 from typing import Any
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntity,
+    LightEntityFeature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DATA_ADDERS, DOMAIN, LOGGER
+from .brightness_curve import CURVE_POINTS_SCHEMA, build_curve, curve_level
+from .const import (
+    BRIGHTNESS_CURVE_INTERVAL,
+    DATA_ADDERS,
+    DOMAIN,
+    LOGGER,
+    MIN_VERSION_BRIGHTNESS_CURVE,
+    MIN_VERSION_TRANSITION,
+    SET_BRIGHTNESS_CURVE_SERVICE,
+)
 from .entities import RADEntity
 
 async def async_setup_platform(
@@ -31,9 +46,18 @@ async def async_setup_entry(
     """Set up light entities."""
     await async_setup_platform(hass, config_entry, async_add_entities)
 
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SET_BRIGHTNESS_CURVE_SERVICE,
+        {"points": CURVE_POINTS_SCHEMA},
+        "async_set_brightness_curve",
+    )
+
 class RADBacklightLight(RADEntity, LightEntity):
     """Representation of a light to control the display's backlight."""
 
+    _listen_keys = frozenset({"connected", "brightness", "brightness_curve"})
+
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
     _attr_color_mode = ColorMode.BRIGHTNESS
 
@@ -47,27 +71,116 @@ class RADBacklightLight(RADEntity, LightEntity):
         RADEntity.__init__(self, coordinator, display_id, "Backlight")
         LightEntity.__init__(self)
         self.display = display
+        self._curve_unsub = None
         LOGGER.debug(f"RADBacklightLight initialized for {display_id}")
 
+    async def async_added_to_hass(self):
+        """Follow the brightness curve restored with the display's data."""
+        await super().async_added_to_hass()
+        self._follow_curve()
+
+    async def async_will_remove_from_hass(self):
+        """Stop following the brightness curve."""
+        await super().async_will_remove_from_hass()
+        if self._curve_unsub is not None:
+            self._curve_unsub()
+            self._curve_unsub = None
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from the display."""
+        self._follow_curve()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _follow_curve(self):
+        """Re-evaluate the state periodically while a curve is active.
+
+        The client interpolates the curve on its own, so this only keeps the
+        reported level current and never sends anything to the display.
+        """
+        if not self._data.get("brightness_curve"):
+            if self._curve_unsub is not None:
+                self._curve_unsub()
+                self._curve_unsub = None
+        elif self._curve_unsub is None:
+            self._curve_unsub = async_track_time_interval(
+                self.hass,
+                self._async_curve_tick,
+                timedelta(seconds=BRIGHTNESS_CURVE_INTERVAL),
+            )
+
+    @callback
+    def _async_curve_tick(self, _now):
+        """Write the level the curve has reached."""
+        self.async_write_ha_state()
+
+    def _compute_value(self):
+        """Return the on state and brightness from the client's brightness.
+
+        The client sends brightness as a float between 0.0 and 1.0.
+        Home Assistant expects an int between 0 and 255. While a brightness
+        curve is active, the level is interpolated from the curve instead.
+        """
+        if curve := self._data.get("brightness_curve"):
+            sun = self.hass and self.hass.states.get("sun.sun")
+            level = curve_level(curve, elevation=sun and sun.attributes.get("elevation"))
+            if level is not None:
+                return level > 0, round(level * 255)
+
+        client_brightness = self._data.get("brightness")
+        if client_brightness is None:
+            return None, None
+        client_brightness = float(client_brightness)
+        return client_brightness > 0, round(client_brightness * 255)
+
     @property
     def is_on(self) -> bool | None:
         """Return true if light is on."""
-        brightness_val = self._data.get("brightness")
-        if brightness_val is None:
-            return None 
-        return float(brightness_val) > 0
+        return self._current_snapshot.value[0]
 
     @property
     def brightness(self) -> int | None:
-        """Return the brightness of this light between 0..255.
-        
-        The client sends brightness as a float between 0.0 and 1.0.
-        Home Assistant expects an int between 0 and 255.
+        """Return the brightness of this light between 0..255."""
+        return self._current_snapshot.value[1]
+
+    @property
+    def supported_features(self) -> LightEntityFeature:
+        """Return transitions as supported when the client can run them."""
+        if self.display.supports(MIN_VERSION_TRANSITION):
+            return LightEntityFeature.TRANSITION
+        return LightEntityFeature(0)
+
+    async def async_set_brightness_curve(self, points) -> None:
+        """Push a brightness curve that the display follows through the day."""
+        if not self.display.supports(MIN_VERSION_BRIGHTNESS_CURVE):
+            raise HomeAssistantError(
+                f"Display version {self.display.data.get('client_version')} does not "
+                f"support brightness curves (requires {MIN_VERSION_BRIGHTNESS_CURVE})"
+            )
+
+        curve = build_curve(points, self.hass.config.latitude, self.hass.config.longitude)
+        LOGGER.debug(f"Setting brightness curve for {self.display_id}: {curve}")
+        self.display.set_brightness_curve(self.hass, curve)
+
+    def _fade(self, brightness, transition):
+        """Have the client fade to a brightness, or to "on" or "off", if it can.
+
+        The fade is sent as a single frame and run by the client. The state is
+        left alone until the client acknowledges it, so it moves to the target
+        once rather than once per step.
+
+        Returns:
+            bool: True if the fade was sent
+
         """
-        client_brightness = self._data.get("brightness")
-        if client_brightness is None:
-            return None 
-        return round(float(client_brightness) * 255)
+        if transition is None or not self.display.supports(MIN_VERSION_TRANSITION):
+            return False
+        LOGGER.debug(
+            f"Fading backlight for {self.display_id} to {brightness} over {transition}s"
+        )
+        self.display.fade_backlight(self.hass, brightness, transition)
+        return True
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
@@ -76,6 +189,12 @@ class RADBacklightLight(RADEntity, LightEntity):
         ha_brightness_for_optimistic_update = kwargs.get(ATTR_BRIGHTNESS, 255)
         optimistic_client_brightness_value = ha_brightness_for_optimistic_update / 255.0
 
+        if self._fade(
+            optimistic_client_brightness_value if ATTR_BRIGHTNESS in kwargs else "on",
+            kwargs.get(ATTR_TRANSITION),
+        ):
+            return
+
         payload_to_client = {}
         if ATTR_BRIGHTNESS in kwargs:
             # Specific brightness requested by HA
@@ -91,20 +210,23 @@ class RADBacklightLight(RADEntity, LightEntity):
             LOGGER.debug(
                 f"Turning on backlight for {self.display_id} with generic 'on' command. Optimistic client brightness set to: {optimistic_client_brightness_value}"
             )
-            
+
         self.display.update_settings(self.hass, payload_to_client)
         
         # Optimistically update local state so HA UI reflects the change immediately
-        self._data["brightness"] = optimistic_client_brightness_value
-        self.async_write_ha_state()
+        self.display.update(
+            self.hass, {"brightness": optimistic_client_brightness_value}
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
+        if self._fade("off", kwargs.get(ATTR_TRANSITION)):
+            return
+
         LOGGER.debug(f"Turning off backlight for {self.display_id}")
         
         data_to_send = {"brightness": "off"}
         self.display.update_settings(self.hass, data_to_send)
         
         # Optimistically update local state
-        self._data["brightness"] = 0.0
-        self.async_write_ha_state()
+        self.display.update(self.hass, {"brightness": 0.0})
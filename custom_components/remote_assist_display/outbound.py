@@ -0,0 +1,427 @@
+"""Outbound message queue for Remote Assist Display connections."""
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+
+from .const import (
+    BACKLIGHT_WS_COMMAND,
+    DATA_GATEWAYS,
+    DOMAIN,
+    INTENT_WS_COMMAND,
+    NAVIGATE_URL_WS_COMMAND,
+    NAVIGATE_WS_COMMAND,
+    PIPELINE_WS_COMMAND,
+    PREFETCH_WS_COMMAND,
+    REFRESH_WS_COMMAND,
+    UPDATE_SETTINGS_WS_COMMAND,
+    WAKE_WS_COMMAND,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_NAVIGATION = 0
+PRIORITY_SETTINGS = 1
+PRIORITY_INFO = 2
+
+# Commands mapped to their priority and collapse key. A queued message is
+# replaced by a newer one with the same collapse key.
+COMMAND_CLASSES = {
+    NAVIGATE_WS_COMMAND: (PRIORITY_NAVIGATION, "navigation"),
+    NAVIGATE_URL_WS_COMMAND: (PRIORITY_NAVIGATION, "navigation"),
+    REFRESH_WS_COMMAND: (PRIORITY_NAVIGATION, "refresh"),
+    INTENT_WS_COMMAND: (PRIORITY_NAVIGATION, "intent"),
+    PIPELINE_WS_COMMAND: (PRIORITY_NAVIGATION, "pipeline"),
+    UPDATE_SETTINGS_WS_COMMAND: (PRIORITY_SETTINGS, "settings"),
+    BACKLIGHT_WS_COMMAND: (PRIORITY_SETTINGS, "backlight"),
+    WAKE_WS_COMMAND: (PRIORITY_NAVIGATION, "backlight"),
+    PREFETCH_WS_COMMAND: (PRIORITY_INFO, "prefetch"),
+}
+
+MAX_QUEUED_BYTES = 64 * 1024
+# Bytes sent to a display that may still be waiting to be written, and the
+# rate at which they are assumed to drain when the client does not ack
+MAX_IN_FLIGHT_BYTES = 32 * 1024
+IN_FLIGHT_DRAIN_RATE = 64 * 1024
+FLUSH_RETRY_DELAY = 0.5
+
+# Seconds a command is held for a disconnected display, by collapse key
+PENDING_TTLS = {
+    "navigation": 120,
+    "refresh": 300,
+    "intent": 15,
+}
+DEFAULT_PENDING_TTL = 60
+MAX_PENDING_COMMANDS = 16
+
+
+def classify_command(command):
+    """Return the priority and collapse key for a command."""
+    return COMMAND_CLASSES.get(command, (PRIORITY_INFO, None))
+
+
+class CommandFrame:
+    """A command serialized once for any number of connections.
+
+    Only the subscription id differs between the event messages sent to each
+    connection, so it is spliced into the pre-encoded event the same way
+    Home Assistant's cached_event_message does for state change events.
+    """
+
+    __slots__ = ("command", "payload", "_partial")
+
+    def __init__(self, command, **payload) -> None:
+        """Initialize the frame."""
+        self.command = command
+        self.payload = payload
+        self._partial = None
+
+    @property
+    def partial(self):
+        """Return the encoded event message without its id."""
+        if self._partial is None:
+            self._partial = json_bytes(
+                {"type": "event", "event": {"command": self.command, **self.payload}}
+            )
+        return self._partial
+
+    def __len__(self):
+        """Return the encoded size of the frame."""
+        return len(self.partial)
+
+    def message(self, cid, recipients=None):
+        """Return the event message for a subscription id.
+
+        Messages for a subscription bound to several displays also name the
+        displays they are addressed to.
+        """
+        if recipients is None:
+            return b"".join((self.partial[:-1], b',"id":', str(cid).encode(), b"}"))
+        return b"".join(
+            (
+                self.partial[:-1],
+                b',"recipients":',
+                json_bytes(recipients),
+                b',"id":',
+                str(cid).encode(),
+                b"}",
+            )
+        )
+
+
+def _send_frame(connection, cid, frame):
+    """Send a frame to a connection bound to a single display."""
+    connection.send_message(frame.message(cid))
+
+
+def _min_revision(first, second):
+    """Return the lower of two revisions that may be None."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+class OutboundQueue:
+    """Bounded, prioritized queue of commands for a single display.
+
+    Messages are only held while too many bytes are in flight to the display.
+    Sent bytes drain at a fixed rate and are released at once when the client
+    acknowledges a revision, so a slow client receives the latest navigation
+    and settings instead of a backlog. The memory held for a display is capped
+    by the encoded size of its frames.
+
+    Frames carrying settings are queued with the revision the client is up to
+    date with without them, so the display never reports a revision covering
+    settings that were held or dropped here.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connections,
+        max_bytes=MAX_QUEUED_BYTES,
+        max_in_flight=MAX_IN_FLIGHT_BYTES,
+        send=None,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            hass: HomeAssistant instance
+            connections: Callable returning the (connection, cid) pairs to send to
+            max_bytes: Maximum encoded size of the frames held for the display
+            max_in_flight: Maximum encoded size of the frames sent but not drained
+            send: Optional callable sending a frame to a (connection, cid) pair
+
+        """
+        self.hass = hass
+        self._connections = connections
+        self._send = send or _send_frame
+        self._entries = {}
+        self._seq = 0
+        self._retry = None
+        self._lost_revision = None
+        self.size = 0
+        self.superseded = 0
+        self.dropped = 0
+        self.max_bytes = max_bytes
+        self.in_flight = 0
+        self.max_in_flight = max_in_flight
+        self._drained_at = hass.loop.time()
+
+    def __len__(self):
+        """Return the number of queued frames."""
+        return len(self._entries)
+
+    @callback
+    def async_push(self, frame, revision=None):
+        """Queue a frame, replacing an unsent one with the same collapse key.
+
+        Args:
+            frame: CommandFrame to send
+            revision: For frames carrying settings, the revision the client is
+                up to date with if the frame never reaches it
+
+        """
+        priority, collapse_key = classify_command(frame.command)
+        self._seq += 1
+        key = collapse_key or self._seq
+        if (previous := self._entries.pop(key, None)) is not None:
+            self.size -= len(previous[2])
+            self.superseded += 1
+            revision = _min_revision(revision, previous[3])
+        self._entries[key] = (priority, self._seq, frame, revision)
+        self.size += len(frame)
+
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            # Drop the oldest frame of the lowest priority class
+            victim = max(
+                self._entries,
+                key=lambda k: (self._entries[k][0], -self._entries[k][1]),
+            )
+            _, _, dropped, revision = self._entries.pop(victim)
+            self.size -= len(dropped)
+            self.dropped += 1
+            self._lost_revision = _min_revision(self._lost_revision, revision)
+
+    @callback
+    def async_flush(self):
+        """Send queued frames in priority order while connections keep up.
+
+        Returns:
+            int: Number of frames sent
+
+        """
+        connections = self._connections()
+        if not self._entries or not connections:
+            return 0
+
+        self._drain()
+        entries = sorted(self._entries.items(), key=lambda item: item[1][:2])
+        sent = 0
+        for key, (_, _, frame, _) in entries:
+            if self.in_flight and self.in_flight + len(frame) > self.max_in_flight:
+                break
+            for connection, cid in connections:
+                self._send(connection, cid, frame)
+            del self._entries[key]
+            self.size -= len(frame)
+            self.in_flight += len(frame)
+            sent += 1
+
+        if self._entries and self._retry is None:
+            _LOGGER.debug(
+                "Connection backlogged, holding %s frames", len(self._entries)
+            )
+            self._retry = async_call_later(
+                self.hass, FLUSH_RETRY_DELAY, self._async_retry
+            )
+        elif not self._entries and self._retry is not None:
+            self._retry()
+            self._retry = None
+        return sent
+
+    def held_revision(self):
+        """Return the revision the client is up to date with, if frames are missing.
+
+        Returns:
+            int: The lowest revision of the settings frames that are still held
+                or were dropped, or None if all of them were sent
+
+        """
+        revision = self._lost_revision
+        for entry in self._entries.values():
+            revision = _min_revision(revision, entry[3])
+        return revision
+
+    def _drain(self):
+        """Forget the in-flight bytes written since the last flush."""
+        now = self.hass.loop.time()
+        drained = int((now - self._drained_at) * IN_FLIGHT_DRAIN_RATE)
+        self.in_flight = max(self.in_flight - drained, 0)
+        self._drained_at = now
+
+    @callback
+    def async_release(self):
+        """Release the in-flight bytes after the client acknowledged them."""
+        self.in_flight = 0
+        self.async_flush()
+
+    @callback
+    def _async_retry(self, _now):
+        """Retry sending held messages."""
+        self._retry = None
+        self.async_flush()
+
+    @callback
+    def async_take(self):
+        """Remove and return the unsent frames, then clear the queue.
+
+        Returns:
+            list: The unsent frames in the order they were queued
+
+        """
+        frames = [
+            entry[2] for entry in sorted(self._entries.values(), key=lambda e: e[1])
+        ]
+        self.async_clear()
+        return frames
+
+    @callback
+    def async_clear(self):
+        """Drop all queued frames and cancel a pending retry."""
+        self._entries.clear()
+        self._lost_revision = None
+        self.size = 0
+        self.in_flight = 0
+        if self._retry is not None:
+            self._retry()
+            self._retry = None
+
+
+class RecipientBatcher:
+    """Send a frame once per multi-display subscription.
+
+    Frames sent to displays bound to the same subscription during one event
+    loop iteration are combined into a single message with a recipient list,
+    so a gateway driving several displays receives each broadcast once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+        self._pending = {}
+        self._scheduled = False
+
+    @callback
+    def async_send(self, connection, cid, frame, display_id):
+        """Queue a frame for a display bound to a multi-display subscription."""
+        self._pending.setdefault((connection, cid, frame), []).append(display_id)
+        if not self._scheduled:
+            self._scheduled = True
+            self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self):
+        """Send every queued frame with its recipients."""
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        for (connection, cid, frame), recipients in pending.items():
+            connection.send_message(frame.message(cid, recipients))
+
+
+@callback
+def async_get_recipient_batcher(hass: HomeAssistant):
+    """Return the recipient batcher shared by every display."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (batcher := data.get(DATA_GATEWAYS)) is None:
+        batcher = data[DATA_GATEWAYS] = RecipientBatcher(hass)
+    return batcher
+
+
+class PendingCommands:
+    """Commands held for a display while it has no connection.
+
+    Like the outbound queue, a newer command replaces a held one with the same
+    collapse key, so only the latest navigation is kept and refreshes are
+    deduplicated. Commands expire after the TTL of their class, and the oldest
+    ones are dropped when more than MAX_PENDING_COMMANDS are held.
+    """
+
+    def __init__(self, hass: HomeAssistant, ttls=PENDING_TTLS) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self._ttls = ttls
+        self._entries = {}
+        self._seq = 0
+        self.delivered = 0
+        self.expired = 0
+        self.superseded = 0
+        self.dropped = 0
+
+    def __len__(self):
+        """Return the number of held commands."""
+        return len(self._entries)
+
+    @callback
+    def async_push(self, frame):
+        """Hold a frame until the display connects again."""
+        _, collapse_key = classify_command(frame.command)
+        self._seq += 1
+        key = collapse_key or self._seq
+        if self._entries.pop(key, None) is not None:
+            self.superseded += 1
+        ttl = self._ttls.get(collapse_key, DEFAULT_PENDING_TTL)
+        self._entries[key] = (self.hass.loop.time() + ttl, frame)
+
+        while len(self._entries) > MAX_PENDING_COMMANDS:
+            del self._entries[next(iter(self._entries))]
+            self.dropped += 1
+
+    @callback
+    def async_expire(self):
+        """Drop held commands whose TTL has passed."""
+        now = self.hass.loop.time()
+        for key in [k for k, (deadline, _) in self._entries.items() if deadline <= now]:
+            del self._entries[key]
+            self.expired += 1
+
+    @callback
+    def async_take_frames(self):
+        """Remove and return the frames still due for delivery.
+
+        Returns:
+            list: The held frames in the order they were sent
+
+        """
+        self.async_expire()
+        frames = [frame for _, frame in self._entries.values()]
+        self._entries.clear()
+        self.delivered += len(frames)
+        return frames
+
+    @callback
+    def async_take(self):
+        """Remove and return the commands still due for delivery.
+
+        Returns:
+            list: The held commands in the order they were sent
+
+        """
+        return [
+            {"command": frame.command, **frame.payload}
+            for frame in self.async_take_frames()
+        ]
+
+    def as_dict(self):
+        """Return the store's counters for diagnostics."""
+        return {
+            "pending": len(self._entries),
+            "delivered": self.delivered,
+            "expired": self.expired,
+            "superseded": self.superseded,
+            "dropped": self.dropped,
+        }
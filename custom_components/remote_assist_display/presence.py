@@ -0,0 +1,162 @@
+"""Presence-driven wake for Remote Assist Display."""
+
+from datetime import timedelta
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_DISPLAYS, DATA_PRESENCE, DATA_SCHEDULER, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+PRESENCE_LINK_SCHEMA = vol.Schema(
+    {
+        vol.Required("display_id"): cv.string,
+        vol.Required("entities"): vol.All(cv.ensure_list, vol.Length(min=1), [cv.entity_id]),
+        vol.Optional("idle_timeout", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional("dim_brightness", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=255)
+        ),
+    }
+)
+
+PRESENCE_LINKS_SCHEMA = vol.All(cv.ensure_list, [PRESENCE_LINK_SCHEMA])
+
+
+class PresenceIndex:
+    """Wake displays when their linked motion or occupancy entities turn on.
+
+    Linked entities are indexed by entity id, and a single state change
+    listener covers all of them, so a presence change reaches its displays
+    with one dictionary lookup. The wake frame is sent straight from the
+    state change callback. Dimming after an idle timeout is put on the
+    shared scheduler's timer wheel.
+    """
+
+    def __init__(self, hass: HomeAssistant, links=()) -> None:
+        """Initialize the index.
+
+        Raises:
+            vol.Invalid: If the links are invalid
+
+        """
+        self.hass = hass
+        self._links = {}
+        self._by_entity = {}
+        self._dims = {}
+        self._unsub = None
+        for link in PRESENCE_LINKS_SCHEMA(list(links)):
+            self._links[link["display_id"]] = link
+            for entity_id in link["entities"]:
+                self._by_entity.setdefault(entity_id, []).append(link["display_id"])
+
+    def __bool__(self):
+        """Return True if any display is linked."""
+        return bool(self._links)
+
+    @callback
+    def async_start(self):
+        """Listen for state changes of every linked entity."""
+        if self._by_entity:
+            self._unsub = async_track_state_change_event(
+                self.hass, list(self._by_entity), self._async_state_changed
+            )
+
+    @callback
+    def async_stop(self):
+        """Stop listening and drop the pending dims."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        for display_id in list(self._dims):
+            self._cancel_dim(display_id)
+
+    def _present(self, link):
+        """Return True if any entity linked to a display reports presence."""
+        for entity_id in link["entities"]:
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.state == STATE_ON:
+                return True
+        return False
+
+    @callback
+    def _cancel_dim(self, display_id):
+        """Cancel the pending dim of a display."""
+        schedule_id = self._dims.pop(display_id, None)
+        scheduler = self.hass.data[DOMAIN].get(DATA_SCHEDULER)
+        if schedule_id is not None and scheduler is not None:
+            scheduler.async_cancel(schedule_id)
+
+    @callback
+    def _async_state_changed(self, event: Event):
+        """Wake or start the idle timer of the displays linked to an entity."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        present = new_state is not None and new_state.state == STATE_ON
+        if present and old_state is not None and old_state.state == STATE_ON:
+            # Attribute updates of an entity that is already on are not presence
+            return
+        displays = self.hass.data[DOMAIN][DATA_DISPLAYS]
+        for display_id in self._by_entity.get(event.data["entity_id"], ()):
+            display = displays.get(display_id)
+            if display is None:
+                continue
+            link = self._links[display_id]
+
+            if present:
+                self._cancel_dim(display_id)
+                _LOGGER.debug("Presence detected, waking display %s", display_id)
+                display.wake()
+                continue
+
+            scheduler = self.hass.data[DOMAIN].get(DATA_SCHEDULER)
+            if (
+                not link["idle_timeout"]
+                or scheduler is None
+                or display_id in self._dims
+                or self._present(link)
+            ):
+                continue
+            self._dims[display_id] = scheduler.async_add_transient(
+                {
+                    "command": "settings",
+                    "display_id": [display_id],
+                    # The client expects brightness between 0.0 and 1.0
+                    "settings": {"brightness": link["dim_brightness"] / 255.0},
+                },
+                dt_util.utcnow() + timedelta(seconds=link["idle_timeout"]),
+            )
+
+
+@callback
+def async_load_presence(hass: HomeAssistant, links):
+    """Index the configured presence links and start listening.
+
+    Returns:
+        PresenceIndex: The active index, empty if the links are invalid
+
+    """
+    async_unload_presence(hass)
+    try:
+        index = PresenceIndex(hass, links or ())
+    except vol.Invalid as err:
+        _LOGGER.error("Invalid presence links, presence wake is disabled: %s", err)
+        index = PresenceIndex(hass)
+    index.async_start()
+    hass.data[DOMAIN][DATA_PRESENCE] = index
+    return index
+
+
+@callback
+def async_unload_presence(hass: HomeAssistant):
+    """Stop the active presence index."""
+    if (index := hass.data[DOMAIN].pop(DATA_PRESENCE, None)) is not None:
+        index.async_stop()
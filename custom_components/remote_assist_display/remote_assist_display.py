@@ -1,15 +1,55 @@
 """Remote Assist Display Class."""
 
+import asyncio
+from collections import deque
+from datetime import timedelta
+import fnmatch
 import logging
+import secrets
 
 from homeassistant.components.websocket_api import event_message
+from homeassistant.const import ENTITY_MATCH_ALL
 from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers import device_registry, entity_registry
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from packaging.version import parse as parse_version
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry, entity_registry, restore_state
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+from packaging.version import InvalidVersion, parse as parse_version
 
-from .const import DATA_ADDERS, DATA_CONFIG_ENTRY, DATA_DISPLAYS, DOMAIN, MIN_VERSION_BACKLIGHT
+from .const import (
+    BACKLIGHT_WS_COMMAND,
+    DATA_ADDERS,
+    DATA_CONFIG_ENTRY,
+    DATA_DISPLAYS,
+    DATA_ROUTES,
+    DATA_UNLOADING,
+    DEFAULT_IDLE_DISPLAY_TTL,
+    DEFAULT_MAX_DISPLAYS,
+    DOMAIN,
+    INTENT_WS_COMMAND,
+    MIN_VERSION_BACKLIGHT,
+    MIN_VERSION_CONNECT_FRAME,
+    MIN_VERSION_WAKE,
+    NAVIGATE_URL_WS_COMMAND,
+    NAVIGATE_WS_COMMAND,
+    NAVIGATION_HISTORY_SIZE,
+    PIPELINE_WS_COMMAND,
+    UPDATE_SETTINGS_WS_COMMAND,
+    WAKE_WS_COMMAND,
+)
+from .dispatcher import DisplayDispatcher
+from .fleet import FLEET_DATA_KEYS, async_get_fleet_status
+from .intent_listener import async_get_intent_listener
+from .last_seen import async_get_last_seen
 from .light import RADBacklightLight
+from .outbound import (
+    CommandFrame,
+    OutboundQueue,
+    PendingCommands,
+    async_get_recipient_batcher,
+)
+from .presence import async_load_presence
+from .routing import async_load_routes
 from .select import RADAssistSatelliteSelect
 from .sensor import RADIntentSensor, RADSensor
 from .switch import RADHideHeaderSwitch, RADHideSidebarSwitch
@@ -17,20 +57,41 @@ from .text import DefaultDashboardText, DeviceStorageKeyText
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options that entities fall back on, mapped to the data key the entity
+# listens on and the name of the entity
+OPTION_FALLBACKS = {
+    "default_dashboard_path": ("default_dashboard", "default_dashboard"),
+    "device_name_storage_key": ("device_name_storage_key", "device_storage_key"),
+    "hide_header": ("hide_header", "hide_header"),
+    "hide_sidebar": ("hide_sidebar", "hide_sidebar"),
+}
 
-class Coordinator(DataUpdateCoordinator):
-    """Coordinator class to handle Remote Assist Display data updates."""
+# Commands whose frames carry settings changes
+SETTINGS_COMMANDS = (UPDATE_SETTINGS_WS_COMMAND, BACKLIGHT_WS_COMMAND, WAKE_WS_COMMAND)
 
-    def __init__(self, hass: HomeAssistant, display_id: str) -> None:
-        """Initialize the Remote Assist Display Coordinator.
 
-        Args:
-            hass: HomeAssistant instance.
-            display_id: Identifier for the display.
+def compact_intent(result):
+    """Return the parts of an intent result a display renders.
+
+    Args:
+        result: The conversation result from the intent event
+
+    Returns:
+        dict: The speech, card, response type and target entity ids
+
+    """
+    response = result.get("response") or {}
+    data = response.get("data") or {}
+    return {
+        "speech": ((response.get("speech") or {}).get("plain") or {}).get("speech"),
+        "card": response.get("card") or None,
+        "response_type": response.get("response_type"),
+        "targets": [t.get("id") for t in data.get("targets", []) if t.get("id")],
+    }
 
-        """
-        super().__init__(hass, _LOGGER, name="Remote Assist Display Coordinator")
-        self.display_id = display_id
+
+class DisplayLimitError(HomeAssistantError):
+    """Error raised when no more displays can be loaded."""
 
 
 class RemoteAssistDisplay:
@@ -46,79 +107,236 @@ class RemoteAssistDisplay:
     ) -> None:
         """Initialize the Remote Assist Display device."""
         self.display_id = display_id
-        self.coordinator = Coordinator(hass, display_id)
+        self.coordinator = DisplayDispatcher(hass, display_id)
         self.entities = {}
         self.data = {}
         self.settings = {}
         self._connections = []
-        self._event_type = hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get(
-            "event_type", None
+        self._gateways = set()
+        self.outbound = OutboundQueue(
+            hass, lambda: self._connections, send=self._send_to
         )
-        self._event_listener = None
+        self.pending = PendingCommands(hass)
+        self.history = deque(maxlen=NAVIGATION_HISTORY_SIZE)
+        self.session_token = secrets.token_urlsafe(16)
+        self.revision = 0
+        self.acked_revision = 0
+        self._queued_revision = 0
+        self._fade = None
+        self._revisions = {"settings": {}, "data": {}}
+        self.last_activity = dt_util.utcnow()
+        self._pipeline_listener = None
 
-        if self._event_type:
-            self._set_event_listener()
+        fleet = async_get_fleet_status(hass)
+        self.coordinator.async_add_listener(
+            lambda: fleet.async_mark_dirty(display_id), FLEET_DATA_KEYS
+        )
 
         self.update_entities(hass)
 
-    def _set_event_listener(self):
-        """Set the event listener for the Remote Assist Display device."""
+    def handle_intent_event(self, event_data):
+        """Handle an intent event from the display's assist satellite."""
+        if "intent_sensor" not in self.entities:
+            return
 
-        @callback
-        def handle_event(event: Event):
-            """Handle the event."""
-            if "intent_sensor" not in self.entities:
-                return
+        _LOGGER.debug(
+            "Updating intent sensor for display %s with event data: %s",
+            self.display_id,
+            event_data,
+        )
+        self.entities.get("intent_sensor").update_from_event(
+            event_data["result"], event_data["device_id"]
+        )
+        # Also push the result straight to the display, so it does not
+        # have to wait for the sensor's state change to reach it
+        self.send_frame(
+            CommandFrame(INTENT_WS_COMMAND, **compact_intent(event_data["result"]))
+        )
+        self._route_intent(event_data)
 
-            event_data = event.data
-
-            # Update the intent sensor for this device if the event came from its corresponding assist satellite
-            if (
-                event_data.get("device_id")
-                == self.entities.get("assist_satellite").satellite_id
-            ):
-                _LOGGER.debug(
-                    "Updating intent sensor for display %s with event data: %s",
-                    self.display_id,
-                    event_data,
-                )
-                self.entities.get("intent_sensor").update_from_event(
-                    event_data["result"], event_data["device_id"]
-                )
-            else:
-                _LOGGER.debug(
-                    "Event from assist satellite %s does not match display %s",
-                    event_data.get("device_id"),
-                    self.entities.get("assist_satellite").satellite_id,
-                )
+    def _bump(self, section, keys):
+        """Record that keys of settings or data changed in a new revision."""
+        if not keys:
+            return
+        self.revision += 1
+        revisions = self._revisions[section]
+        for key in keys:
+            revisions[key] = self.revision
 
-        # Remove any existing event listener
-        if self._event_listener:
-            self._event_listener()
+    def _route_intent(self, event_data):
+        """Navigate the display if the intent matches a configured route."""
+        routes = self.coordinator.hass.data[DOMAIN].get(DATA_ROUTES)
+        if not routes:
+            return
+        intent = event_data.get("intent") or event_data["result"].get("intent")
+        if isinstance(intent, dict):
+            intent = intent.get("name")
+        if not intent:
+            return
 
-        # Set a new event listener
-        _LOGGER.debug(
-            "Setting event listener for display %s with event type %s",
-            self.display_id,
-            self._event_type,
+        path = routes.match(
+            intent, event_data.get("slots") or {}, self.display_id, self._area_id
+        )
+        if path is not None:
+            _LOGGER.debug("Routing intent %s on %s to %s", intent, self.display_id, path)
+            self.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path=path))
+
+    def _area_id(self):
+        """Return the area of the display's device."""
+        dr = device_registry.async_get(self.coordinator.hass)
+        device = dr.async_get_device({(DOMAIN, self.display_id)})
+        return device and device.area_id
+
+    def satellite_changed(self):
+        """Follow the intents and pipeline progress of the linked satellite.
+
+        The display is linked to its satellite's device in the shared intent
+        listener. The assist satellite entity's state reflects the stage of
+        its running pipeline, so each change is pushed to the display as a
+        status frame.
+        """
+        hass = self.coordinator.hass
+        satellite = self.entities.get("assist_satellite")
+        async_get_intent_listener(hass).async_link(
+            self, satellite and satellite.satellite_id
         )
-        self._event_listener = self.coordinator.hass.bus.async_listen(  # Changed from coordinator.hass to self.hass
-            self._event_type, handle_event
+
+        if self._pipeline_listener:
+            self._pipeline_listener()
+            self._pipeline_listener = None
+
+        if not hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get("pipeline_status"):
+            return
+        entity_id = satellite and satellite.current_option
+        if not entity_id:
+            return
+
+        @callback
+        def handle_state_change(event: Event):
+            """Send the new pipeline stage to the display."""
+            if (new_state := event.data["new_state"]) is None:
+                return
+            self.send_frame(CommandFrame(PIPELINE_WS_COMMAND, stage=new_state.state))
+
+        self._pipeline_listener = async_track_state_change_event(
+            hass, [entity_id], handle_state_change
         )
 
+    def apply_option_defaults(self, hass, keys):
+        """Refresh entities that fall back on changed options.
+
+        Only the entities listening on the given data keys are written. The
+        client is sent the keys whose effective value now differs from the
+        settings it has, in a single settings frame.
+
+        Args:
+            hass: HomeAssistant instance
+            keys: Data keys whose option fallback changed
+
+        """
+        self.coordinator.async_set_updated_data(self.data, keys)
+
+        patch = {}
+        for key, entity_name in OPTION_FALLBACKS.values():
+            entity = self.entities.get(entity_name)
+            if key not in keys or entity is None:
+                continue
+            value = entity.effective_value()
+            if self.settings.get(key) != value:
+                patch[key] = value
+        if not patch:
+            return
+
+        self.settings.update(patch)
+        self.settings["display"] = {**self.settings.get("display", {}), **patch}
+        self._bump("settings", (*patch, "display"))
+        hass.create_task(self.send(UPDATE_SETTINGS_WS_COMMAND, settings=self.settings))
+
     def update(self, hass, new_data):
         """Update the Remote Assist Display device."""
+        self._bump(
+            "data",
+            [k for k, v in new_data.items() if k not in self.data or self.data[k] != v],
+        )
         self.data.update(new_data)
         self.update_entities(hass)
-        self.coordinator.async_set_updated_data(self.data)
+        self.coordinator.async_set_updated_data(self.data, new_data.keys())
 
     def update_settings(self, hass, settings):
         """Update the settings for the Remote Assist Display device."""
+        settings = self._without_curve(settings)
         self.settings.update(settings)
-        self.update_entities(hass)
-        hass.create_task(
-            self.send("remote_assist_display/update_settings", settings=self.settings)
-        )
+        self._bump("settings", settings.keys())
+        if "brightness_curve" in settings:
+            self.update(hass, {"brightness_curve": settings["brightness_curve"]})
+        else:
+            self.update_entities(hass)
+        hass.create_task(self.send(UPDATE_SETTINGS_WS_COMMAND, settings=self.settings))
+
+    def apply_settings(self, hass, patch):
+        """Apply a settings patch to the display in a single pass.
+
+        The patch is merged into both the settings sent to the client and the
+        data the entities read from, so every affected entity is written by one
+        coordinator update and the client receives a single settings frame.
+        """
+        settings = self._without_curve(patch)
+        display_settings = {k: v for k, v in patch.items() if k != "brightness"}
+        if display_settings:
+            settings["display"] = {
+                **self.settings.get("display", {}),
+                **display_settings,
+            }
+        self.settings.update(settings)
+        self._bump("settings", settings.keys())
+        self.update(hass, {k: v for k, v in settings.items() if k != "display"})
+        hass.create_task(self.send(UPDATE_SETTINGS_WS_COMMAND, settings=self.settings))
+
+    def set_playlist(self, hass, playlist):
+        """Start a dashboard playlist on the display, or stop it with None.
+
+        The playlist is pushed once as part of the settings and the client
+        rotates through it locally, reporting its position back as the
+        playlist_position data key.
+        """
+        self.settings["playlist"] = playlist
+        self._bump("settings", ["playlist"])
+        self.update(hass, {"playlist_position": 0 if playlist else None})
+        hass.create_task(self.send(UPDATE_SETTINGS_WS_COMMAND, settings=self.settings))
+
+    def _without_curve(self, settings):
+        """Return a copy of the settings, dropping the curve if they set the brightness.
+
+        An active brightness curve overrides the brightness, so setting the
+        brightness directly, by any means, stops following the curve.
+        """
+        settings = dict(settings)
+        if "brightness" in settings and (
+            self.settings.get("brightness_curve") or self.data.get("brightness_curve")
+        ):
+            settings["brightness_curve"] = None
+        return settings
+
+    def set_brightness_curve(self, hass, curve):
+        """Push a brightness curve for the client to follow on its own."""
+        self.settings["brightness_curve"] = curve
+        self._bump("settings", ["brightness_curve"])
+        self.update(hass, {"brightness_curve": curve})
+        hass.create_task(self.send(UPDATE_SETTINGS_WS_COMMAND, settings=self.settings))
+
+    @property
+    def playlist(self):
+        """Return the active playlist and the client's position in it."""
+        playlist = self.settings.get("playlist")
+        if not playlist:
+            return None
+        position = self.data.get("playlist_position") or 0
+        items = playlist["items"]
+        return {
+            "playlist_id": playlist["playlist_id"],
+            "position": position,
+            "path": items[position % len(items)]["path"],
+        }
 
     def update_entities(self, hass):
         """Create or update entities for this device."""
@@ -214,66 +432,658 @@ class RemoteAssistDisplay:
     @callback
     async def send(self, command, **kwargs):
         """Send a command to the Remote Assist Display device."""
-        if self.connection is None:
+        self.send_frame(CommandFrame(command, **kwargs))
+
+    @callback
+    def send_frame(self, frame):
+        """Send a pre-encoded command frame to the Remote Assist Display device."""
+        if frame.command == NAVIGATE_WS_COMMAND:
+            self._record_navigation(frame.payload["path"])
+        elif frame.command == NAVIGATE_URL_WS_COMMAND:
+            self._record_navigation(frame.payload["url"])
+
+        if not self.connection:
+            self._hold(frame)
             return
 
-        for connection, cid in self.connection:
-            connection.send_message(event_message(cid, {"command": command, **kwargs}))
+        revision = None
+        if frame.command in SETTINGS_COMMANDS:
+            # Everything up to the previous settings frame is covered by the
+            # frames before this one
+            revision, self._queued_revision = self._queued_revision, self.revision
+        self.outbound.async_push(frame, revision)
+        self.outbound.async_flush()
+
+    @callback
+    def _hold(self, frame):
+        """Hold a frame until the display connects again, if it is still useful then."""
+        # Settings are resent in full or as a delta when the client
+        # connects, and pipeline progress and wakes are stale by then
+        if frame.command not in (
+            UPDATE_SETTINGS_WS_COMMAND,
+            PIPELINE_WS_COMMAND,
+            WAKE_WS_COMMAND,
+        ):
+            self.pending.async_push(frame)
+
+    @callback
+    def _send_to(self, connection, cid, frame):
+        """Send a frame the outbound queue released to one connection.
+
+        Frames for a gateway subscription go through the recipient batcher,
+        so a gateway receives a frame sent to several of its displays once.
+        """
+        if (connection, cid) in self._gateways:
+            async_get_recipient_batcher(self.coordinator.hass).async_send(
+                connection, cid, frame, self.display_id
+            )
+        else:
+            connection.send_message(frame.message(cid))
+
+    def _record_navigation(self, target):
+        """Record a navigation target in the display's recent history."""
+        if not self.history or self.history[-1] != target:
+            self.history.append(target)
+
+    def prefetch_hints(self, history_size):
+        """Return the paths the display is likely to show next.
+
+        Args:
+            history_size: Number of recent navigation targets to include
+
+        Returns:
+            list: The default dashboard followed by the most recent targets
+
+        """
+        hints = []
+        default_dashboard = self.entities.get("default_dashboard")
+        if default_dashboard and default_dashboard.native_value:
+            hints.append(default_dashboard.native_value)
+
+        recent = []
+        for target in reversed(self.history):
+            if len(recent) == history_size:
+                break
+            if target not in hints and target not in recent:
+                recent.append(target)
+        return hints + recent
 
     def delete(self, hass):
-        """Delete this device."""
+        """Delete this device.
+
+        Returns:
+            asyncio.Task: The task removing the entities from Home Assistant
+
+        """
         dr = device_registry.async_get(hass)
         er = entity_registry.async_get(hass)
 
         for e in self.entities.values():
-            er.async_remove(e.entity_id)
-
-        self.entities = {}
+            # Entries may already have been removed by the user
+            if e.entity_id and er.async_get(e.entity_id) is not None:
+                er.async_remove(e.entity_id)
 
         device = dr.async_get_device({(DOMAIN, self.display_id)})
-        dr.async_remove_device(device.id)
+        if device is not None:
+            dr.async_remove_device(device.id)
+        async_get_last_seen(hass).async_forget(self.display_id)
+
+        return self.unload(hass)
+
+    def unload(self, hass):
+        """Unload this device from memory, keeping its registry entries.
+
+        Returns:
+            asyncio.Task: The task removing the entities from Home Assistant
+
+        """
+        entities = [e for e in self.entities.values() if e.hass is not None]
+        self.release()
+        return hass.async_create_task(_async_remove_entities(entities))
+
+    def release(self):
+        """Drop the entities, queued commands and listener held in memory."""
+        self.entities = {}
+        self.outbound.async_clear()
+        self.satellite_changed()
 
     @property
     def connection(self):
         return self._connections
 
-    def open_connection(self, hass, connection, cid):
-        """Open a connection to the Remote Assist Display device."""
+    def acknowledge(self, revision):
+        """Record the latest revision the client has applied.
+
+        The acknowledgement also shows the client has read what was sent, so
+        frames held behind the in-flight limit are released. A backlight fade
+        is only reflected in the display's data once the client acknowledges
+        the revision it was sent with, unless a newer brightness replaced it in
+        the meantime.
+        """
+        self.acked_revision = max(self.acked_revision, min(revision, self.revision))
+        self.outbound.async_release()
+        if self._fade is None or self.acked_revision < self._fade[0]:
+            return
+        fade_revision, brightness = self._fade
+        self._fade = None
+        if self._revisions["settings"].get("brightness") == fade_revision:
+            self.update(self.coordinator.hass, {"brightness": brightness})
+
+    @callback
+    def wake(self):
+        """Turn the backlight on from a presence change, without a round trip.
+
+        Waking a disconnected display is pointless, so the frame is not held
+        for it. The brightness setting is still recorded for its next connect,
+        and the data shows full brightness like turning the backlight on does.
+        Clients older than MIN_VERSION_WAKE are sent their settings instead,
+        like turning the backlight on without a transition.
+        """
+        settings = self._without_curve({"brightness": "on"})
+        self.settings.update(settings)
+        self._bump("settings", settings.keys())
+        self._fade = None
+        self.update(self.coordinator.hass, {**settings, "brightness": 1.0})
+        if not self.supports(MIN_VERSION_WAKE):
+            self.send_frame(CommandFrame(UPDATE_SETTINGS_WS_COMMAND, settings=self.settings))
+            return
+        self.send_frame(
+            CommandFrame(WAKE_WS_COMMAND, settings=settings, revision=self.revision)
+        )
+
+    def fade_backlight(self, hass, brightness, transition, **settings):
+        """Fade the backlight to a brightness on the client in a single frame.
+
+        Args:
+            hass: HomeAssistant instance
+            brightness: Target brightness between 0.0 and 1.0, or "on" or
+                "off" for the client to resolve like an instant change
+            transition: Seconds the client takes to reach the target
+            settings: Other settings changed along with the brightness
+
+        """
+        settings["brightness"] = brightness
+        settings = self._without_curve(settings)
+        if "brightness_curve" in settings:
+            self.update(hass, {"brightness_curve": settings["brightness_curve"]})
+        self.settings.update(settings)
+        self._bump("settings", settings.keys())
+        # Like turn_on and turn_off, "on" and "off" show as full and no brightness
+        self._fade = (self.revision, {"on": 1.0, "off": 0.0}.get(brightness, brightness))
+        self.send_frame(
+            CommandFrame(
+                BACKLIGHT_WS_COMMAND,
+                settings=settings,
+                transition=transition,
+                revision=self.revision,
+            )
+        )
+
+    @property
+    def delivered_revision(self):
+        """Return the latest revision the client has received every setting of.
+
+        Settings frames that are still held in the outbound queue, or were
+        dropped from it, are not counted, so a client resuming from this
+        revision still gets their settings. Changes waiting to be sent are
+        not counted either, unless the client has acknowledged them.
+        """
+        revision = self._queued_revision
+        if (held := self.outbound.held_revision()) is not None:
+            revision = min(revision, held)
+        return max(revision, self.acked_revision)
+
+    def changes_since(self, revision):
+        """Return the settings and data changed after a revision.
+
+        Args:
+            revision: Revision the client last received
+
+        Returns:
+            tuple: (settings, data) holding only the keys changed since then
+
+        """
+        return tuple(
+            {
+                key: values[key]
+                for key, rev in self._revisions[section].items()
+                if rev > revision and key in values
+            }
+            for section, values in (("settings", self.settings), ("data", self.data))
+        )
+
+    def supports(self, minimum_version, client_version=None):
+        """Return True if the display's client is at least a version.
+
+        Args:
+            minimum_version: Version the client must run
+            client_version: Version reported by the client, if newer than the
+                one recorded in the display's data
+
+        """
+        client_version = client_version or self.data.get("client_version")
+        try:
+            return bool(client_version) and parse_version(
+                client_version
+            ) >= parse_version(minimum_version)
+        except InvalidVersion:
+            return False
+
+    def connect(
+        self,
+        hass,
+        connection,
+        cid,
+        last_seen,
+        session=None,
+        revision=None,
+        gateway=False,
+        client_version=None,
+    ):
+        """Handle a client connecting in a single pass.
+
+        Records last_seen, registers the connection and marks the display as
+        connected with one entity update, then sends the client a single
+        frame holding both its settings and its data. A client resuming with
+        the current session token and a revision it received before only
+        gets the settings and data that changed since that revision.
+
+        Clients older than MIN_VERSION_CONNECT_FRAME expect the settings and
+        the data in two separate frames, followed by each held command on its
+        own.
+
+        A gateway subscription is shared by several displays, so every
+        message sent on it names the displays it is addressed to.
+        """
+        self.settings["last_seen"] = last_seen
+        self._bump("settings", ("last_seen",))
+        async_get_last_seen(hass).async_touch(self.display_id)
         self._connections.append((connection, cid))
-        self.update(hass, {"connected": True})
+        if gateway:
+            self._gateways.add((connection, cid))
+        if not self.data.get("connected"):
+            self._bump("data", ("connected",))
+        self.data["connected"] = True
+        self.update_entities(hass)
+        self.coordinator.async_set_updated_data(self.data, ("connected",))
+        # Both handshakes below send every setting up to this revision
+        self._queued_revision = self.revision
+
+        if not gateway and not self.supports(MIN_VERSION_CONNECT_FRAME, client_version):
+            connection.send_message(
+                CommandFrame(UPDATE_SETTINGS_WS_COMMAND, settings=self.settings).message(
+                    cid
+                )
+            )
+            connection.send_message(event_message(cid, {"result": self.data}))
+            # Older clients do not know the commands envelope, so each held
+            # command is replayed as it was originally sent
+            for frame in self.pending.async_take_frames():
+                connection.send_message(frame.message(cid))
+            return
+
+        resumed = (
+            session == self.session_token
+            and revision is not None
+            and 0 <= revision <= self.revision
+        )
+        if resumed:
+            settings, data = self.changes_since(revision)
+        else:
+            settings, data = self.settings, self.data
+
+        frame = CommandFrame(
+            UPDATE_SETTINGS_WS_COMMAND,
+            settings=settings,
+            result=data,
+            session=self.session_token,
+            revision=self.revision,
+            resumed=resumed,
+        )
+        if commands := self.pending.async_take():
+            frame.payload["commands"] = commands
+        connection.send_message(
+            frame.message(cid, [self.display_id] if gateway else None)
+        )
 
     def close_connection(self, hass, connection):
         """Close a connection to the Remote Assist Display device."""
         self._connections = list(
             filter(lambda v: v[0] != connection, self._connections)
         )
+        self._gateways = {g for g in self._gateways if g[0] != connection}
+        if not self._connections:
+            # Frames that could not be sent in time are held like any other
+            # command sent while the display is disconnected
+            for frame in self.outbound.async_take():
+                self._hold(frame)
+        self.last_activity = dt_util.utcnow()
+        async_get_last_seen(hass).async_touch(self.display_id, self.last_activity)
         self.update(hass, {"connected": False})
 
 
+async def _async_remove_entities(entities):
+    """Remove entities from Home Assistant."""
+    await asyncio.gather(*(e.async_remove(force_remove=True) for e in entities))
+
+
+def _track_removal(hass, display_id, task):
+    """Remember the removal of a display's entities until it is finished."""
+    unloading = hass.data[DOMAIN].setdefault(DATA_UNLOADING, {})
+    unloading[display_id] = task
+
+    def _removed(_task):
+        if unloading.get(display_id) is task:
+            del unloading[display_id]
+
+    task.add_done_callback(_removed)
+
+
+async def async_get_or_register_display(hass, display_id):
+    """Get or create a display once an evicted instance has been removed.
+
+    The entities of an evicted or deleted display are removed in a task, and
+    a display registered again before that finishes would add entities with
+    the same unique ids.
+    """
+    if task := hass.data[DOMAIN].get(DATA_UNLOADING, {}).get(display_id):
+        await task
+    return get_or_register_display(hass, display_id)
+
+
 def get_or_register_display(hass, display_id):
-    """Get or create a Remote Assist Display device."""
+    """Get or create a Remote Assist Display device.
+
+    When the configured maximum number of displays is loaded, the least
+    recently active disconnected display is evicted to make room.
+
+    Raises:
+        DisplayLimitError: If the limit is reached and every display is connected
+
+    """
     displays = hass.data[DOMAIN][DATA_DISPLAYS]
     if display_id in displays:
-        return displays[display_id]
+        display = displays[display_id]
+        display.last_activity = dt_util.utcnow()
+        return display
+
+    options = hass.data[DOMAIN][DATA_CONFIG_ENTRY].options
+    max_displays = options.get("max_displays", DEFAULT_MAX_DISPLAYS)
+    if max_displays and len(displays) >= max_displays:
+        idle = [d for d in displays.values() if not d.connection]
+        if not idle:
+            raise DisplayLimitError(
+                f"Cannot register display {display_id}, {max_displays} displays are connected"
+            )
+        evict_display(
+            hass,
+            min(idle, key=lambda d: d.last_activity).display_id,
+            purge=options.get("purge_idle_displays", False),
+        )
 
     displays[display_id] = RemoteAssistDisplay(hass, display_id)
+    async_get_fleet_status(hass).async_mark_dirty(display_id)
     return displays[display_id]
 
 
+def evict_display(hass, display_id, purge=False):
+    """Remove a display from memory, and optionally from the registries."""
+    display = hass.data[DOMAIN][DATA_DISPLAYS].pop(display_id, None)
+    if display is None:
+        return None
+
+    _LOGGER.debug("Evicting display %s (purge: %s)", display_id, purge)
+    async_get_fleet_status(hass).async_mark_dirty(display_id)
+    if purge:
+        _track_removal(hass, display_id, display.delete(hass))
+    else:
+        _track_removal(hass, display_id, display.unload(hass))
+    return display
+
+
+def evict_idle_displays(hass):
+    """Evict disconnected displays that have been idle for longer than the TTL.
+
+    Returns:
+        list: The ids of the evicted displays
+
+    """
+    options = hass.data[DOMAIN][DATA_CONFIG_ENTRY].options
+    ttl = options.get("idle_display_ttl", DEFAULT_IDLE_DISPLAY_TTL)
+    if not ttl:
+        return []
+
+    cutoff = dt_util.utcnow() - timedelta(hours=ttl)
+    idle = [
+        display_id
+        for display_id, display in hass.data[DOMAIN][DATA_DISPLAYS].items()
+        if not display.connection and display.last_activity < cutoff
+    ]
+    for display_id in idle:
+        evict_display(hass, display_id, purge=options.get("purge_idle_displays", False))
+    return idle
+
+
+def apply_option_changes(hass, previous, options):
+    """Propagate changed config entry options to the displays they affect.
+
+    Args:
+        hass: HomeAssistant instance
+        previous: Options before the change
+        options: Options after the change
+
+    Returns:
+        set: Names of the options that changed
+
+    """
+    changed = {
+        key
+        for key in previous.keys() | options.keys()
+        if previous.get(key) != options.get(key)
+    }
+    displays = hass.data[DOMAIN][DATA_DISPLAYS].values()
+
+    if "event_type" in changed:
+        async_get_intent_listener(hass).async_set_event_type(options.get("event_type"))
+
+    if "intent_routes" in changed:
+        async_load_routes(hass, options.get("intent_routes"))
+
+    if "presence" in changed:
+        async_load_presence(hass, options.get("presence"))
+
+    if "pipeline_status" in changed:
+        for display in displays:
+            display.satellite_changed()
+
+    keys = {OPTION_FALLBACKS[k][0] for k in changed if k in OPTION_FALLBACKS}
+    if keys:
+        for display in displays:
+            display.apply_option_defaults(hass, keys)
+
+    return changed
+
+
 def delete_display(hass, display_id):
     """Delete a Remote Assist Display device."""
-    display = get_or_register_display(hass, display_id)
+    display = hass.data[DOMAIN][DATA_DISPLAYS].pop(display_id, None)
     if display:
-        display.delete(hass)
-        del hass.data[DOMAIN][DATA_DISPLAYS][display_id]
+        _track_removal(hass, display_id, display.delete(hass))
+        async_get_fleet_status(hass).async_mark_dirty(display_id)
     return display
 
 
+def _display_last_seen(hass, display_id, display, device):
+    """Return when a display was last seen, at the latest.
+
+    A display without a recorded time has not connected since the last seen
+    store started keeping times, which covers every device registered before
+    it existed. Such a display was last seen when its entities were last
+    alive, if Home Assistant still remembers that, and before the store
+    started at the latest.
+    """
+    last_seen = async_get_last_seen(hass)
+    seen = [last_seen.get(display_id)]
+    if display is not None:
+        seen.append(display.last_activity)
+        seen.append(dt_util.parse_datetime(display.settings.get("last_seen") or ""))
+    if known := max((_as_utc(t) for t in seen if t), default=None):
+        return known
+
+    last_states = restore_state.async_get(hass).last_states
+    alive = [
+        stored.last_seen
+        for entry in entity_registry.async_entries_for_device(
+            entity_registry.async_get(hass), device.id, include_disabled_entities=True
+        )
+        if (stored := last_states.get(entry.entity_id)) is not None
+    ]
+    return min(last_seen.since, max(map(_as_utc, alive), default=last_seen.since))
+
+
+def _as_utc(when):
+    """Return a datetime with a time zone, assuming UTC for naive ones."""
+    return when if when.tzinfo else when.replace(tzinfo=dt_util.UTC)
+
+
+def _matches_purge_filters(
+    display, last_seen, older_than, hostname, client_version_below
+):
+    """Return whether a display matches every given purge filter.
+
+    Devices without a loaded display have not been seen since Home Assistant
+    started or were unloaded, so they are matched on their persisted last
+    seen time. Without a loaded display nothing matches filters on what the
+    client reported.
+    """
+    if older_than is not None:
+        if display is not None and display.connection:
+            return False
+        if last_seen >= dt_util.utcnow() - older_than:
+            return False
+
+    if hostname is not None:
+        display_hostname = display and display.settings.get("hostname")
+        if not display_hostname or not fnmatch.fnmatch(
+            display_hostname.lower(), hostname.lower()
+        ):
+            return False
+
+    if client_version_below is not None:
+        client_version = display and display.data.get("client_version")
+        try:
+            if parse_version(client_version) >= parse_version(client_version_below):
+                return False
+        except (InvalidVersion, TypeError):
+            return False
+
+    return True
+
+
+def purge_displays(
+    hass, older_than=None, hostname=None, client_version_below=None, dry_run=False
+):
+    """Remove every display matching the filters, with its device and entities.
+
+    Args:
+        hass: HomeAssistant instance
+        older_than: Match displays not seen for this long
+        hostname: Match displays whose hostname matches this pattern
+        client_version_below: Match displays running an older client
+        dry_run: Only report the displays that would be removed
+
+    Returns:
+        list: The matching displays
+
+    """
+    displays = hass.data[DOMAIN][DATA_DISPLAYS]
+    dr = device_registry.async_get(hass)
+    entry_id = hass.data[DOMAIN][DATA_CONFIG_ENTRY].entry_id
+
+    matched = []
+    for device in device_registry.async_entries_for_config_entry(dr, entry_id):
+        display_id = next(
+            (ident for domain, ident in device.identifiers if domain == DOMAIN), None
+        )
+        if display_id is None:
+            continue
+        display = displays.get(display_id)
+        last_seen = _display_last_seen(hass, display_id, display, device)
+        if _matches_purge_filters(
+            display, last_seen, older_than, hostname, client_version_below
+        ):
+            matched.append((device, display_id, display, last_seen))
+
+    results = [
+        {
+            "display_id": display_id,
+            "device_id": device.id,
+            "hostname": display and display.settings.get("hostname"),
+            "client_version": display and display.data.get("client_version"),
+            "last_seen": last_seen.isoformat(),
+        }
+        for device, display_id, display, last_seen in matched
+    ]
+    if dry_run:
+        return results
+
+    # Removing a device also removes its entities from the entity registry,
+    # which in turn removes the entity objects from Home Assistant.
+    fleet = async_get_fleet_status(hass)
+    last_seen_store = async_get_last_seen(hass)
+    for device, display_id, display, _ in matched:
+        if display is not None:
+            del displays[display_id]
+            display.release()
+            fleet.async_mark_dirty(display_id)
+        dr.async_remove_device(device.id)
+        last_seen_store.async_forget(display_id)
+
+    return results
+
+
+def resolve_displays(hass, service_data):
+    """Resolve a device, area, label and display id selection to displays.
+
+    Args:
+        hass: HomeAssistant instance
+        service_data: Service call data holding the selection
+
+    Returns:
+        dict: Matching displays keyed by display_id
+
+    """
+    displays = hass.data[DOMAIN][DATA_DISPLAYS]
+    device_ids = service_data.get("target", service_data.get("device_id")) or []
+    if ENTITY_MATCH_ALL in device_ids:
+        return dict(displays)
+
+    selected = {
+        display_id: displays[display_id]
+        for display_id in service_data.get("display_id", [])
+        if display_id in displays
+    }
+
+    dr = device_registry.async_get(hass)
+    devices = [dr.async_get(device_id) for device_id in device_ids]
+    for area_id in service_data.get("area_id", []):
+        devices.extend(device_registry.async_entries_for_area(dr, area_id))
+    for label_id in service_data.get("label_id", []):
+        devices.extend(device_registry.async_entries_for_label(dr, label_id))
+
+    for device in devices:
+        if device is None:
+            continue
+        for domain, display_id in device.identifiers:
+            if domain == DOMAIN and display_id in displays:
+                selected[display_id] = displays[display_id]
+    return selected
+
+
 def get_display_by_connection(hass, connection):
-    """Get a Remote Assist Display device by connection."""
+    """Get every Remote Assist Display device bound to a connection."""
     displays = hass.data[DOMAIN][DATA_DISPLAYS]
 
-    for k, v in displays.items():
-        if any(c[0] == connection for c in v._connections):
-            return v
-    return None
+    return [
+        v for v in displays.values() if any(c[0] == connection for c in v._connections)
+    ]
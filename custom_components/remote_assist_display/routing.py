@@ -0,0 +1,110 @@
+"""Intent to navigation routing for Remote Assist Display."""
+
+from fnmatch import translate
+import logging
+import re
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import DATA_ROUTES, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ROUTE_SCHEMA = vol.Schema(
+    {
+        vol.Required("intent"): cv.string,
+        vol.Optional("slots", default={}): {cv.string: cv.string},
+        vol.Required("path"): cv.string,
+        vol.Optional("display_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("area_id"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+ROUTES_SCHEMA = vol.All(cv.ensure_list, [ROUTE_SCHEMA])
+
+
+def _slot_value(value):
+    """Return the plain value of an intent slot."""
+    if isinstance(value, dict):
+        value = value.get("value")
+    return "" if value is None else str(value)
+
+
+class RoutingTable:
+    """Routes compiled once from the config entry options.
+
+    Routes are grouped by intent name, and their slot patterns are compiled
+    to regular expressions, so matching an intent only looks at the routes
+    for that intent.
+    """
+
+    def __init__(self, routes=()) -> None:
+        """Compile the routes.
+
+        Raises:
+            vol.Invalid: If a route is malformed
+
+        """
+        self._routes = {}
+        for route in ROUTES_SCHEMA(list(routes)):
+            slots = tuple(
+                (name, re.compile(translate(pattern), re.IGNORECASE))
+                for name, pattern in route["slots"].items()
+            )
+            self._routes.setdefault(route["intent"], []).append(
+                (
+                    slots,
+                    frozenset(route.get("display_id", ())),
+                    frozenset(route.get("area_id", ())),
+                    route["path"],
+                )
+            )
+
+    def __bool__(self):
+        """Return whether any route is configured."""
+        return bool(self._routes)
+
+    def match(self, intent, slots, display_id, area_id=None):
+        """Return the path of the first route matching an intent.
+
+        Args:
+            intent: Name of the intent
+            slots: Slots of the intent
+            display_id: Display the intent was handled for
+            area_id: Optional callable returning the display's area
+
+        Returns:
+            str: The path to navigate to, or None
+
+        """
+        for route_slots, display_ids, area_ids, path in self._routes.get(intent, ()):
+            if display_ids and display_id not in display_ids:
+                continue
+            if area_ids and (area_id is None or area_id() not in area_ids):
+                continue
+            if all(
+                name in slots and pattern.fullmatch(_slot_value(slots[name]))
+                for name, pattern in route_slots
+            ):
+                return path
+        return None
+
+
+@callback
+def async_load_routes(hass: HomeAssistant, routes):
+    """Compile the configured routes and make them the active table.
+
+    Returns:
+        RoutingTable: The active table, empty if the routes are invalid
+
+    """
+    try:
+        table = RoutingTable(routes or ())
+    except vol.Invalid as err:
+        _LOGGER.error("Invalid intent routes, routing is disabled: %s", err)
+        table = RoutingTable()
+    hass.data[DOMAIN][DATA_ROUTES] = table
+    return table
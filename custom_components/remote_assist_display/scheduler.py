@@ -0,0 +1,302 @@
+"""Persistent command scheduler for Remote Assist Display."""
+
+from datetime import datetime, time, timedelta
+import heapq
+import logging
+import math
+from uuid import uuid4
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_SCHEDULER,
+    DOMAIN,
+    NAVIGATE_WS_COMMAND,
+    REFRESH_WS_COMMAND,
+    SCHEDULER_TICK,
+)
+from .outbound import CommandFrame
+from .remote_assist_display import resolve_displays
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.schedules"
+STORAGE_VERSION = 1
+
+SCHEDULE_COMMANDS = ("navigate", "settings", "refresh")
+SELECTION_KEYS = ("target", "area_id", "label_id")
+
+
+def next_due(schedule, now, previous=None):
+    """Return when a schedule is next due, or None once it is spent.
+
+    Args:
+        schedule: Stored schedule
+        now: Current UTC time
+        previous: Time the schedule last fired at, if it did
+
+    """
+    if schedule.get("at"):
+        if previous is not None:
+            return None
+        return dt_util.parse_datetime(schedule["at"])
+
+    if schedule.get("interval"):
+        interval = timedelta(seconds=schedule["interval"])
+        due = (previous or now) + interval
+        # Skip the occurrences missed while Home Assistant was stopped
+        return due if due > now else now + interval
+
+    local = dt_util.as_local(now)
+    at = time.fromisoformat(schedule["time"])
+    due = local.replace(
+        hour=at.hour, minute=at.minute, second=at.second, microsecond=0
+    )
+    if due <= local:
+        due += timedelta(days=1)
+    return dt_util.as_utc(due)
+
+
+def _tick(when: datetime):
+    """Return the wheel slot a due time falls in."""
+    return math.ceil(when.timestamp() / SCHEDULER_TICK)
+
+
+class DisplayScheduler:
+    """One timer wheel for the scheduled commands of every display.
+
+    Schedules are bucketed by the tick they are next due at, and a single
+    timer is armed for the earliest bucket. Every schedule due at that tick
+    is fired in one pass: each distinct command is serialized once for all
+    of its displays, the settings patches for a display are merged into one
+    update, and recurring schedules are put back on the wheel.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.schedules = {}
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._wheel = {}
+        self._ticks = []
+        self._due = {}
+        self._armed = None
+        self._unsub = None
+        hass.data[DOMAIN][DATA_SCHEDULER] = self
+
+    async def async_load(self):
+        """Restore the stored schedules and arm the timer."""
+        stored = await self._store.async_load() or {}
+        now = dt_util.utcnow()
+        for schedule in stored.get("schedules", []):
+            due = dt_util.parse_datetime(schedule["next"])
+            if due < now and not schedule.get("at"):
+                due = next_due(schedule, now)
+            # One-shot commands missed while stopped are sent on the next tick
+            self._insert(schedule, max(due, now))
+        self._arm()
+
+    @callback
+    def async_stop(self):
+        """Stop the timer."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._armed = None
+        self.hass.data[DOMAIN].pop(DATA_SCHEDULER, None)
+
+    async def async_add(self, schedule):
+        """Add a schedule and persist it.
+
+        Returns:
+            dict: The stored schedule, including its id and next due time
+
+        """
+        schedule = {"schedule_id": uuid4().hex, **schedule}
+        now = dt_util.utcnow()
+        due = next_due(schedule, now)
+        if due <= now:
+            raise ValueError("Schedule is not due in the future")
+        self._insert(schedule, due)
+        self._arm()
+        await self._async_save()
+        return schedule
+
+    @callback
+    def async_add_transient(self, schedule, due):
+        """Put a one-shot schedule on the wheel without persisting it.
+
+        Transient schedules are for short-lived timers driven by state
+        changes, which would otherwise write to disk on every change.
+
+        Returns:
+            str: The schedule id
+
+        """
+        schedule = {
+            "schedule_id": uuid4().hex,
+            **schedule,
+            "at": due.isoformat(),
+            "transient": True,
+        }
+        self._insert(schedule, due)
+        self._arm()
+        return schedule["schedule_id"]
+
+    @callback
+    def async_cancel(self, schedule_id):
+        """Take a transient schedule off the wheel."""
+        if self.schedules.pop(schedule_id, None) is not None:
+            self._discard(schedule_id)
+            self._arm()
+
+    async def async_remove(self, schedule_id):
+        """Remove a schedule and persist the change."""
+        schedule = self.schedules.pop(schedule_id, None)
+        if schedule is None:
+            raise ValueError(f"No schedule found for {schedule_id}")
+        self._discard(schedule_id)
+        self._arm()
+        await self._async_save()
+        return schedule
+
+    def _insert(self, schedule, due):
+        """Put a schedule in the bucket of the tick it is due at."""
+        schedule["next"] = due.isoformat()
+        self.schedules[schedule["schedule_id"]] = schedule
+        tick = _tick(due)
+        self._due[schedule["schedule_id"]] = tick
+        if tick not in self._wheel:
+            self._wheel[tick] = set()
+            heapq.heappush(self._ticks, tick)
+        self._wheel[tick].add(schedule["schedule_id"])
+
+    def _discard(self, schedule_id):
+        """Take a schedule out of its bucket."""
+        tick = self._due.pop(schedule_id, None)
+        bucket = self._wheel.get(tick)
+        if bucket is not None:
+            bucket.discard(schedule_id)
+            if not bucket:
+                # The tick stays on the heap and is skipped when reached
+                del self._wheel[tick]
+
+    @callback
+    def _arm(self):
+        """Arm the timer for the earliest bucket on the wheel."""
+        while self._ticks and self._ticks[0] not in self._wheel:
+            heapq.heappop(self._ticks)
+        tick = self._ticks[0] if self._ticks else None
+        if tick == self._armed:
+            return
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._armed = tick
+        if tick is not None:
+            self._unsub = async_track_point_in_utc_time(
+                self.hass,
+                self._async_fire,
+                dt_util.utc_from_timestamp(tick * SCHEDULER_TICK),
+            )
+
+    @callback
+    def _async_fire(self, now):
+        """Fire every schedule due at or before this tick.
+
+        Buckets hold the schedules due up to their tick, so only the ticks
+        that have fully passed are taken, rounding the current time down. The
+        schedules are put back and the timer is armed again even if sending
+        fails, so the scheduler never stops.
+        """
+        self._unsub = None
+        self._armed = None
+        current = math.floor(now.timestamp() / SCHEDULER_TICK)
+        due = []
+        while self._ticks and self._ticks[0] <= current:
+            for schedule_id in self._wheel.pop(heapq.heappop(self._ticks), ()):
+                del self._due[schedule_id]
+                due.append(self.schedules[schedule_id])
+
+        try:
+            if due:
+                self._fan_out(due)
+        finally:
+            for schedule in due:
+                previous = dt_util.parse_datetime(schedule["next"])
+                following = next_due(schedule, now, previous)
+                if following is None:
+                    del self.schedules[schedule["schedule_id"]]
+                else:
+                    self._insert(schedule, following)
+            if any(not schedule.get("transient") for schedule in due):
+                self.hass.async_create_task(self._async_save())
+            self._arm()
+
+    def _fan_out(self, schedules):
+        """Send the commands of all due schedules in a single pass."""
+        frames = {}
+        commands = {}
+        patches = {}
+        for schedule in schedules:
+            try:
+                displays = resolve_displays(self.hass, schedule)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error resolving the displays of schedule %s",
+                    schedule["schedule_id"],
+                )
+                continue
+            if schedule["command"] == "settings":
+                for display_id, display in displays.items():
+                    patches.setdefault(display_id, (display, {}))[1].update(
+                        schedule["settings"]
+                    )
+                continue
+
+            key = (schedule["command"], schedule.get("path"))
+            if key not in frames:
+                if schedule["command"] == "navigate":
+                    frames[key] = CommandFrame(NAVIGATE_WS_COMMAND, path=schedule["path"])
+                else:
+                    frames[key] = CommandFrame(REFRESH_WS_COMMAND)
+            for display_id, display in displays.items():
+                commands.setdefault(display_id, (display, {}))[1][key] = frames[key]
+
+        for display, patch in patches.values():
+            try:
+                display.apply_settings(self.hass, patch)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error applying scheduled settings to %s", display.display_id
+                )
+        for display, display_frames in commands.values():
+            try:
+                for frame in display_frames.values():
+                    display.send_frame(frame)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error sending scheduled commands to %s", display.display_id
+                )
+        _LOGGER.debug(
+            "Fired %s schedules: %s frames to %s displays, %s settings patches",
+            len(schedules),
+            len(frames),
+            len(commands),
+            len(patches),
+        )
+
+    async def _async_save(self):
+        """Persist the schedules."""
+        await self._store.async_save(
+            {
+                "schedules": [
+                    schedule
+                    for schedule in self.schedules.values()
+                    if not schedule.get("transient")
+                ]
+            }
+        )
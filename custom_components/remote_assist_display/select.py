@@ -73,10 +73,12 @@ class RADAssistSatelliteSelect(RADEntity, SelectEntity, restore_state.RestoreEnt
                 self._attr_current_option = None
         else:
             self._attr_current_option = None
+        self.display.satellite_changed()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         self._attr_current_option = option
+        self.display.satellite_changed()
         self.async_write_ha_state()
         self.schedule_update_ha_state()
 
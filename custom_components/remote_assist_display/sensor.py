@@ -34,6 +34,8 @@ async def async_setup_entry(
 
 
 class RADSensor(RADEntity, SensorEntity):
+    _listen_keys = frozenset({"connected", "display"})
+
     def __init__(
         self,
         coordinator,
@@ -51,13 +53,17 @@ class RADSensor(RADEntity, SensorEntity):
         self._device_class = device_class
         self._unit_of_measurement = unit_of_measurement
 
-    @property
-    def native_value(self):
+    def _compute_value(self):
         val = self._data.get("display", {}).get(self.parameter, None)
-        if len(str(val)) > 255:
-            val = str(val)[:250] + "..."
+        text = str(val)
+        if len(text) > 255:
+            val = text[:250] + "..."
         return val
 
+    @property
+    def native_value(self):
+        return self._current_snapshot.value
+
     @property
     def device_class(self):
         return self._device_class
@@ -77,6 +83,8 @@ class RADSensor(RADEntity, SensorEntity):
 
 
 class RADIntentSensor(RADSensor):
+    _listen_keys = frozenset({"connected"})
+
     def __init__(
         self,
         coordinator,
@@ -112,15 +120,13 @@ class RADIntentSensor(RADSensor):
             self._attr_native_value = speech
             self.async_write_ha_state()
 
-    @property
-    def native_value(self):
+    def _compute_value(self):
         """Return the state of the sensor normall, as opposed to the normal RADSensor."""
         return self._attr_native_value
 
-    @property
-    def extra_state_attributes(self):
+    def _compute_attributes(self):
         """Return the state attributes from this sensor in addition to the ones from its RADSensor parent."""
-        super_attributes = super().extra_state_attributes
+        super_attributes = super()._compute_attributes()
         intent_sensor_attributes = {}
         if hasattr(self, "_attr_extra_state_attributes"):
             intent_sensor_attributes = self._attr_extra_state_attributes
@@ -1,20 +1,42 @@
 """Support for Remote Assist Display services."""
 
+from uuid import uuid4
+
 import voluptuous as vol
 
 from homeassistant.core import callback, SupportsResponse
 from homeassistant.helpers import config_validation as cv, device_registry
+from homeassistant.util import dt as dt_util
 
+from .broadcast import ScheduledBroadcast, async_get_broadcast, plan_waves
 from .const import (
+    APPLY_SETTINGS_SERVICE,
+    BROADCAST_STATUS_SERVICE,
+    CANCEL_BROADCAST_SERVICE,
+    DATA_BROADCASTS,
     DATA_DISPLAYS,
+    DATA_SCHEDULER,
+    DEFAULT_PREFETCH_HISTORY,
     DOMAIN,
+    MIN_VERSION_PLAYLIST,
     NAVIGATE_SERVICE,
     NAVIGATE_URL_SERVICE,
     NAVIGATE_URL_WS_COMMAND,
     NAVIGATE_WS_COMMAND,
+    NAVIGATION_HISTORY_SIZE,
+    PREFETCH_SERVICE,
+    PREFETCH_WS_COMMAND,
+    PURGE_SERVICE,
     REFRESH_SERVICE,
     REFRESH_WS_COMMAND,
+    SCHEDULE_SERVICE,
+    START_PLAYLIST_SERVICE,
+    STOP_PLAYLIST_SERVICE,
+    UNSCHEDULE_SERVICE,
 )
+from .outbound import CommandFrame
+from .remote_assist_display import purge_displays, resolve_displays
+from .scheduler import SCHEDULE_COMMANDS
 
 NAVIGATE_URL_SCHEMA = vol.Schema(
     {
@@ -36,6 +58,152 @@ REFRESH_SCHEMA = vol.Schema(
     {
         vol.Optional("target"): cv.ensure_list,
         vol.Optional("device_id"): cv.ensure_list,
+        vol.Optional("stagger"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("wave_size"): cv.positive_int,
+        vol.Optional("jitter", default=False): cv.boolean,
+    }
+)
+
+PREFETCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional("target"): cv.ensure_list,
+        vol.Optional("device_id"): cv.ensure_list,
+        vol.Optional("paths"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("history", default=DEFAULT_PREFETCH_HISTORY): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=NAVIGATION_HISTORY_SIZE)
+        ),
+    }
+)
+
+CANCEL_BROADCAST_SCHEMA = vol.Schema(
+    {
+        vol.Required("broadcast_id"): cv.string,
+    }
+)
+
+BROADCAST_STATUS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("broadcast_id"): cv.string,
+    }
+)
+
+PURGE_FILTERS = ("older_than", "hostname", "client_version_below")
+
+PURGE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("older_than"): cv.positive_time_period,
+            vol.Optional("hostname"): cv.string,
+            vol.Optional("client_version_below"): cv.string,
+            vol.Optional("dry_run", default=False): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(*PURGE_FILTERS),
+)
+
+SETTINGS_PATCH_KEYS = (
+    "hide_header",
+    "hide_sidebar",
+    "default_dashboard",
+    "device_name_storage_key",
+    "brightness",
+)
+
+APPLY_SETTINGS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("target"): cv.ensure_list,
+            vol.Optional("device_id"): cv.ensure_list,
+            vol.Optional("area_id"): cv.ensure_list,
+            vol.Optional("label_id"): cv.ensure_list,
+            vol.Optional("hide_header"): cv.boolean,
+            vol.Optional("hide_sidebar"): cv.boolean,
+            vol.Optional("default_dashboard"): cv.string,
+            vol.Optional("device_name_storage_key"): cv.string,
+            vol.Optional("brightness"): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=255)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(*SETTINGS_PATCH_KEYS),
+)
+
+
+PLAYLIST_ITEM_SCHEMA = vol.Schema(
+    {
+        vol.Required("path"): cv.string,
+        vol.Required("dwell"): vol.All(vol.Coerce(float), vol.Range(min=1)),
+    }
+)
+
+START_PLAYLIST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("target"): cv.ensure_list,
+            vol.Optional("device_id"): cv.ensure_list,
+            vol.Optional("area_id"): cv.ensure_list,
+            vol.Optional("label_id"): cv.ensure_list,
+            vol.Required("items"): vol.All(
+                cv.ensure_list, vol.Length(min=1), [PLAYLIST_ITEM_SCHEMA]
+            ),
+            vol.Optional("loop", default=True): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key("target", "device_id", "area_id", "label_id"),
+)
+
+STOP_PLAYLIST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("target"): cv.ensure_list,
+            vol.Optional("device_id"): cv.ensure_list,
+            vol.Optional("area_id"): cv.ensure_list,
+            vol.Optional("label_id"): cv.ensure_list,
+        }
+    ),
+    cv.has_at_least_one_key("target", "device_id", "area_id", "label_id"),
+)
+
+
+def _has_command_args(data):
+    """Validate a schedule holds the arguments of its command."""
+    if data["command"] == "navigate" and "path" not in data:
+        raise vol.Invalid("A scheduled navigation needs a path")
+    if data["command"] == "settings" and not any(k in data for k in SETTINGS_PATCH_KEYS):
+        raise vol.Invalid("A scheduled settings patch needs at least one setting")
+    return data
+
+
+SCHEDULE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("target"): cv.ensure_list,
+            vol.Optional("device_id"): cv.ensure_list,
+            vol.Optional("area_id"): cv.ensure_list,
+            vol.Optional("label_id"): cv.ensure_list,
+            vol.Required("command"): vol.In(SCHEDULE_COMMANDS),
+            vol.Optional("path"): cv.string,
+            vol.Optional("hide_header"): cv.boolean,
+            vol.Optional("hide_sidebar"): cv.boolean,
+            vol.Optional("default_dashboard"): cv.string,
+            vol.Optional("device_name_storage_key"): cv.string,
+            vol.Optional("brightness"): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=255)
+            ),
+            vol.Optional("at"): cv.datetime,
+            vol.Optional("time"): cv.time,
+            vol.Optional("interval"): cv.positive_time_period,
+        }
+    ),
+    cv.has_at_least_one_key("target", "device_id", "area_id", "label_id"),
+    cv.has_at_least_one_key("at", "time", "interval"),
+    cv.has_at_most_one_key("at", "time", "interval"),
+    _has_command_args,
+)
+
+UNSCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required("schedule_id"): cv.string,
     }
 )
 
@@ -69,8 +237,87 @@ async def _get_display_for_target(hass, target):
     return display_id, display
 
 
+def _settings_patch(service_data):
+    """Return the settings patch held in service call data."""
+    patch = {k: service_data[k] for k in SETTINGS_PATCH_KEYS if k in service_data}
+    if "brightness" in patch:
+        # The client expects brightness between 0.0 and 1.0
+        patch["brightness"] = patch["brightness"] / 255.0
+    return patch
+
+
+def _apply_settings(hass, service_data):
+    """Apply a settings patch to every selected display in one pass.
+
+    Args:
+        hass: HomeAssistant instance
+        service_data: Service call data holding the selection and the patch
+
+    Returns:
+        dict: Response containing success status and results
+
+    """
+    patch = _settings_patch(service_data)
+    displays = resolve_displays(hass, service_data)
+    if not displays:
+        return {"success": False, "error": "No displays matched the target"}
+
+    results = []
+    for display_id, display in displays.items():
+        display.apply_settings(hass, patch)
+        results.append({"display_id": display_id, "status": "success"})
+
+    return {"success": True, "results": results}
+
+
+def _set_playlist(hass, service_data, playlist):
+    """Start or stop a playlist on every selected display.
+
+    Args:
+        hass: HomeAssistant instance
+        service_data: Service call data holding the selection
+        playlist: Playlist pushed to the displays, or None to stop it
+
+    Returns:
+        dict: Response containing success status and results
+
+    """
+    displays = resolve_displays(hass, service_data)
+    if not displays:
+        return {"success": False, "error": "No displays matched the target"}
+
+    results = []
+    for display_id, display in displays.items():
+        if playlist and not display.supports(MIN_VERSION_PLAYLIST):
+            results.append(
+                {
+                    "display_id": display_id,
+                    "status": "error",
+                    "error": f"Display version {display.data.get('client_version')} does not support playlists (requires {MIN_VERSION_PLAYLIST})",
+                }
+            )
+            continue
+        display.set_playlist(hass, playlist)
+        results.append({"display_id": display_id, "status": "success"})
+
+    response = {
+        "success": all(r["status"] == "success" for r in results),
+        "results": results,
+    }
+    if playlist:
+        response["playlist_id"] = playlist["playlist_id"]
+    return response
+
+
 async def _process_targets(
-    hass, targets, command, minimum_version=None, **command_args
+    hass,
+    targets,
+    command,
+    minimum_version=None,
+    stagger=0,
+    wave_size=None,
+    jitter=False,
+    **command_args,
 ):
     """Process multiple targets with a given command.
 
@@ -80,10 +327,14 @@ async def _process_targets(
         command: WebSocket command to send
         command_args: Additional arguments for the command
         minimum_version: Optional minimum version required for the command
+        stagger: Optional number of seconds to spread the command over
+        wave_size: Optional number of displays per staggered wave
+        jitter: Randomize the offset of each staggered wave
     Returns:
         dict: Response containing success status and results
     """
     results = []
+    ready = []
 
     for target in targets:
         try:
@@ -110,7 +361,7 @@ async def _process_targets(
                     )
                     continue
 
-            hass.create_task(display.send(command, **command_args))
+            ready.append((display_id, display))
             results.append(
                 {"target": target, "status": "success", "display_id": display_id}
             )
@@ -118,11 +369,27 @@ async def _process_targets(
         except ValueError as e:
             results.append({"target": target, "status": "error", "error": str(e)})
 
-    return {
+    response = {
         "success": all(r["status"] == "success" for r in results),
         "results": results,
     }
 
+    # Serialize the command once for every display it is sent to
+    frame = CommandFrame(command, **command_args)
+
+    if stagger:
+        broadcast = ScheduledBroadcast(
+            hass, frame, plan_waves(ready, stagger, wave_size, jitter)
+        )
+        broadcast.async_start()
+        response["broadcast"] = broadcast.as_dict()
+        return response
+
+    for _, display in ready:
+        display.send_frame(frame)
+
+    return response
+
 
 @callback
 def async_setup_services(hass) -> None:
@@ -139,6 +406,24 @@ def async_setup_services(hass) -> None:
                 return await navigate(service_call)
             if service == REFRESH_SERVICE:
                 return await refresh(service_call)
+            if service == APPLY_SETTINGS_SERVICE:
+                return _apply_settings(hass, service_call.data)
+            if service == CANCEL_BROADCAST_SERVICE:
+                return cancel_broadcast(service_call)
+            if service == BROADCAST_STATUS_SERVICE:
+                return broadcast_status(service_call)
+            if service == PREFETCH_SERVICE:
+                return await prefetch(service_call)
+            if service == PURGE_SERVICE:
+                return purge(service_call)
+            if service == START_PLAYLIST_SERVICE:
+                return start_playlist(service_call)
+            if service == STOP_PLAYLIST_SERVICE:
+                return _set_playlist(hass, service_call.data, None)
+            if service == SCHEDULE_SERVICE:
+                return await schedule(service_call)
+            if service == UNSCHEDULE_SERVICE:
+                return await unschedule(service_call)
         except ValueError as e:
             return {"success": False, "error": str(e)}
 
@@ -167,8 +452,114 @@ def async_setup_services(hass) -> None:
             targets=service_call.data.get("target", service_call.data.get("device_id")),
             command=REFRESH_WS_COMMAND,
             minimum_version="1.1.0",
+            stagger=service_call.data.get("stagger", 0),
+            wave_size=service_call.data.get("wave_size"),
+            jitter=service_call.data.get("jitter", False),
         )
 
+    async def prefetch(service_call):
+        """Tell displays which dashboards they will probably show next."""
+        results = []
+        targets = service_call.data.get("target", service_call.data.get("device_id"))
+        for target in targets:
+            try:
+                display_id, display = await _get_display_for_target(hass, target)
+            except ValueError as e:
+                results.append({"target": target, "status": "error", "error": str(e)})
+                continue
+
+            paths = service_call.data.get("paths") or display.prefetch_hints(
+                service_call.data["history"]
+            )
+            display.send_frame(CommandFrame(PREFETCH_WS_COMMAND, paths=paths))
+            results.append(
+                {
+                    "target": target,
+                    "status": "success",
+                    "display_id": display_id,
+                    "paths": paths,
+                }
+            )
+
+        return {
+            "success": all(r["status"] == "success" for r in results),
+            "results": results,
+        }
+
+    def cancel_broadcast(service_call):
+        """Cancel the pending waves of a staggered broadcast."""
+        broadcast_id = service_call.data["broadcast_id"]
+        broadcast = hass.data[DOMAIN].get(DATA_BROADCASTS, {}).get(broadcast_id)
+        if broadcast is None:
+            raise ValueError(f"No pending broadcast found for {broadcast_id}")
+        broadcast.async_cancel()
+        return {"success": True, "broadcast": broadcast.as_dict()}
+
+    def broadcast_status(service_call):
+        """Report the progress of one broadcast, or of every pending one."""
+        broadcast_id = service_call.data.get("broadcast_id")
+        if broadcast_id is None:
+            broadcasts = hass.data[DOMAIN].get(DATA_BROADCASTS, {}).values()
+            return {"success": True, "broadcasts": [b.as_dict() for b in broadcasts]}
+        broadcast = async_get_broadcast(hass, broadcast_id)
+        if broadcast is None:
+            raise ValueError(f"No broadcast found for {broadcast_id}")
+        return {"success": True, "broadcast": broadcast.as_dict()}
+
+    def purge(service_call):
+        """Remove every display matching the filters."""
+        dry_run = service_call.data["dry_run"]
+        results = purge_displays(
+            hass,
+            older_than=service_call.data.get("older_than"),
+            hostname=service_call.data.get("hostname"),
+            client_version_below=service_call.data.get("client_version_below"),
+            dry_run=dry_run,
+        )
+        return {"success": True, "dry_run": dry_run, "results": results}
+
+    def start_playlist(service_call):
+        """Push a dashboard playlist that the displays rotate through locally."""
+        playlist = {
+            "playlist_id": uuid4().hex,
+            "items": service_call.data["items"],
+            "loop": service_call.data["loop"],
+        }
+        return _set_playlist(hass, service_call.data, playlist)
+
+    async def schedule(service_call):
+        """Schedule a command for displays, once or on a recurring basis."""
+        data = service_call.data
+        stored = {"command": data["command"]}
+        if "target" in data or "device_id" in data:
+            stored["target"] = data.get("target", data.get("device_id"))
+        for key in ("area_id", "label_id"):
+            if key in data:
+                stored[key] = data[key]
+        if data["command"] == "navigate":
+            stored["path"] = data["path"]
+        elif data["command"] == "settings":
+            stored["settings"] = _settings_patch(data)
+        if "at" in data:
+            stored["at"] = dt_util.as_utc(data["at"]).isoformat()
+        elif "time" in data:
+            stored["time"] = data["time"].isoformat()
+        else:
+            stored["interval"] = data["interval"].total_seconds()
+
+        scheduler = hass.data[DOMAIN].get(DATA_SCHEDULER)
+        if scheduler is None:
+            raise ValueError("The scheduler is not running")
+        return {"success": True, "schedule": await scheduler.async_add(stored)}
+
+    async def unschedule(service_call):
+        """Remove a scheduled command."""
+        scheduler = hass.data[DOMAIN].get(DATA_SCHEDULER)
+        if scheduler is None:
+            raise ValueError("The scheduler is not running")
+        removed = await scheduler.async_remove(service_call.data["schedule_id"])
+        return {"success": True, "schedule": removed}
+
     hass.services.async_register(
         DOMAIN,
         NAVIGATE_URL_SERVICE,
@@ -192,3 +583,75 @@ def async_setup_services(hass) -> None:
         schema=REFRESH_SCHEMA,
         supports_response=SupportsResponse.OPTIONAL,
     )
+
+    hass.services.async_register(
+        DOMAIN,
+        APPLY_SETTINGS_SERVICE,
+        async_call_rad_service,
+        schema=APPLY_SETTINGS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        CANCEL_BROADCAST_SERVICE,
+        async_call_rad_service,
+        schema=CANCEL_BROADCAST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        BROADCAST_STATUS_SERVICE,
+        async_call_rad_service,
+        schema=BROADCAST_STATUS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        PREFETCH_SERVICE,
+        async_call_rad_service,
+        schema=PREFETCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        PURGE_SERVICE,
+        async_call_rad_service,
+        schema=PURGE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SCHEDULE_SERVICE,
+        async_call_rad_service,
+        schema=SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        UNSCHEDULE_SERVICE,
+        async_call_rad_service,
+        schema=UNSCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        START_PLAYLIST_SERVICE,
+        async_call_rad_service,
+        schema=START_PLAYLIST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        STOP_PLAYLIST_SERVICE,
+        async_call_rad_service,
+        schema=STOP_PLAYLIST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
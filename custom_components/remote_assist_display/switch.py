@@ -33,6 +33,8 @@ async def async_setup_entry(
 class RADHideHeaderSwitch(RADEntity, SwitchEntity, RestoreEntity):
     """Representation of a switch to hide the header on the display."""
 
+    _listen_keys = frozenset({"connected", "hide_header"})
+
     def __init__(
         self,
         coordinator,
@@ -75,8 +77,7 @@ class RADHideHeaderSwitch(RADEntity, SwitchEntity, RestoreEntity):
             self._attr_is_on = config_default
         self.schedule_update_ha_state()
 
-    @property
-    def is_on(self):
+    def _compute_value(self):
         """Return the state of the switch."""
         value = self._data.get("hide_header", None)
         if value is not None:
@@ -89,34 +90,27 @@ class RADHideHeaderSwitch(RADEntity, SwitchEntity, RestoreEntity):
                 "hide_header", False
             )
 
+    @property
+    def is_on(self):
+        """Return the state of the switch."""
+        return self._current_snapshot.value
+
     async def async_turn_on(self, **kwargs):
         """Turn on the switch."""
         self._attr_is_on = True
-        data = {
-            "hide_header": True,
-            "display": {"hide_header": True},
-        }
-        self.display.update_settings(self.hass, data)
-        self._data.update(data)
-        self.async_write_ha_state()
-        self.schedule_update_ha_state()
+        self.display.apply_settings(self.hass, {"hide_header": True})
 
     async def async_turn_off(self, **kwargs):
         """Turn off the switch."""
         self._attr_is_on = False
-        data = {
-            "hide_header": False,
-            "display": {"hide_header": False},
-        }
-        self.display.update_settings(self.hass, data)
-        self._data.update(data)
-        self.async_write_ha_state()
-        self.schedule_update_ha_state()
+        self.display.apply_settings(self.hass, {"hide_header": False})
 
 
 class RADHideSidebarSwitch(RADEntity, SwitchEntity, RestoreEntity):
     """Representation of a switch to hide the sidebar on the display."""
 
+    _listen_keys = frozenset({"connected", "hide_sidebar"})
+
     def __init__(
         self,
         coordinator,
@@ -158,8 +152,7 @@ class RADHideSidebarSwitch(RADEntity, SwitchEntity, RestoreEntity):
             )
             self._attr_is_on = config_default
 
-    @property
-    def is_on(self):
+    def _compute_value(self):
         """Return the state of the switch."""
         value = self._data.get("hide_sidebar", None)
         if value is not None:
@@ -172,22 +165,15 @@ class RADHideSidebarSwitch(RADEntity, SwitchEntity, RestoreEntity):
                 "hide_sidebar", False
             )
 
+    @property
+    def is_on(self):
+        """Return the state of the switch."""
+        return self._current_snapshot.value
+
     async def async_turn_on(self, **kwargs):
         """Turn on the switch."""
-        data = {
-            "hide_sidebar": True,
-            "display": {"hide_sidebar": True},
-        }
-        self.display.update_settings(self.hass, data)
-        self._data.update(data)
-        self.async_write_ha_state()
+        self.display.apply_settings(self.hass, {"hide_sidebar": True})
 
     async def async_turn_off(self, **kwargs):
         """Turn off the switch."""
-        data = {
-            "hide_sidebar": False,
-            "display": {"hide_sidebar": False},
-        }
-        self.display.update_settings(self.hass, data)
-        self._data.update(data)
-        self.async_write_ha_state()
+        self.display.apply_settings(self.hass, {"hide_sidebar": False})
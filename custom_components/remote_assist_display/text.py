@@ -34,6 +34,8 @@ async def async_setup_entry(
 
 
 class DefaultDashboardText(RADEntity, RestoreText):
+    _listen_keys = frozenset({"connected", "default_dashboard"})
+
     def __init__(
         self,
         coordinator,
@@ -54,37 +56,32 @@ class DefaultDashboardText(RADEntity, RestoreText):
         else:
             self._attr_native_value = last_text_data.native_value
 
-    @property
-    def native_value(self):
+    def _compute_value(self):
         val = self._data.get("default_dashboard", None)
         if not val:
-            try:
-                val = self._attr_native_value
-            except AttributeError:
-                val = self.coordinator.hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get(
-                    "default_dashboard_path", DEFAULT_HOME_ASSISTANT_DASHBOARD
-                )
-            if not val:
-                val = self.coordinator.hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get(
-                    "default_dashboard_path", DEFAULT_HOME_ASSISTANT_DASHBOARD
-                )
-        if len(str(val)) > 255:
-            val = str(val)[:250] + "..."
+            val = getattr(self, "_attr_native_value", None)
+        if not val:
+            val = self.coordinator.hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get(
+                "default_dashboard_path", DEFAULT_HOME_ASSISTANT_DASHBOARD
+            )
+        text = str(val)
+        if len(text) > 255:
+            val = text[:250] + "..."
         return val
 
+    @property
+    def native_value(self):
+        return self._current_snapshot.value
+
     async def async_set_value(self, value: str) -> None:
         """Set the default dashboard."""
         self._value = value
-        data = {
-            "default_dashboard": value,
-            "display": {"default_dashboard": value},
-        }
-        self.display.update_settings(self.hass, data)
-        self._data.update(data)
-        self.async_write_ha_state()
+        self.display.apply_settings(self.hass, {"default_dashboard": value})
 
 
 class DeviceStorageKeyText(RADEntity, RestoreText):
+    _listen_keys = frozenset({"connected", "device_name_storage_key"})
+
     def __init__(
         self,
         coordinator,
@@ -105,29 +102,21 @@ class DeviceStorageKeyText(RADEntity, RestoreText):
         else:
             self._attr_native_value = last_text_data.native_value
 
-    @property
-    def native_value(self):
+    def _compute_value(self):
         val = self._data.get("device_name_storage_key", None)
         if not val:
-            try:
-                val = self._attr_native_value
-            except AttributeError:
-                val = self.coordinator.hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get(
-                    "device_name_storage_key", DEFAULT_DEVICE_NAME_STORAGE_KEY
-                )
-            if not val:
-                val = self.coordinator.hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get(
-                    "device_name_storage_key", DEFAULT_DEVICE_NAME_STORAGE_KEY
-                )
+            val = getattr(self, "_attr_native_value", None)
+        if not val:
+            val = self.coordinator.hass.data[DOMAIN][DATA_CONFIG_ENTRY].options.get(
+                "device_name_storage_key", DEFAULT_DEVICE_NAME_STORAGE_KEY
+            )
         return val
 
+    @property
+    def native_value(self):
+        return self._current_snapshot.value
+
     async def async_set_value(self, value: str) -> None:
         """Set the device storage key."""
         self._value = value
-        data = {
-            "device_name_storage_key": value,
-            "display": {"device_name_storage_key": value},
-        }
-        self.display.update_settings(self.hass, data)
-        self._data.update(data)
-        self.async_write_ha_state()
+        self.display.apply_settings(self.hass, {"device_name_storage_key": value})
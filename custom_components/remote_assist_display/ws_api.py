@@ -4,46 +4,92 @@ import logging
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.websocket_api import async_register_command, event_message
+from homeassistant.components.websocket_api import async_register_command
 from homeassistant.core import callback
 
 from .const import (
+    BATCH_WS_COMMAND,
+    CONNECT_MANY_WS_COMMAND,
     CONNECT_WS_COMMAND,
+    DATA_DISPLAYS,
+    DOMAIN,
     REGISTER_WS_COMMAND,
     SETTINGS_WS_COMMAND,
+    SUBSCRIBE_FLEET_WS_COMMAND,
     UPDATE_WS_COMMAND,
 )
-from .remote_assist_display import get_or_register_display
+from .fleet import async_get_fleet_status
+from .remote_assist_display import async_get_or_register_display
 
 _LOGGER = logging.getLogger(__name__)
 
+BATCH_OPERATION_SCHEMA = vol.Any(
+    vol.Schema({vol.Required("op"): "update", vol.Required("data"): dict}),
+    vol.Schema({vol.Required("op"): "ack", vol.Required("revision"): int}),
+)
+
 
 async def async_setup_ws_api(hass):
     @websocket_api.websocket_command(
-        {vol.Required("type"): CONNECT_WS_COMMAND, vol.Required("display_id"): str}
+        {
+            vol.Required("type"): CONNECT_WS_COMMAND,
+            vol.Required("display_id"): str,
+            vol.Optional("session"): str,
+            vol.Optional("revision"): int,
+            vol.Optional("client_version"): str,
+        }
     )
     @websocket_api.async_response
     async def handle_connect(hass, connection, msg):
         display_id = msg["display_id"]
-
-        @callback
-        def send_update(data):
-            connection.send_message(event_message(msg["id"], {"result": data}))
+        dev = await async_get_or_register_display(hass, display_id)
 
         def close_connection():
-            dev = get_or_register_display(hass, display_id)
+            # The display may have been evicted while it was connected
+            dev = hass.data[DOMAIN][DATA_DISPLAYS].get(display_id)
             if dev:
                 dev.close_connection(hass, connection)
 
         connection.subscriptions[msg["id"]] = close_connection
         connection.send_result(msg["id"], "registered")
 
-        dev = get_or_register_display(hass, display_id)
-        settings = {"last_seen": datetime.now(tz=timezone.utc).isoformat()}
-        dev.update_settings(hass, settings)
-        dev.open_connection(hass, connection, msg["id"])
-        dev.update(hass, dev.data)
-        send_update(dev.data)
+        dev.connect(
+            hass,
+            connection,
+            msg["id"],
+            last_seen=datetime.now(tz=timezone.utc).isoformat(),
+            session=msg.get("session"),
+            revision=msg.get("revision"),
+            client_version=msg.get("client_version"),
+        )
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): CONNECT_MANY_WS_COMMAND,
+            vol.Required("display_ids"): vol.All([str], vol.Length(min=1)),
+        }
+    )
+    @websocket_api.async_response
+    async def handle_connect_many(hass, connection, msg):
+        """Bind several displays to a single subscription."""
+        display_ids = list(dict.fromkeys(msg["display_ids"]))
+        devs = [
+            await async_get_or_register_display(hass, display_id)
+            for display_id in display_ids
+        ]
+
+        def close_connection():
+            displays = hass.data[DOMAIN][DATA_DISPLAYS]
+            for display_id in display_ids:
+                if dev := displays.get(display_id):
+                    dev.close_connection(hass, connection)
+
+        connection.subscriptions[msg["id"]] = close_connection
+        connection.send_result(msg["id"], "registered")
+
+        last_seen = datetime.now(tz=timezone.utc).isoformat()
+        for dev in devs:
+            dev.connect(hass, connection, msg["id"], last_seen=last_seen, gateway=True)
 
     @websocket_api.websocket_command(
         {
@@ -56,16 +102,17 @@ async def async_setup_ws_api(hass):
     async def handle_register(hass, connection, msg):
         display_id = msg["display_id"]
         display_settings = {"registered": True, "hostname": msg["hostname"]}
-        dev = get_or_register_display(hass, display_id)
+        dev = await async_get_or_register_display(hass, display_id)
         dev.update_settings(hass, display_settings)
         connection.send_result(msg["id"], dev.settings)
 
     @websocket_api.websocket_command(
         {vol.Required("type"): SETTINGS_WS_COMMAND, vol.Required("display_id"): str}
     )
-    def handle_settings(hass, connection, msg):
+    @websocket_api.async_response
+    async def handle_settings(hass, connection, msg):
         display_id = msg["display_id"]
-        display = get_or_register_display(hass, display_id)
+        display = await async_get_or_register_display(hass, display_id)
         default_dashboard = display.entities.get("default_dashboard", None)
         if default_dashboard:
             default_dashboard = default_dashboard.native_value
@@ -98,11 +145,51 @@ async def async_setup_ws_api(hass):
         """Update the current sensors for the display."""
         display_id = msg["display_id"]
 
-        dev = get_or_register_display(hass, display_id)
+        dev = await async_get_or_register_display(hass, display_id)
         dev.update(hass, msg.get("data", {}))
         connection.send_result(msg["id"])
 
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): BATCH_WS_COMMAND,
+            vol.Required("display_id"): str,
+            vol.Required("ops"): [BATCH_OPERATION_SCHEMA],
+        }
+    )
+    @websocket_api.async_response
+    async def handle_batch(hass, connection, msg):
+        """Apply a list of client operations with a single entity update."""
+        display_id = msg["display_id"]
+
+        data = {}
+        ack = None
+        for op in msg["ops"]:
+            if op["op"] == "update":
+                data.update(op["data"])
+            elif op["op"] == "ack":
+                ack = op["revision"]
+
+        dev = await async_get_or_register_display(hass, display_id)
+        if data:
+            dev.update(hass, data)
+        if ack is not None:
+            dev.acknowledge(ack)
+        connection.send_result(msg["id"], {"revision": dev.delivered_revision})
+
+    @websocket_api.websocket_command({vol.Required("type"): SUBSCRIBE_FLEET_WS_COMMAND})
+    @websocket_api.require_admin
+    @callback
+    def handle_subscribe_fleet(hass, connection, msg):
+        """Stream the status of every display to an admin client."""
+        connection.send_result(msg["id"])
+        connection.subscriptions[msg["id"]] = async_get_fleet_status(
+            hass
+        ).async_subscribe(connection, msg["id"])
+
     async_register_command(hass, handle_connect)
+    async_register_command(hass, handle_connect_many)
     async_register_command(hass, handle_register)
     async_register_command(hass, handle_settings)
     async_register_command(hass, handle_update)
+    async_register_command(hass, handle_batch)
+    async_register_command(hass, handle_subscribe_fleet)
@@ -0,0 +1,62 @@
+"""Test the Remote Assist Display brightness curves."""
+from datetime import datetime
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.remote_assist_display.brightness_curve import (
+    CURVE_POINTS_SCHEMA,
+    build_curve,
+    curve_level,
+)
+
+
+def _at(hour, minute=0):
+    """Return a local time today."""
+    return datetime(2025, 1, 23, hour, minute, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+def test_time_curve_interpolates_and_wraps_midnight():
+    """Test a time curve is linear between points and wraps around the day."""
+    curve = build_curve(
+        CURVE_POINTS_SCHEMA(
+            [{"time": "22:00", "brightness": 0}, {"time": "06:00", "brightness": 255}]
+        )
+    )
+
+    assert curve["source"] == "time"
+    assert [p["time"] for p in curve["points"]] == ["06:00:00", "22:00:00"]
+    assert curve_level(curve, _at(6)) == 1.0
+    assert curve_level(curve, _at(14)) == pytest.approx(0.5)
+    assert curve_level(curve, _at(22)) == 0.0
+    assert curve_level(curve, _at(2)) == pytest.approx(0.5)
+
+
+def test_sun_curve_is_flat_past_its_ends():
+    """Test a sun curve follows the elevation and needs one to be evaluated."""
+    curve = build_curve(
+        CURVE_POINTS_SCHEMA(
+            [{"elevation": 10, "brightness": 255}, {"elevation": -6, "brightness": 51}]
+        ),
+        latitude=52.0,
+        longitude=4.0,
+    )
+
+    assert curve["source"] == "sun"
+    assert curve["latitude"] == 52.0
+    assert curve_level(curve, elevation=-20) == pytest.approx(0.2)
+    assert curve_level(curve, elevation=2) == pytest.approx(0.6)
+    assert curve_level(curve, elevation=45) == 1.0
+    assert curve_level(curve) is None
+
+
+def test_mixed_or_short_curves_are_rejected():
+    """Test a curve needs two points on the same axis."""
+    with pytest.raises(vol.Invalid):
+        CURVE_POINTS_SCHEMA([{"time": "06:00", "brightness": 255}])
+    with pytest.raises(vol.Invalid):
+        CURVE_POINTS_SCHEMA(
+            [{"time": "06:00", "brightness": 255}, {"elevation": 0, "brightness": 0}]
+        )
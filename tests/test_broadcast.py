@@ -0,0 +1,121 @@
+"""Test the Remote Assist Display scheduled broadcasts."""
+from datetime import timedelta
+from unittest.mock import Mock
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.remote_assist_display.broadcast import (
+    ScheduledBroadcast,
+    async_cancel_broadcasts,
+    async_get_broadcast,
+    plan_waves,
+)
+from custom_components.remote_assist_display.const import DATA_BROADCASTS, DOMAIN
+from custom_components.remote_assist_display.outbound import CommandFrame
+
+
+def _targets(count):
+    """Create a list of mock display targets."""
+    targets = []
+    for i in range(count):
+        display = Mock()
+        targets.append((f"display-{i}", display))
+    return targets
+
+
+def test_plan_waves_without_stagger_sends_everything_at_once():
+    """Test no stagger produces a single immediate wave."""
+    targets = _targets(3)
+    assert plan_waves(targets) == [(0, targets)]
+
+
+def test_plan_waves_spreads_waves_over_window():
+    """Test waves are spread evenly across the stagger window."""
+    targets = _targets(5)
+    waves = plan_waves(targets, stagger=30, wave_size=2)
+
+    assert [delay for delay, _ in waves] == [0, 10, 20]
+    assert [len(wave) for _, wave in waves] == [2, 2, 1]
+
+
+def test_plan_waves_jitter_stays_within_slot():
+    """Test jittered waves stay inside their own slot."""
+    waves = plan_waves(_targets(4), stagger=40, jitter=True)
+
+    for index, (delay, _) in enumerate(waves):
+        assert index * 10 <= delay <= (index + 1) * 10
+
+
+async def test_broadcast_sends_waves_as_timers_fire(hass):
+    """Test each wave is sent when its timer fires."""
+    hass.data[DOMAIN] = {}
+    targets = _targets(4)
+    frame = CommandFrame("remote_assist_display/refresh")
+    broadcast = ScheduledBroadcast(
+        hass, frame, plan_waves(targets, stagger=20, wave_size=2)
+    )
+    broadcast.async_start()
+    await hass.async_block_till_done()
+
+    assert broadcast.as_dict()["sent"] == 2
+    assert hass.data[DOMAIN][DATA_BROADCASTS][broadcast.broadcast_id] is broadcast
+    targets[2][1].send_frame.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert broadcast.done
+    assert broadcast.as_dict()["pending"] == 0
+    targets[3][1].send_frame.assert_called_once_with(frame)
+    assert broadcast.broadcast_id not in hass.data[DOMAIN][DATA_BROADCASTS]
+
+
+async def test_broadcast_cancel_stops_pending_waves(hass):
+    """Test cancelling a broadcast stops the waves that were not sent."""
+    hass.data[DOMAIN] = {}
+    targets = _targets(3)
+    broadcast = ScheduledBroadcast(
+        hass, CommandFrame("remote_assist_display/refresh"), plan_waves(targets, stagger=30)
+    )
+    broadcast.async_start()
+    broadcast.async_cancel()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+
+    progress = broadcast.as_dict()
+    assert progress["cancelled"] is True
+    assert progress["sent"] == 1
+    targets[2][1].send_frame.assert_not_called()
+
+
+async def test_finished_broadcast_progress_can_be_looked_up(hass):
+    """Test a finished broadcast stays available for status lookups."""
+    hass.data[DOMAIN] = {}
+    broadcast = ScheduledBroadcast(
+        hass, CommandFrame("remote_assist_display/refresh"), plan_waves(_targets(2))
+    )
+    broadcast.async_start()
+
+    assert broadcast.done
+    assert async_get_broadcast(hass, broadcast.broadcast_id) is broadcast
+    assert async_get_broadcast(hass, "missing") is None
+
+
+async def test_cancel_broadcasts_stops_every_pending_wave(hass):
+    """Test unloading cancels the timers of every pending broadcast."""
+    hass.data[DOMAIN] = {}
+    targets = _targets(2)
+    broadcast = ScheduledBroadcast(
+        hass, CommandFrame("remote_assist_display/refresh"), plan_waves(targets, stagger=20)
+    )
+    broadcast.async_start()
+
+    async_cancel_broadcasts(hass)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+    await hass.async_block_till_done()
+
+    assert broadcast.cancelled
+    targets[1][1].send_frame.assert_not_called()
+    assert hass.data[DOMAIN][DATA_BROADCASTS] == {}
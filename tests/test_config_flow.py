@@ -180,3 +180,32 @@ async def test_options_flow_none_input(hass: HomeAssistant, config_entry: MockCo
     )
     assert result2["type"] == "form"
     assert result2["step_id"] == "init"
+
+async def test_options_flow_rejects_invalid_routes(hass: HomeAssistant, config_entry: MockConfigEntry) -> None:
+    """Test the options flow rejects intent routes without a path."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"intent_routes": [{"intent": "HassTurnOn"}]}
+    )
+    assert result2["type"] == "form"
+    assert result2["errors"] == {"intent_routes": "invalid_routes"}
+
+    result3 = await hass.config_entries.options.async_configure(
+        result2["flow_id"],
+        user_input={"intent_routes": [{"intent": "HassTurnOn", "path": "/kitchen"}]}
+    )
+    assert result3["type"] == "create_entry"
+    assert result3["data"]["intent_routes"] == [{"intent": "HassTurnOn", "path": "/kitchen"}]
+
+async def test_options_flow_rejects_invalid_presence(hass: HomeAssistant, config_entry: MockConfigEntry) -> None:
+    """Test the options flow rejects presence links without entities."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"presence": [{"display_id": "hall"}]}
+    )
+    assert result2["type"] == "form"
+    assert result2["errors"] == {"presence": "invalid_presence"}
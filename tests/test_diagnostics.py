@@ -0,0 +1,52 @@
+"""Test the Remote Assist Display diagnostics."""
+from custom_components.remote_assist_display.const import NAVIGATE_WS_COMMAND
+from custom_components.remote_assist_display.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.remote_assist_display.outbound import CommandFrame
+from custom_components.remote_assist_display.remote_assist_display import (
+    get_or_register_display,
+)
+
+
+async def test_diagnostics_report_pending_commands(hass, init_integration):
+    """Test diagnostics expose the per-display delivery counters."""
+    display = get_or_register_display(hass, "test-display")
+    display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, init_integration)
+
+    assert diagnostics["displays"]["test-display"]["connections"] == 0
+    assert diagnostics["displays"]["test-display"]["pending"] == {
+        "pending": 1,
+        "delivered": 0,
+        "expired": 0,
+        "superseded": 0,
+        "dropped": 0,
+    }
+
+
+async def test_diagnostics_report_playlist_position(hass, init_integration):
+    """Test diagnostics expose the playlist position reported by the client."""
+    display = get_or_register_display(hass, "test-display")
+    display.set_playlist(
+        hass,
+        {
+            "playlist_id": "abc",
+            "items": [{"path": "/a", "dwell": 30.0}, {"path": "/b", "dwell": 15.0}],
+            "loop": True,
+        },
+    )
+    display.update(hass, {"playlist_position": 1})
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, init_integration)
+
+    assert diagnostics["displays"]["test-display"]["playlist"] == {
+        "playlist_id": "abc",
+        "position": 1,
+        "path": "/b",
+    }
+
+    display.set_playlist(hass, None)
+    diagnostics = await async_get_config_entry_diagnostics(hass, init_integration)
+    assert diagnostics["displays"]["test-display"]["playlist"] is None
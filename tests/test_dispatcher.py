@@ -0,0 +1,141 @@
+"""Test the Remote Assist Display push dispatcher."""
+import logging
+import tracemalloc
+from unittest.mock import Mock
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.remote_assist_display.dispatcher import DisplayDispatcher
+
+# Data keys the entities of a single display listen to
+ENTITY_KEYS = [
+    {"connected", "display"},
+    {"connected"},
+    {"connected", "default_dashboard"},
+    {"connected", "device_name_storage_key"},
+    {"connected"},
+    {"connected", "hide_header"},
+    {"connected", "hide_sidebar"},
+]
+
+
+async def test_keyed_listener_only_gets_matching_updates(hass):
+    """Test a listener subscribed to keys ignores other updates."""
+    dispatcher = DisplayDispatcher(hass, "test_display")
+    keyed = Mock()
+    everything = Mock()
+    dispatcher.async_add_listener(keyed, {"brightness"})
+    dispatcher.async_add_listener(everything)
+
+    dispatcher.async_set_updated_data({"display": {}}, {"display"})
+    keyed.assert_not_called()
+    everything.assert_called_once()
+
+    dispatcher.async_set_updated_data({"brightness": 1.0}, {"brightness"})
+    keyed.assert_called_once()
+    assert dispatcher.data == {"brightness": 1.0}
+
+
+async def test_listener_with_several_changed_keys_is_called_once(hass):
+    """Test listeners are deduplicated across changed keys."""
+    dispatcher = DisplayDispatcher(hass, "test_display")
+    listener = Mock()
+    dispatcher.async_add_listener(listener, {"connected", "hide_header"})
+
+    dispatcher.async_set_updated_data({}, {"connected", "hide_header"})
+    listener.assert_called_once()
+
+    listener.reset_mock()
+    dispatcher.async_set_updated_data({})
+    listener.assert_called_once()
+
+
+async def test_remove_listener(hass):
+    """Test removed listeners are no longer notified."""
+    dispatcher = DisplayDispatcher(hass, "test_display")
+    keyed = Mock()
+    everything = Mock()
+    remove_keyed = dispatcher.async_add_listener(keyed, {"connected"})
+    remove_everything = dispatcher.async_add_listener(everything)
+
+    remove_keyed()
+    remove_everything()
+    dispatcher.async_set_updated_data({}, {"connected"})
+
+    keyed.assert_not_called()
+    everything.assert_not_called()
+    assert dispatcher._key_listeners == {}
+
+
+async def test_synthetic_fleet_fan_out(hass):
+    """Test a URL update on a 1,000 display fleet only reaches one entity each."""
+    calls = 0
+
+    def make_listener():
+        def listener():
+            nonlocal calls
+            calls += 1
+
+        return listener
+
+    fleet = [DisplayDispatcher(hass, f"display-{i}") for i in range(1000)]
+    for dispatcher in fleet:
+        for keys in ENTITY_KEYS:
+            dispatcher.async_add_listener(make_listener(), keys)
+
+    for dispatcher in fleet:
+        dispatcher.async_set_updated_data({"display": {"current_url": "/"}}, {"display"})
+    assert calls == 1000
+
+    calls = 0
+    for dispatcher in fleet:
+        dispatcher.async_set_updated_data({"connected": True}, {"connected"})
+    assert calls == 1000 * len(ENTITY_KEYS)
+
+    assert not hasattr(fleet[0], "__dict__")
+
+
+def _listener():
+    """Do nothing on an update."""
+
+
+def _fleet_memory_per_display(create, keyed):
+    """Return the bytes allocated per display for a 1,000 display fleet."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        fleet = []
+        for i in range(1000):
+            holder = create(f"display-{i}")
+            removers = [
+                holder.async_add_listener(_listener, keys)
+                if keyed
+                else holder.async_add_listener(_listener)
+                for keys in ENTITY_KEYS
+            ]
+            fleet.append((holder, removers))
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return allocated / len(fleet)
+
+
+async def test_synthetic_fleet_memory(hass):
+    """Test the dispatcher holds a 1,000 display fleet in a fraction of the memory.
+
+    Measures the bytes per display of a fleet with a listener for each of the
+    entities of a display, against a DataUpdateCoordinator per display.
+    """
+    dispatcher = _fleet_memory_per_display(
+        lambda display_id: DisplayDispatcher(hass, display_id), keyed=True
+    )
+    coordinator = _fleet_memory_per_display(
+        lambda display_id: DataUpdateCoordinator(
+            hass, logging.getLogger(__name__), name=display_id
+        ),
+        keyed=False,
+    )
+
+    assert dispatcher < 2048
+    assert dispatcher * 3 < coordinator
@@ -0,0 +1,138 @@
+"""Test the Remote Assist Display base entity."""
+from collections import Counter
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from custom_components.remote_assist_display.entities import RADEntity, RADStateSnapshot
+from custom_components.remote_assist_display.remote_assist_display import (
+    get_or_register_display,
+)
+from custom_components.remote_assist_display.sensor import RADSensor
+
+
+async def test_static_properties_are_precomputed(mock_coordinator):
+    """Test unique_id and device_info do not depend on coordinator data."""
+    entity = RADSensor(mock_coordinator, "test_display", "current_url", "Current URL")
+
+    assert entity.unique_id == "test_display-Current_URL"
+    assert entity.unique_id is entity.unique_id
+    assert entity.device_info is entity.device_info
+
+
+async def test_properties_follow_display_updates(mock_coordinator):
+    """Test properties are served from the snapshot of the last update."""
+    entity = RADSensor(mock_coordinator, "test_display", "current_url", "Current URL")
+
+    entity.coordinator.data = {"connected": True, "display": {"current_url": "/a"}}
+    assert entity.native_value == "/a"
+    assert entity.available is True
+
+    entity.coordinator.data = {"display": {"current_url": "/b"}}
+    assert entity.native_value == "/a"
+
+    with patch.object(Entity, "async_write_ha_state"):
+        entity._handle_coordinator_update()
+    assert entity.native_value == "/b"
+    assert entity.available is False
+
+
+async def test_effective_value_ignores_snapshot(mock_coordinator):
+    """Test the effective value is computed from the current data."""
+    entity = RADSensor(mock_coordinator, "test_display", "current_url", "Current URL")
+
+    entity.coordinator.data = {"display": {"current_url": "/a"}}
+    assert entity.native_value == "/a"
+
+    entity.coordinator.data = {"display": {"current_url": "/b"}}
+    assert entity.effective_value() == "/b"
+    assert entity.native_value == "/a"
+
+
+async def test_state_write_builds_one_snapshot_per_entity(
+    hass: HomeAssistant, init_integration
+) -> None:
+    """Test a coordinator update computes each entity's state once."""
+    display = get_or_register_display(hass, "test-display-id")
+    await hass.async_block_till_done()
+
+    with patch.object(
+        RADEntity,
+        "_build_snapshot",
+        autospec=True,
+        side_effect=RADEntity._build_snapshot,
+    ) as build:
+        display.update(
+            hass, {"connected": True, "display": {"current_url": "http://example.com"}}
+        )
+        await hass.async_block_till_done()
+
+    builds = Counter(call.args[0] for call in build.call_args_list)
+    assert builds
+    assert set(builds.values()) == {1}
+
+    sensor = display.entities["current_url"]
+    assert isinstance(sensor._current_snapshot, RADStateSnapshot)
+    state = hass.states.get(sensor.entity_id)
+    assert state.state == "http://example.com"
+    assert state.attributes["display_id"] == "test-display-id"
+
+
+async def test_value_is_computed_once_per_update(
+    hass: HomeAssistant, init_integration
+) -> None:
+    """Test reading the state between updates does not recompute it."""
+    display = get_or_register_display(hass, "test-display-id")
+    await hass.async_block_till_done()
+    sensor = display.entities["current_url"]
+
+    with patch.object(
+        RADSensor,
+        "_compute_value",
+        autospec=True,
+        side_effect=RADSensor._compute_value,
+    ) as compute:
+        for url in ("http://a", "http://b"):
+            display.update(hass, {"display": {"current_url": url}})
+            await hass.async_block_till_done()
+            assert sensor.native_value == url
+            assert sensor.native_value == url
+
+    assert [call.args[0] for call in compute.call_args_list].count(sensor) == 2
+
+
+async def test_state_write_reads_the_snapshot_many_times(
+    hass: HomeAssistant, init_integration
+) -> None:
+    """Test the state properties Home Assistant reads per write share one build.
+
+    Without the snapshot, every read of a state property computed the state
+    again, so the reads per entity are the computations the snapshot saves.
+    """
+    display = get_or_register_display(hass, "test-display-id")
+    await hass.async_block_till_done()
+
+    snapshot = RADEntity._current_snapshot
+    reads = Counter()
+
+    def counting_snapshot(entity):
+        reads[entity] += 1
+        return snapshot.fget(entity)
+
+    with patch.object(
+        RADEntity, "_current_snapshot", property(counting_snapshot)
+    ), patch.object(
+        RADEntity,
+        "_build_snapshot",
+        autospec=True,
+        side_effect=RADEntity._build_snapshot,
+    ) as build:
+        display.update(hass, {"connected": True})
+        await hass.async_block_till_done()
+
+    builds = Counter(call.args[0] for call in build.call_args_list)
+    assert set(builds) == set(reads)
+    assert set(builds.values()) == {1}
+    # Home Assistant reads the availability, the value and the attributes
+    assert sum(reads.values()) / len(reads) >= 3
@@ -0,0 +1,80 @@
+"""Test the Remote Assist Display fleet status subscription."""
+from datetime import timedelta
+from unittest.mock import Mock
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.remote_assist_display.const import DATA_DISPLAYS, DOMAIN
+from custom_components.remote_assist_display.fleet import FleetStatus
+
+
+def _display(connected=True, url="/a", version="1.2.0"):
+    """Create a mock display with the fields the fleet summary reads."""
+    display = Mock()
+    display.data = {
+        "connected": connected,
+        "display": {"current_url": url},
+        "client_version": version,
+    }
+    display.settings = {"last_seen": "2025-01-23T12:00:00"}
+    return display
+
+
+async def test_subscribe_sends_snapshot(hass):
+    """Test a new subscriber receives the status of every display."""
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"one": _display(), "two": _display(False)}
+    fleet = FleetStatus(hass)
+    connection = Mock()
+
+    fleet.async_subscribe(connection, 1)
+
+    message = connection.send_message.call_args.args[0]
+    assert message["id"] == 1
+    assert message["event"]["snapshot"]["one"] == {
+        "connected": True,
+        "current_url": "/a",
+        "client_version": "1.2.0",
+        "brightness": None,
+        "last_seen": "2025-01-23T12:00:00",
+    }
+    assert message["event"]["snapshot"]["two"]["connected"] is False
+
+
+async def test_changes_are_coalesced_into_one_delta(hass):
+    """Test changes within the window are sent once with changed fields only."""
+    displays = {"one": _display(), "two": _display()}
+    hass.data[DOMAIN][DATA_DISPLAYS] = displays
+    fleet = FleetStatus(hass)
+    connection = Mock()
+    fleet.async_subscribe(connection, 1)
+    connection.send_message.reset_mock()
+
+    displays["one"].data["display"] = {"current_url": "/b"}
+    fleet.async_mark_dirty("one")
+    displays["one"].data["display"] = {"current_url": "/c"}
+    fleet.async_mark_dirty("one")
+    fleet.async_mark_dirty("two")
+    del displays["two"]
+    fleet.async_mark_dirty("two")
+    connection.send_message.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    connection.send_message.assert_called_once()
+    message = connection.send_message.call_args.args[0]
+    assert message["event"]["delta"] == {"one": {"current_url": "/c"}, "two": None}
+
+
+async def test_nothing_is_tracked_without_subscribers(hass):
+    """Test changes are ignored once the last subscriber has left."""
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"one": _display()}
+    fleet = FleetStatus(hass)
+    unsubscribe = fleet.async_subscribe(Mock(), 1)
+
+    unsubscribe()
+    fleet.async_mark_dirty("one")
+
+    assert fleet._dirty == set()
+    assert fleet._unsub_flush is None
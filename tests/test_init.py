@@ -0,0 +1,68 @@
+"""Test the Remote Assist Display config entry setup and unload."""
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_DOMAIN
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.remote_assist_display.broadcast import ScheduledBroadcast
+from custom_components.remote_assist_display.const import (
+    DATA_BROADCASTS,
+    DATA_INTENT_LISTENER,
+    DATA_PRESENCE,
+    DATA_SCHEDULER,
+    DOMAIN,
+)
+from custom_components.remote_assist_display.outbound import CommandFrame
+
+
+async def test_unload_entry_stops_timers_and_listeners(hass):
+    """Test unloading the entry cancels everything its setup started."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            "idle_display_ttl": 600,
+            "event_type": "assist_intent",
+            "presence": [{"display_id": "hall", "entities": ["binary_sensor.hall_motion"]}],
+        },
+    )
+    entry.add_to_hass(hass)
+    with patch("custom_components.remote_assist_display.get_version", return_value="0.0.1"):
+        await async_setup_component(hass, DOMAIN, {CONF_DOMAIN: {}})
+        await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+
+    data = hass.data[DOMAIN]
+    scheduler = data[DATA_SCHEDULER]
+    await scheduler.async_add(
+        {
+            "command": "refresh",
+            "target": ["all"],
+            "at": (dt_util.utcnow() + timedelta(hours=1)).isoformat(),
+        }
+    )
+    broadcast = ScheduledBroadcast(
+        hass, CommandFrame("remote_assist_display/refresh"), [(0, []), (60, [("a", Mock())])]
+    )
+    broadcast.async_start()
+    presence = data[DATA_PRESENCE]
+    assert scheduler._unsub is not None
+    assert presence._unsub is not None
+    assert data[DATA_INTENT_LISTENER]._unsub is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert scheduler._unsub is None
+    assert broadcast.cancelled is True
+    assert data[DATA_BROADCASTS] == {}
+    assert presence._unsub is None
+    assert DATA_SCHEDULER not in data
+    assert DATA_PRESENCE not in data
+    assert DATA_INTENT_LISTENER not in data
+    # The eviction sweep is checked by the lingering timer check of the test harness
@@ -0,0 +1,69 @@
+"""Test the Remote Assist Display shared intent listener."""
+from unittest.mock import Mock, patch
+
+from custom_components.remote_assist_display.const import DOMAIN
+from custom_components.remote_assist_display.intent_listener import IntentEventListener
+
+DISPLAYS = 50
+
+
+def _display(display_id):
+    """Create a mock display that counts its intent callbacks."""
+    return Mock(display_id=display_id)
+
+
+async def test_callbacks_per_event(hass):
+    """Test unlinked satellites cost no callbacks and linked ones cost one."""
+    listener = IntentEventListener(hass)
+    displays = [_display(f"display_{i}") for i in range(DISPLAYS)]
+    for i, display in enumerate(displays):
+        listener.async_link(display, f"satellite_{i}")
+
+    with patch.object(
+        IntentEventListener, "_async_handle_event", autospec=True,
+        side_effect=IntentEventListener._async_handle_event,
+    ) as handler:
+        listener.async_set_event_type("test_event")
+        for _ in range(10):
+            hass.bus.async_fire("test_event", {"device_id": "unlinked", "result": {}})
+        await hass.async_block_till_done()
+        assert handler.call_count == 0
+
+        hass.bus.async_fire("test_event", {"device_id": "satellite_7", "result": {}})
+        await hass.async_block_till_done()
+        assert handler.call_count == 1
+
+    assert [d.handle_intent_event.call_count for d in displays].count(1) == 1
+    displays[7].handle_intent_event.assert_called_once()
+    listener.async_stop()
+
+
+async def test_link_moves_display_between_satellites(hass):
+    """Test relinking and unlinking keep the satellite index current."""
+    listener = IntentEventListener(hass)
+    first, second = _display("first"), _display("second")
+
+    listener.async_link(first, "kitchen")
+    listener.async_link(second, "kitchen")
+    listener.async_link(first, "hall")
+    assert listener._satellites == {"kitchen": {"second": second}, "hall": {"first": first}}
+
+    listener.async_unlink(second)
+    listener.async_link(first, None)
+    assert listener._satellites == {}
+    assert listener._async_filter({"device_id": "kitchen"}) is False
+
+
+async def test_stop_drops_the_listener(hass):
+    """Test stopping unsubscribes from the bus and forgets the listener."""
+    listener = hass.data[DOMAIN]["intent_listener"] = IntentEventListener(hass)
+    listener.async_set_event_type("test_event")
+    display = _display("one")
+    listener.async_link(display, "kitchen")
+
+    listener.async_stop()
+    hass.bus.async_fire("test_event", {"device_id": "kitchen"})
+    await hass.async_block_till_done()
+
+    display.handle_intent_event.assert_not_called()
+    assert "intent_listener" not in hass.data[DOMAIN]
@@ -0,0 +1,54 @@
+"""Test the Remote Assist Display last seen store."""
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.remote_assist_display.last_seen import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    LastSeenStore,
+    async_get_last_seen,
+)
+
+
+async def test_last_seen_is_restored(hass, hass_storage):
+    """Test stored times are read back and unknown displays have none."""
+    seen = dt_util.utcnow() - timedelta(days=3)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"since": seen.isoformat(), "last_seen": {"kiosk": seen.isoformat()}},
+    }
+
+    store = LastSeenStore(hass)
+    await store.async_load()
+
+    assert store.get("kiosk") == seen
+    assert store.get("ghost") is None
+    assert store.since == seen
+
+
+async def test_store_records_when_it_started(hass, hass_storage):
+    """Test a new store keeps the time it started recording."""
+    store = LastSeenStore(hass)
+    await store.async_load()
+    started = store.since
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+
+    assert hass_storage[STORAGE_KEY]["data"] == {"since": started.isoformat(), "last_seen": {}}
+
+
+async def test_touch_and_forget(hass):
+    """Test a display's time is recorded and dropped with the display."""
+    store = async_get_last_seen(hass)
+    seen = dt_util.utcnow()
+
+    store.async_touch("kiosk", seen)
+    assert store.get("kiosk") == seen
+    assert async_get_last_seen(hass) is store
+
+    store.async_forget("kiosk")
+    assert store.get("kiosk") is None
@@ -0,0 +1,90 @@
+"""Test the Remote Assist Display backlight light."""
+from functools import partial
+from unittest.mock import Mock, call
+
+import pytest
+
+from homeassistant.components.light import LightEntityFeature
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.remote_assist_display.brightness_curve import CURVE_POINTS_SCHEMA
+from custom_components.remote_assist_display.light import RADBacklightLight
+from custom_components.remote_assist_display.remote_assist_display import (
+    RemoteAssistDisplay,
+)
+
+POINTS = [{"time": "06:00", "brightness": 102}, {"time": "22:00", "brightness": 102}]
+
+
+@pytest.fixture
+def light(hass, mock_coordinator, mock_display):
+    """Create a backlight for a display running a recent client."""
+    mock_display.data = {"client_version": "1.3.0"}
+    mock_display.supports = partial(RemoteAssistDisplay.supports, mock_display)
+    mock_coordinator.data = {"connected": True}
+    light = RADBacklightLight(mock_coordinator, "test_display", mock_display)
+    light.hass = hass
+    light.async_write_ha_state = Mock()
+    return light
+
+
+async def test_set_brightness_curve_pushes_curve(light, mock_display):
+    """Test the curve is built once and handed to the display."""
+    await light.async_set_brightness_curve(CURVE_POINTS_SCHEMA(POINTS))
+
+    curve = mock_display.set_brightness_curve.call_args.args[1]
+    assert curve["source"] == "time"
+    assert [p["level"] for p in curve["points"]] == [0.4, 0.4]
+
+
+async def test_set_brightness_curve_requires_client_support(light, mock_display):
+    """Test older clients are refused a curve."""
+    mock_display.data = {"client_version": "1.2.0"}
+
+    with pytest.raises(HomeAssistantError):
+        await light.async_set_brightness_curve(CURVE_POINTS_SCHEMA(POINTS))
+    mock_display.set_brightness_curve.assert_not_called()
+
+
+async def test_light_reports_curve_level(light, mock_coordinator, mock_display):
+    """Test the state follows the curve, which the display drops on its own."""
+    curve = {"source": "time", "points": [{"time": "06:00:00", "level": 0.4}]}
+    mock_coordinator.data = {"connected": True, "brightness": 1.0, "brightness_curve": curve}
+
+    assert light.brightness == 102
+    assert light.is_on is True
+
+    await light.async_turn_on(brightness=255)
+
+    mock_display.update_settings.assert_called_once_with(light.hass, {"brightness": 1.0})
+    assert mock_coordinator.data["brightness_curve"] is curve
+    mock_display.update.assert_called_once_with(light.hass, {"brightness": 1.0})
+
+
+async def test_transition_sends_one_fade_frame(light, mock_display):
+    """Test a transition is handed to the client instead of stepped here."""
+    mock_display.data = {"client_version": "1.4.0"}
+    assert light.supported_features == LightEntityFeature.TRANSITION
+
+    await light.async_turn_on(brightness=51, transition=5)
+    await light.async_turn_on(transition=3)
+    await light.async_turn_off(transition=2)
+
+    # Without a brightness the client resolves "on" and "off" itself
+    assert mock_display.fade_backlight.call_args_list == [
+        call(light.hass, 0.2, 5),
+        call(light.hass, "on", 3),
+        call(light.hass, "off", 2),
+    ]
+    mock_display.update_settings.assert_not_called()
+    light.async_write_ha_state.assert_not_called()
+
+
+async def test_transition_ignored_by_older_clients(light, mock_display):
+    """Test older clients get the target brightness straight away."""
+    assert light.supported_features == LightEntityFeature(0)
+
+    await light.async_turn_on(brightness=51, transition=5)
+
+    mock_display.fade_backlight.assert_not_called()
+    mock_display.update_settings.assert_called_once_with(light.hass, {"brightness": 0.2})
@@ -0,0 +1,226 @@
+"""Test the Remote Assist Display outbound queue."""
+import json
+from unittest.mock import Mock, patch
+
+from custom_components.remote_assist_display.const import (
+    NAVIGATE_URL_WS_COMMAND,
+    NAVIGATE_WS_COMMAND,
+    REFRESH_WS_COMMAND,
+    UPDATE_SETTINGS_WS_COMMAND,
+)
+from custom_components.remote_assist_display.outbound import (
+    MAX_PENDING_COMMANDS,
+    CommandFrame,
+    OutboundQueue,
+    PendingCommands,
+)
+
+
+class FakeHandler:
+    """WebSocket handler recording the messages written to it."""
+
+    def __init__(self):
+        self.sent = []
+
+    def _send_message(self, message):
+        self.sent.append(json.loads(message))
+
+
+def _connection():
+    """Create a connection whose send_message is bound to a fake handler."""
+    handler = FakeHandler()
+    connection = Mock()
+    connection.send_message = handler._send_message
+    return connection, handler
+
+
+def test_frame_splices_subscription_id():
+    """Test a frame is encoded once and reused for every subscription id."""
+    frame = CommandFrame(NAVIGATE_WS_COMMAND, path="/a")
+    partial = frame.partial
+
+    for cid in (1, 42):
+        assert json.loads(frame.message(cid)) == {
+            "id": cid,
+            "type": "event",
+            "event": {"command": NAVIGATE_WS_COMMAND, "path": "/a"},
+        }
+    assert frame.partial is partial
+
+
+def test_frame_message_with_recipients():
+    """Test a frame can name the displays a shared subscription addresses."""
+    frame = CommandFrame(NAVIGATE_WS_COMMAND, path="/a")
+
+    assert json.loads(frame.message(3, ["one", "two"])) == {
+        "type": "event",
+        "event": {"command": NAVIGATE_WS_COMMAND, "path": "/a"},
+        "recipients": ["one", "two"],
+        "id": 3,
+    }
+
+
+async def test_flush_sends_in_priority_order(hass):
+    """Test navigation is sent before settings and informational messages."""
+    connection, handler = _connection()
+    queue = OutboundQueue(hass, lambda: [(connection, 1)])
+
+    queue.async_push(CommandFrame("remote_assist_display/info", value=1))
+    queue.async_push(CommandFrame(UPDATE_SETTINGS_WS_COMMAND, settings={}))
+    queue.async_push(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+
+    assert queue.async_flush() == 3
+    assert [m["event"]["command"] for m in handler.sent] == [
+        NAVIGATE_WS_COMMAND,
+        UPDATE_SETTINGS_WS_COMMAND,
+        "remote_assist_display/info",
+    ]
+    assert len(queue) == 0
+
+
+@patch("custom_components.remote_assist_display.outbound.IN_FLIGHT_DRAIN_RATE", 0)
+async def test_newer_navigation_supersedes_unsent_one(hass):
+    """Test a newer navigate replaces an unsent older navigation."""
+    connection, handler = _connection()
+    info = CommandFrame("remote_assist_display/info", value=1)
+    queue = OutboundQueue(hass, lambda: [(connection, 1)], max_in_flight=len(info))
+    queue.async_push(info)
+    queue.async_flush()
+
+    queue.async_push(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+    queue.async_flush()
+    queue.async_push(CommandFrame(NAVIGATE_URL_WS_COMMAND, url="http://b"))
+
+    assert len(handler.sent) == 1
+    assert len(queue) == 1
+    assert queue.superseded == 1
+
+    queue.async_release()
+    assert handler.sent[1]["event"] == {
+        "command": NAVIGATE_URL_WS_COMMAND,
+        "url": "http://b",
+    }
+    queue.async_clear()
+
+
+async def test_in_flight_bytes_hold_frames_until_drained(hass):
+    """Test frames wait while sent bytes have not drained yet."""
+    connection, handler = _connection()
+    first = CommandFrame(NAVIGATE_WS_COMMAND, path="/a")
+    now = hass.loop.time()
+
+    with patch.object(hass.loop, "time", return_value=now) as loop_time:
+        queue = OutboundQueue(
+            hass, lambda: [(connection, 1)], max_in_flight=len(first)
+        )
+        queue.async_push(first)
+        queue.async_push(CommandFrame(UPDATE_SETTINGS_WS_COMMAND, settings={}))
+        assert queue.async_flush() == 1
+        assert queue.in_flight == len(first)
+        assert queue.async_flush() == 0
+
+        loop_time.return_value = now + 1
+        assert queue.async_flush() == 1
+    assert len(handler.sent) == 2
+
+
+async def test_queue_drops_lowest_priority_over_cap(hass):
+    """Test the byte cap drops the oldest informational frames first."""
+    info = [CommandFrame("remote_assist_display/info", value=i) for i in range(2)]
+    navigate = CommandFrame(NAVIGATE_WS_COMMAND, path="/a")
+    queue = OutboundQueue(hass, lambda: [], max_bytes=len(info[1]) + len(navigate))
+
+    for frame in (*info, navigate):
+        queue.async_push(frame)
+
+    assert len(queue) == 2
+    assert queue.dropped == 1
+    assert queue.size == len(info[1]) + len(navigate)
+
+
+@patch("custom_components.remote_assist_display.outbound.IN_FLIGHT_DRAIN_RATE", 0)
+async def test_take_returns_unsent_frames_in_queue_order(hass):
+    """Test the unsent frames can be taken out to be held elsewhere."""
+    connection, handler = _connection()
+    info = CommandFrame("remote_assist_display/info", value=1)
+    queue = OutboundQueue(hass, lambda: [(connection, 1)], max_in_flight=len(info))
+    queue.async_push(info)
+    queue.async_flush()
+
+    refresh = CommandFrame(REFRESH_WS_COMMAND)
+    navigate = CommandFrame(NAVIGATE_WS_COMMAND, path="/a")
+    queue.async_push(refresh)
+    queue.async_push(navigate)
+    queue.async_flush()
+
+    assert queue.async_take() == [refresh, navigate]
+    assert len(queue) == 0
+    assert queue.size == 0
+    assert len(handler.sent) == 1
+
+
+async def test_held_revision_covers_held_and_dropped_settings(hass):
+    """Test the held revision is the lowest of the unsent settings frames."""
+    settings = CommandFrame(UPDATE_SETTINGS_WS_COMMAND, settings={"a": 1})
+    navigate = CommandFrame(NAVIGATE_WS_COMMAND, path="/a")
+    queue = OutboundQueue(hass, lambda: [], max_bytes=len(settings) + len(navigate))
+
+    queue.async_push(navigate)
+    assert queue.held_revision() is None
+
+    queue.async_push(settings, 3)
+    queue.async_push(CommandFrame(UPDATE_SETTINGS_WS_COMMAND, settings={"a": 2}), 5)
+    assert queue.held_revision() == 3
+
+    # A dropped settings frame stays missing after it left the queue
+    queue.async_push(CommandFrame(NAVIGATE_URL_WS_COMMAND, url="http://b"))
+    assert queue.dropped == 1
+    assert all(entry[2].command != UPDATE_SETTINGS_WS_COMMAND for entry in queue._entries.values())
+    assert queue.held_revision() == 3
+
+    queue.async_clear()
+    assert queue.held_revision() is None
+
+
+async def test_pending_keeps_latest_navigation_and_one_refresh(hass):
+    """Test held commands collapse by class and are taken once."""
+    pending = PendingCommands(hass)
+    pending.async_push(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+    pending.async_push(CommandFrame(REFRESH_WS_COMMAND))
+    pending.async_push(CommandFrame(NAVIGATE_URL_WS_COMMAND, url="http://b"))
+    pending.async_push(CommandFrame(REFRESH_WS_COMMAND))
+
+    assert pending.async_take() == [
+        {"command": NAVIGATE_URL_WS_COMMAND, "url": "http://b"},
+        {"command": REFRESH_WS_COMMAND},
+    ]
+    assert pending.async_take() == []
+    assert pending.as_dict() == {
+        "pending": 0,
+        "delivered": 2,
+        "expired": 0,
+        "superseded": 2,
+        "dropped": 0,
+    }
+
+
+async def test_pending_commands_expire(hass):
+    """Test held commands are dropped once their TTL has passed."""
+    pending = PendingCommands(hass, ttls={"navigation": 0})
+    pending.async_push(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+
+    assert pending.async_take() == []
+    assert pending.expired == 1
+    assert pending.delivered == 0
+
+
+async def test_pending_commands_drop_oldest_over_limit(hass):
+    """Test overflowing the store counts drops separately from expiry."""
+    pending = PendingCommands(hass)
+    for i in range(MAX_PENDING_COMMANDS + 2):
+        pending.async_push(CommandFrame("remote_assist_display/info", value=i))
+
+    assert len(pending) == MAX_PENDING_COMMANDS
+    assert pending.dropped == 2
+    assert pending.expired == 0
+    assert pending.async_take()[0]["value"] == 2
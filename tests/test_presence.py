@@ -0,0 +1,98 @@
+"""Test the Remote Assist Display presence wake."""
+from datetime import timedelta
+from unittest.mock import Mock
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.remote_assist_display.const import DATA_DISPLAYS, DOMAIN
+from custom_components.remote_assist_display.presence import (
+    async_load_presence,
+    async_unload_presence,
+)
+from custom_components.remote_assist_display.scheduler import STORAGE_KEY, DisplayScheduler
+
+LINKS = [
+    {"display_id": "hall", "entities": ["binary_sensor.hall_motion", "binary_sensor.hall_occupancy"],
+     "idle_timeout": 60, "dim_brightness": 51},
+    {"display_id": "kitchen", "entities": "binary_sensor.kitchen_motion"},
+]
+
+
+async def test_presence_wakes_linked_display(hass):
+    """Test presence on a linked entity wakes only its display."""
+    displays = {"hall": Mock(), "kitchen": Mock()}
+    hass.data[DOMAIN][DATA_DISPLAYS] = displays
+    async_load_presence(hass, LINKS)
+
+    hass.states.async_set("binary_sensor.hall_occupancy", "on")
+    hass.states.async_set("binary_sensor.other_motion", "on")
+    await hass.async_block_till_done()
+
+    displays["hall"].wake.assert_called_once_with()
+    displays["kitchen"].wake.assert_not_called()
+
+    # Attribute updates of an entity that is already on do not wake again
+    hass.states.async_set("binary_sensor.hall_occupancy", "on", {"battery": 80})
+    await hass.async_block_till_done()
+    displays["hall"].wake.assert_called_once_with()
+
+    async_unload_presence(hass)
+    hass.states.async_set("binary_sensor.kitchen_motion", "on")
+    await hass.async_block_till_done()
+    displays["kitchen"].wake.assert_not_called()
+
+
+async def test_idle_display_is_dimmed_by_the_scheduler(hass, hass_storage):
+    """Test a display is dimmed once all its entities have been clear for the timeout."""
+    display = Mock()
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"hall": display}
+    scheduler = DisplayScheduler(hass)
+    async_load_presence(hass, LINKS)
+    hass.states.async_set("binary_sensor.hall_motion", "on")
+    hass.states.async_set("binary_sensor.hall_occupancy", "on")
+    await hass.async_block_till_done()
+
+    hass.states.async_set("binary_sensor.hall_motion", "off")
+    await hass.async_block_till_done()
+    assert scheduler.schedules == {}
+
+    hass.states.async_set("binary_sensor.hall_occupancy", "off")
+    await hass.async_block_till_done()
+    assert len(scheduler.schedules) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    display.apply_settings.assert_called_once_with(hass, {"brightness": 0.2})
+    assert scheduler.schedules == {}
+    assert STORAGE_KEY not in hass_storage
+    async_unload_presence(hass)
+    scheduler.async_stop()
+
+
+async def test_presence_cancels_pending_dim(hass):
+    """Test presence returning before the timeout keeps the display lit."""
+    display = Mock()
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"hall": display}
+    scheduler = DisplayScheduler(hass)
+    async_load_presence(hass, LINKS)
+
+    hass.states.async_set("binary_sensor.hall_motion", "on")
+    hass.states.async_set("binary_sensor.hall_motion", "off")
+    await hass.async_block_till_done()
+    assert len(scheduler.schedules) == 1
+
+    hass.states.async_set("binary_sensor.hall_motion", "on")
+    await hass.async_block_till_done()
+    assert scheduler.schedules == {}
+    assert scheduler._unsub is None
+    assert display.wake.call_count == 2
+    async_unload_presence(hass)
+    scheduler.async_stop()
+
+
+async def test_invalid_links_disable_presence(hass):
+    """Test invalid links leave presence wake disabled."""
+    index = async_load_presence(hass, [{"display_id": "hall"}])
+    assert not index
@@ -1,4 +1,6 @@
 """Test the Remote Assist Display class."""
+from datetime import timedelta
+import json
 from unittest.mock import Mock, patch
 import pytest
 from homeassistant.core import HomeAssistant
@@ -9,13 +11,27 @@ from custom_components.remote_assist_display.const import (
     DATA_DISPLAYS,
     DATA_ADDERS,
     DATA_CONFIG_ENTRY,
+    NAVIGATE_WS_COMMAND,
+    MIN_VERSION_CONNECT_FRAME,
+    MIN_VERSION_WAKE,
+    REFRESH_WS_COMMAND,
+    UPDATE_SETTINGS_WS_COMMAND,
 )
+from custom_components.remote_assist_display.dispatcher import DisplayDispatcher
+from custom_components.remote_assist_display.intent_listener import async_get_intent_listener
+from custom_components.remote_assist_display.outbound import CommandFrame
 from custom_components.remote_assist_display.remote_assist_display import (
+    DisplayLimitError,
     RemoteAssistDisplay,
+    apply_option_changes,
+    async_get_or_register_display,
+    evict_display,
+    evict_idle_displays,
     get_or_register_display,
     delete_display,
     get_display_by_connection,
 )
+from custom_components.remote_assist_display.routing import async_load_routes
 
 # Base Fixtures
 
@@ -91,14 +107,26 @@ async def registered_display(hass, mock_adders, setup_config_entry):
 
 # Helper Functions
 
-async def verify_display_deleted(hass, display):
+async def verify_display_deleted(hass, entity_ids):
     """Verify a display and its entities were properly deleted."""
     device_reg = dr.async_get(hass)
     entity_reg = er.async_get(hass)
     
+    assert entity_ids
     assert device_reg.async_get_device({(DOMAIN, "test_display")}) is None
-    for entity in display.entities.values():
-        assert entity_reg.async_get(entity.entity_id) is None
+    for entity_id in entity_ids:
+        assert entity_reg.async_get(entity_id) is None
+
+def _connect(hass, display, connection, cid):
+    """Connect a current client to a display and forget the connect frame."""
+    display.connect(
+        hass,
+        connection,
+        cid,
+        last_seen="2025-01-23T12:00:00",
+        client_version=MIN_VERSION_CONNECT_FRAME,
+    )
+    connection.send_message.reset_mock()
 
 # Tests
 
@@ -125,14 +153,14 @@ async def test_remote_assist_display_initialization(hass, mock_adders, mock_send
 async def test_update_data(hass, mock_adders, mock_send, setup_config_entry):
     """Test updating display data."""
     display = RemoteAssistDisplay(hass, "test_display")
-    display.coordinator.async_set_updated_data = Mock()
     
     new_data = {"connected": True, "current_url": "http://example.com"}
-    display.update(hass, new_data)
+    with patch.object(DisplayDispatcher, "async_set_updated_data") as mock_set_data:
+        display.update(hass, new_data)
     
     assert display.data["connected"] is True
     assert display.data["current_url"] == "http://example.com"
-    display.coordinator.async_set_updated_data.assert_called_once_with(display.data)
+    mock_set_data.assert_called_once_with(display.data, new_data.keys())
 
 async def test_update_settings(hass, mock_adders, mock_send, setup_config_entry):
     """Test updating display settings."""
@@ -151,13 +179,178 @@ async def test_update_settings(hass, mock_adders, mock_send, setup_config_entry)
         settings=settings
     )
 
+async def test_apply_settings(hass, mock_adders, mock_send, setup_config_entry):
+    """Test applying a settings patch updates data, settings and sends once."""
+    display = RemoteAssistDisplay(hass, "test_display")
+
+    with patch.object(DisplayDispatcher, "async_set_updated_data") as mock_set_data:
+        display.apply_settings(hass, {"hide_header": True, "brightness": 0.5})
+
+    assert display.data["hide_header"] is True
+    assert display.data["brightness"] == 0.5
+    assert display.settings["display"] == {"hide_header": True}
+    data, keys = mock_set_data.call_args.args
+    assert data is display.data
+    assert set(keys) == {"hide_header", "brightness"}
+    mock_send.assert_called_once_with(
+        "remote_assist_display/update_settings",
+        settings=display.settings,
+    )
+
+async def test_playlist_is_pushed_once_and_tracked(hass, mock_adders, mock_send, setup_config_entry):
+    """Test a playlist goes out in one settings frame and follows the client."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    playlist = {
+        "playlist_id": "abc",
+        "items": [{"path": "/a", "dwell": 30}, {"path": "/b", "dwell": 10}],
+        "loop": True,
+    }
+
+    display.set_playlist(hass, playlist)
+    mock_send.assert_called_once_with(
+        "remote_assist_display/update_settings",
+        settings=display.settings,
+    )
+    assert display.settings["playlist"] is playlist
+    assert display.playlist == {"playlist_id": "abc", "position": 0, "path": "/a"}
+
+    # The client reports its position without any further command frames
+    display.update(hass, {"playlist_position": 1})
+    assert display.playlist["path"] == "/b"
+    mock_send.assert_called_once()
+
+    display.set_playlist(hass, None)
+    assert display.playlist is None
+    assert display.data["playlist_position"] is None
+
+async def test_backlight_fade_applies_on_ack(hass, mock_adders, setup_config_entry):
+    """Test a fade is one frame and only reaches the data once acknowledged."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+
+    display.fade_backlight(hass, 0.2, 5, brightness_curve=None)
+
+    message = json.loads(connection.send_message.call_args.args[0])
+    assert message["event"] == {
+        "command": "remote_assist_display/backlight",
+        "settings": {"brightness_curve": None, "brightness": 0.2},
+        "transition": 5,
+        "revision": display.revision,
+    }
+    assert "brightness" not in display.data
+
+    with patch.object(DisplayDispatcher, "async_set_updated_data") as mock_set_data:
+        display.acknowledge(display.revision - 1)
+        mock_set_data.assert_not_called()
+        display.acknowledge(display.revision)
+
+    assert display.data["brightness"] == 0.2
+    assert set(mock_set_data.call_args.args[1]) == {"brightness"}
+
+async def test_backlight_fade_to_off_keeps_the_client_target(hass, mock_adders, setup_config_entry):
+    """Test a fade to "off" is sent as is and shows as no brightness once applied."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+
+    display.fade_backlight(hass, "off", 2)
+
+    message = json.loads(connection.send_message.call_args.args[0])
+    assert message["event"]["settings"] == {"brightness": "off"}
+    assert display.settings["brightness"] == "off"
+
+    display.acknowledge(display.revision)
+    assert display.data["brightness"] == 0.0
+
+async def test_superseded_backlight_fade_is_not_applied(hass, mock_adders, mock_send, setup_config_entry):
+    """Test a fade replaced by a newer brightness does not overwrite it."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.fade_backlight(hass, 0.2, 5)
+    display.update_settings(hass, {"brightness": "off"})
+    display.update(hass, {"brightness": 0.0})
+
+    display.acknowledge(display.revision)
+
+    assert display.data["brightness"] == 0.0
+
+async def test_wake_is_sent_only_to_connected_displays(hass, mock_adders, setup_config_entry):
+    """Test a wake goes straight out and is not held for a disconnected display."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.update(hass, {"brightness": 0.0})
+    display.wake()
+    assert display.pending.async_take() == []
+    assert display.settings["brightness"] == "on"
+    assert display.data["brightness"] == 1.0
+
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+    display.update(hass, {"client_version": MIN_VERSION_WAKE})
+    display.wake()
+
+    message = json.loads(connection.send_message.call_args.args[0])
+    assert message["event"] == {
+        "command": "remote_assist_display/wake",
+        "settings": {"brightness": "on"},
+        "revision": display.revision,
+    }
+
+
+async def test_wake_falls_back_to_settings_for_older_clients(hass, mock_adders, setup_config_entry):
+    """Test clients without the wake command are sent their settings instead."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.update(hass, {"brightness": 0.0})
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+    display.update(hass, {"client_version": MIN_VERSION_CONNECT_FRAME})
+    display.wake()
+
+    connection.send_message.assert_called_once()
+    message = json.loads(connection.send_message.call_args.args[0])
+    assert message["event"]["command"] == UPDATE_SETTINGS_WS_COMMAND
+    assert message["event"]["settings"]["brightness"] == "on"
+    assert display.data["brightness"] == 1.0
+
+async def test_setting_brightness_drops_the_curve(hass, mock_adders, mock_send, setup_config_entry):
+    """Test every way of setting the brightness stops following the curve."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    curve = {"source": "time", "points": [{"time": "06:00:00", "level": 0.4}]}
+    setters = (
+        lambda: display.update_settings(hass, {"brightness": "on"}),
+        lambda: display.apply_settings(hass, {"brightness": 0.5}),
+        lambda: display.fade_backlight(hass, 0.2, 5),
+        display.wake,
+    )
+    for set_brightness in setters:
+        display.set_brightness_curve(hass, curve)
+        set_brightness()
+        assert display.settings["brightness_curve"] is None
+        assert display.data["brightness_curve"] is None
+
+    # Other settings leave the curve alone
+    display.set_brightness_curve(hass, curve)
+    display.apply_settings(hass, {"screen_on": True})
+    assert display.data["brightness_curve"] is curve
+
+async def test_navigation_history_and_prefetch_hints(hass, mock_adders, setup_config_entry):
+    """Test navigation targets are recorded and turned into prefetch hints."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.entities["default_dashboard"] = Mock(native_value="lovelace")
+
+    for path in ("/a", "/b", "/b", "lovelace", "/c"):
+        display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path=path))
+
+    assert list(display.history) == ["/a", "/b", "lovelace", "/c"]
+    assert display.prefetch_hints(2) == ["lovelace", "/c", "/b"]
+    assert display.prefetch_hints(0) == ["lovelace"]
+
 async def test_connection_management(hass, mock_adders, mock_send, setup_config_entry):
     """Test connection management."""
     display = RemoteAssistDisplay(hass, "test_display")
     mock_connection = Mock()
     
     # Test opening connection
-    display.open_connection(hass, mock_connection, "connection_id")
+    _connect(hass, display, mock_connection, "connection_id")
     
     assert len(display._connections) == 1
     assert display._connections[0] == (mock_connection, "connection_id")
@@ -169,10 +362,175 @@ async def test_connection_management(hass, mock_adders, mock_send, setup_config_
     assert len(display._connections) == 0
     assert display.data["connected"] is False
 
+async def test_connect_is_a_single_pass(hass, mock_adders, mock_send, setup_config_entry):
+    """Test connecting updates entities once and sends a single frame."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    mock_connection = Mock()
+
+    with patch.object(DisplayDispatcher, "async_set_updated_data") as mock_set_data:
+        display.connect(
+            hass, mock_connection, 7, last_seen="2025-01-23T12:00:00", client_version="1.5.0"
+        )
+
+    assert display._connections == [(mock_connection, 7)]
+    assert display.data["connected"] is True
+    assert display.settings["last_seen"] == "2025-01-23T12:00:00"
+    mock_set_data.assert_called_once_with(display.data, ("connected",))
+    mock_connection.send_message.assert_called_once()
+    mock_send.assert_not_called()
+
+async def test_connect_resumes_session_with_changes_only(hass, mock_adders, mock_send, setup_config_entry):
+    """Test a client resuming its session only receives what changed."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.update_settings(hass, {"hostname": "kiosk"})
+    display.update(hass, {"client_version": "1.5.0", "current_url": "/a"})
+
+    first = Mock()
+    display.connect(hass, first, 1, last_seen="2025-01-23T12:00:00")
+    event = json.loads(first.send_message.call_args[0][0])["event"]
+    assert event["resumed"] is False
+    assert event["settings"]["hostname"] == "kiosk"
+    display.close_connection(hass, first)
+
+    display.update(hass, {"client_version": "1.5.0", "current_url": "/b"})
+
+    second = Mock()
+    display.connect(
+        hass,
+        second,
+        2,
+        last_seen="2025-01-23T12:05:00",
+        session=event["session"],
+        revision=event["revision"],
+    )
+    resumed = json.loads(second.send_message.call_args[0][0])["event"]
+    assert resumed["resumed"] is True
+    assert resumed["settings"] == {"last_seen": "2025-01-23T12:05:00"}
+    assert resumed["result"] == {"current_url": "/b", "connected": True}
+    assert resumed["revision"] == display.revision
+
+async def test_entity_writes_are_part_of_resume_deltas(hass, mock_adders, mock_send, setup_config_entry):
+    """Test settings changed through an entity are sent to a resuming client."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    switch = display.entities["hide_header"]
+    switch.hass = hass
+    revision = display.revision
+
+    await switch.async_turn_on()
+
+    settings, data = display.changes_since(revision)
+    assert settings["hide_header"] is True
+    assert settings["display"]["hide_header"] is True
+    assert data == {"hide_header": True}
+
+async def test_connect_with_unknown_session_sends_full_state(hass, mock_adders, mock_send, setup_config_entry):
+    """Test a client with a stale session token receives the full state."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.update_settings(hass, {"hostname": "kiosk"})
+
+    connection = Mock()
+    display.connect(
+        hass,
+        connection,
+        1,
+        last_seen="2025-01-23T12:00:00",
+        session="stale",
+        revision=0,
+        client_version="1.5.0",
+    )
+    event = json.loads(connection.send_message.call_args[0][0])["event"]
+    assert event["resumed"] is False
+    assert event["settings"]["hostname"] == "kiosk"
+    assert event["session"] == display.session_token
+
+async def test_commands_sent_while_offline_are_delivered_on_connect(hass, mock_adders, setup_config_entry):
+    """Test commands for a disconnected display arrive with the connect frame."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+    display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path="/b"))
+    display.update_settings(hass, {"hostname": "kiosk"})
+
+    connection = Mock()
+    display.connect(
+        hass, connection, 1, last_seen="2025-01-23T12:00:00", client_version="1.5.0"
+    )
+
+    connection.send_message.assert_called_once()
+    event = json.loads(connection.send_message.call_args[0][0])["event"]
+    assert event["commands"] == [{"command": NAVIGATE_WS_COMMAND, "path": "/b"}]
+    assert event["settings"]["hostname"] == "kiosk"
+    assert len(display.pending) == 0
+
+async def test_connect_sends_separate_frames_to_older_clients(hass, mock_adders, setup_config_entry):
+    """Test clients without the single connect frame get settings, data and commands apart."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.update(hass, {"client_version": "1.1.0"})
+    display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+    display.send_frame(CommandFrame(REFRESH_WS_COMMAND))
+
+    connection = Mock()
+    display.connect(hass, connection, 1, last_seen="2025-01-23T12:00:00")
+
+    frames = [
+        c.args[0] if isinstance(c.args[0], dict) else json.loads(c.args[0])
+        for c in connection.send_message.call_args_list
+    ]
+    assert frames[0]["event"] == {
+        "command": UPDATE_SETTINGS_WS_COMMAND,
+        "settings": display.settings,
+    }
+    assert frames[1]["event"] == {"result": display.data}
+    # Held commands are replayed one by one, as the client knows them
+    assert [frame["event"] for frame in frames[2:]] == [
+        {"command": NAVIGATE_WS_COMMAND, "path": "/a"},
+        {"command": REFRESH_WS_COMMAND},
+    ]
+    assert frames[2]["id"] == 1
+
+@patch("custom_components.remote_assist_display.outbound.IN_FLIGHT_DRAIN_RATE", 0)
+async def test_unsent_frames_are_held_when_the_connection_closes(hass, mock_adders, setup_config_entry):
+    """Test frames held behind the in-flight limit are delivered on the next connect."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+    display.outbound.in_flight = display.outbound.max_in_flight
+
+    display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+    display.update_settings(hass, {"hide_header": True})
+    await hass.async_block_till_done()
+    connection.send_message.assert_not_called()
+
+    display.close_connection(hass, connection)
+    assert len(display.outbound) == 0
+    assert len(display.pending) == 1
+
+    display.connect(
+        hass, connection, 4, last_seen="2025-01-23T12:00:00", client_version=MIN_VERSION_CONNECT_FRAME
+    )
+    event = json.loads(connection.send_message.call_args.args[0])["event"]
+    assert event["commands"] == [{"command": NAVIGATE_WS_COMMAND, "path": "/a"}]
+    assert event["settings"]["hide_header"] is True
+
 async def test_delete_display(hass, registered_display):
     """Test deleting a display."""
-    registered_display.delete(hass)
-    await verify_display_deleted(hass, registered_display)
+    entity_ids = [e.entity_id for e in registered_display.entities.values()]
+    await registered_display.delete(hass)
+    await verify_display_deleted(hass, entity_ids)
+    assert registered_display.entities == {}
+
+async def test_delete_display_already_removed_from_registries(hass, registered_display):
+    """Test deleting a display whose device and entities are already gone."""
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+    device_reg.async_remove_device(
+        device_reg.async_get_device({(DOMAIN, "test_display")}).id
+    )
+    for entity in registered_display.entities.values():
+        if entity_reg.async_get(entity.entity_id):
+            entity_reg.async_remove(entity.entity_id)
+
+    await registered_display.delete(hass)
+    assert registered_display.entities == {}
 
 async def test_get_or_register_display(hass, mock_adders, displays, mock_send, setup_config_entry):
     """Test get_or_register_display function."""
@@ -189,13 +547,15 @@ async def test_delete_display_function(hass, mock_adders, displays, registered_d
     """Test delete_display function."""
     # Add our registered display to the displays dict (which is what get_or_register_display would do)
     displays[registered_display.display_id] = registered_display
+    entity_ids = [e.entity_id for e in registered_display.entities.values()]
     
     # Delete display
     deleted_display = delete_display(hass, "test_display")
     
     assert deleted_display is registered_display
     assert "test_display" not in displays
-    await verify_display_deleted(hass, registered_display)
+    await hass.async_block_till_done()
+    await verify_display_deleted(hass, entity_ids)
 
 async def test_get_display_by_connection(hass, mock_adders, displays, setup_config_entry):
     """Test get_display_by_connection function."""
@@ -203,27 +563,100 @@ async def test_get_display_by_connection(hass, mock_adders, displays, setup_conf
     
     # Test with connected connection
     mock_connection = Mock()
-    display.open_connection(hass, mock_connection, "connection_id")
+    _connect(hass, display, mock_connection, "connection_id")
     
-    found_display = get_display_by_connection(hass, mock_connection)
-    assert found_display is display
+    found_displays = get_display_by_connection(hass, mock_connection)
+    assert found_displays == [display]
     
     # Test with non-connected connection
     other_connection = Mock()
-    found_display = get_display_by_connection(hass, other_connection)
-    assert found_display is None
+    found_displays = get_display_by_connection(hass, other_connection)
+    assert found_displays == []
+
+async def test_gateway_receives_shared_frame_once(hass, mock_adders, displays, setup_config_entry):
+    """Test displays bound to one subscription share each broadcast frame."""
+    gateway = Mock()
+    lobby = [get_or_register_display(hass, name) for name in ("left", "right")]
+    for display in lobby:
+        display.connect(hass, gateway, 5, last_seen="2025-01-23T12:00:00", gateway=True)
+
+    initial = [json.loads(c.args[0]) for c in gateway.send_message.call_args_list]
+    assert [m["recipients"] for m in initial] == [["left"], ["right"]]
+    assert get_display_by_connection(hass, gateway) == lobby
+
+    gateway.send_message.reset_mock()
+    frame = CommandFrame(NAVIGATE_WS_COMMAND, path="/lobby")
+    for display in lobby:
+        display.send_frame(frame)
+    await hass.async_block_till_done()
+
+    gateway.send_message.assert_called_once()
+    message = json.loads(gateway.send_message.call_args.args[0])
+    assert message["id"] == 5
+    assert message["recipients"] == ["left", "right"]
+    assert message["event"] == {"command": NAVIGATE_WS_COMMAND, "path": "/lobby"}
+    assert len(lobby[0].outbound) == 0
+
+@patch("custom_components.remote_assist_display.outbound.IN_FLIGHT_DRAIN_RATE", 0)
+async def test_gateway_frames_go_through_outbound_queue(hass, mock_adders, displays, setup_config_entry):
+    """Test a backlogged gateway display only receives the latest navigation."""
+    gateway = Mock()
+    display = get_or_register_display(hass, "lobby")
+    display.connect(hass, gateway, 5, last_seen="2025-01-23T12:00:00", gateway=True)
+    gateway.send_message.reset_mock()
+    display.outbound.in_flight = display.outbound.max_in_flight
+
+    display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path="/a"))
+    display.send_frame(CommandFrame(NAVIGATE_WS_COMMAND, path="/b"))
+    await hass.async_block_till_done()
+
+    gateway.send_message.assert_not_called()
+    assert display.outbound.superseded == 1
+
+    display.outbound.async_release()
+    await hass.async_block_till_done()
+
+    gateway.send_message.assert_called_once()
+    message = json.loads(gateway.send_message.call_args.args[0])
+    assert message["recipients"] == ["lobby"]
+    assert message["event"] == {"command": NAVIGATE_WS_COMMAND, "path": "/b"}
+
+@patch("custom_components.remote_assist_display.outbound.IN_FLIGHT_DRAIN_RATE", 0)
+async def test_delivered_revision_skips_held_settings(hass, mock_adders, setup_config_entry):
+    """Test a settings frame held behind the in-flight limit is not reported as delivered."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+    connected = display.revision
+    assert display.delivered_revision == connected
+
+    display.outbound.in_flight = display.outbound.max_in_flight
+    display.update_settings(hass, {"hide_header": True})
+    await hass.async_block_till_done()
+    connection.send_message.assert_not_called()
+    assert display.revision > connected
+    assert display.delivered_revision == connected
+
+    display.acknowledge(connected)
+    connection.send_message.assert_called_once()
+    assert display.delivered_revision == display.revision
 
 # Event-related tests
 
 async def test_event_listener_initialization(hass, mock_adders, setup_config_entry_with_event):
-    """Test event listener is set up when event_type is configured."""
+    """Test the shared listener follows event_type and links the satellite."""
     display = RemoteAssistDisplay(hass, "test_display")
-    assert display._event_listener is not None
+    display.entities["assist_satellite"] = Mock(satellite_id="test_device_id")
+    display.satellite_changed()
+
+    listener = async_get_intent_listener(hass)
+    assert listener.event_type == "test_event"
+    assert listener._satellites == {"test_device_id": {"test_display": display}}
 
 async def test_event_listener_not_initialized_without_event_type(hass, mock_adders, setup_config_entry):
-    """Test event listener is not set up when event_type is not configured."""
-    display = RemoteAssistDisplay(hass, "test_display")
-    assert display._event_listener is None
+    """Test no bus listener is set up when event_type is not configured."""
+    RemoteAssistDisplay(hass, "test_display")
+    assert async_get_intent_listener(hass)._unsub is None
 
 async def test_event_handling(hass, mock_adders, setup_config_entry_with_event, mock_send):
     """Test handling of events updates the intent sensor."""
@@ -233,6 +666,7 @@ async def test_event_handling(hass, mock_adders, setup_config_entry_with_event,
     # Create a display
     display = RemoteAssistDisplay(hass, "test_display")
     display.entities["assist_satellite"] = mock_satellite
+    display.satellite_changed()
 
     # Mock the intent sensor's update method
     intent_sensor = display.entities.get("intent_sensor")
@@ -265,6 +699,7 @@ async def test_event_handling_wrong_device(hass, mock_adders, setup_config_entry
     
     display = RemoteAssistDisplay(hass, "test_display")
     display.entities["assist_satellite"] = mock_satellite
+    display.satellite_changed()
 
     intent_sensor = display.entities.get("intent_sensor")
     intent_sensor.update_from_event = Mock()
@@ -287,12 +722,210 @@ async def test_event_handling_wrong_device(hass, mock_adders, setup_config_entry
     
     intent_sensor.update_from_event.assert_not_called()
 
-async def test_event_listener_cleanup(hass, mock_adders, setup_config_entry_with_event):
-    """Test event listener is cleaned up when new one is set."""
-    old_listener = Mock()
-    
-    with patch('homeassistant.core.EventBus.async_listen', return_value=old_listener):
-        display = RemoteAssistDisplay(hass, "test_display")
-        assert display._event_listener == old_listener
-        display._set_event_listener()
-        old_listener.assert_called_once()
\ No newline at end of file
+async def test_event_pushes_intent_to_display(hass, mock_adders, setup_config_entry_with_event):
+    """Test a matching intent event is pushed straight to the display."""
+    mock_satellite = Mock()
+    mock_satellite.satellite_id = "test_device_id"
+
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.entities["assist_satellite"] = mock_satellite
+    display.satellite_changed()
+    display.entities.get("intent_sensor").update_from_event = Mock()
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+
+    hass.bus.async_fire("test_event", {
+        "device_id": "test_device_id",
+        "result": {
+            "response": {
+                "response_type": "action_done",
+                "speech": {"plain": {"speech": "Turned on the light"}},
+                "card": {},
+                "data": {"targets": [{"id": "light.kitchen", "type": "entity"}]},
+            }
+        },
+    })
+    await hass.async_block_till_done()
+
+    message = json.loads(connection.send_message.call_args.args[0])
+    assert message["id"] == 3
+    assert message["event"] == {
+        "command": "remote_assist_display/intent",
+        "speech": "Turned on the light",
+        "card": None,
+        "response_type": "action_done",
+        "targets": ["light.kitchen"],
+    }
+
+async def test_pipeline_progress_is_pushed_to_display(hass, mock_adders, setup_config_entry):
+    """Test state changes of the linked satellite are sent as pipeline stages."""
+    hass.config_entries.async_update_entry(
+        setup_config_entry, options={"pipeline_status": True}
+    )
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.entities["assist_satellite"] = Mock(current_option="assist_satellite.kitchen")
+    connection = Mock()
+    _connect(hass, display, connection, 3)
+    display.satellite_changed()
+
+    hass.states.async_set("assist_satellite.other", "listening")
+    hass.states.async_set("assist_satellite.kitchen", "listening")
+    await hass.async_block_till_done()
+
+    connection.send_message.assert_called_once()
+    message = json.loads(connection.send_message.call_args.args[0])
+    assert message["event"] == {"command": "remote_assist_display/pipeline", "stage": "listening"}
+
+    display.release()
+    hass.states.async_set("assist_satellite.kitchen", "processing")
+    await hass.async_block_till_done()
+    connection.send_message.assert_called_once()
+
+async def test_event_navigates_on_matching_route(hass, mock_adders, setup_config_entry_with_event):
+    """Test an intent matching a route navigates the display in the same callback."""
+    async_load_routes(hass, [{"intent": "HassTurnOn", "slots": {"area": "kitchen"}, "path": "/kitchen"}])
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.entities["assist_satellite"] = Mock(satellite_id="test_device_id")
+    display.satellite_changed()
+    display.entities.get("intent_sensor").update_from_event = Mock()
+
+    hass.bus.async_fire("test_event", {
+        "device_id": "test_device_id",
+        "intent": {"name": "HassTurnOn"},
+        "slots": {"area": {"value": "kitchen"}},
+        "result": {"response": {"speech": {"plain": {"speech": "Done"}}}},
+    })
+    await hass.async_block_till_done()
+
+    assert [c["command"] for c in display.pending.async_take()] == [
+        "remote_assist_display/intent",
+        NAVIGATE_WS_COMMAND,
+    ]
+    assert display.history[-1] == "/kitchen"
+
+async def test_event_listener_unlinked_on_release(hass, mock_adders, setup_config_entry_with_event):
+    """Test a released display no longer receives intent events."""
+    display = RemoteAssistDisplay(hass, "test_display")
+    display.entities["assist_satellite"] = Mock(satellite_id="test_device_id")
+    display.satellite_changed()
+    listener = async_get_intent_listener(hass)
+
+    display.release()
+
+    assert listener._satellites == {}
+    assert listener._links == {}
+
+async def test_option_change_rebinds_event_listener(hass, mock_adders, displays, setup_config_entry):
+    """Test changing the event type only rebinds the shared listener."""
+    get_or_register_display(hass, "test_display")
+    listener = async_get_intent_listener(hass)
+    assert listener._unsub is None
+
+    with patch.object(DisplayDispatcher, "async_set_updated_data") as mock_set_data:
+        changed = apply_option_changes(hass, {}, {"event_type": "new_event"})
+
+    assert changed == {"event_type"}
+    assert listener.event_type == "new_event"
+    assert listener._unsub is not None
+    mock_set_data.assert_not_called()
+
+    apply_option_changes(hass, {"event_type": "new_event"}, {"event_type": ""})
+    assert listener._unsub is None
+
+async def test_option_change_pushes_defaults_to_affected_displays(hass, mock_adders, displays, mock_send, setup_config_entry):
+    """Test a changed default only reaches displays that fall back on it."""
+    following = get_or_register_display(hass, "following")
+    explicit = get_or_register_display(hass, "explicit")
+    explicit.update(hass, {"default_dashboard": "/explicit"})
+    explicit.settings["default_dashboard"] = "/explicit"
+    hass.config_entries.async_update_entry(
+        setup_config_entry, options={"default_dashboard_path": "/new"}
+    )
+
+    with patch.object(DisplayDispatcher, "async_set_updated_data") as mock_set_data:
+        apply_option_changes(
+            hass, {"default_dashboard_path": "/old"}, {"default_dashboard_path": "/new"}
+        )
+        await hass.async_block_till_done()
+
+    assert mock_set_data.call_count == 2
+    for call in mock_set_data.call_args_list:
+        assert call.args[1] == {"default_dashboard"}
+    assert following.settings["default_dashboard"] == "/new"
+    assert following.settings["display"] == {"default_dashboard": "/new"}
+    assert "display" not in explicit.settings
+    mock_send.assert_called_once_with(
+        "remote_assist_display/update_settings", settings=following.settings
+    )
+
+async def test_evict_idle_displays_after_ttl(hass, mock_adders, displays, setup_config_entry):
+    """Test disconnected displays idle for longer than the TTL are unloaded."""
+    hass.config_entries.async_update_entry(
+        setup_config_entry, options={"idle_display_ttl": 24}
+    )
+    stale = get_or_register_display(hass, "stale")
+    recent = get_or_register_display(hass, "recent")
+    connected = get_or_register_display(hass, "connected")
+    connected._connections.append((Mock(), 1))
+    stale.last_activity -= timedelta(hours=25)
+    connected.last_activity -= timedelta(hours=25)
+
+    assert evict_idle_displays(hass) == ["stale"]
+    assert set(displays) == {"recent", "connected"}
+    assert stale.entities == {}
+
+async def test_registering_after_eviction_waits_for_entity_removal(hass, init_integration):
+    """Test a display registered again right away gets its entities back."""
+    display = get_or_register_display(hass, "test_display")
+    await hass.async_block_till_done()
+    entity_id = display.entities["current_url"].entity_id
+
+    evict_display(hass, "test_display")
+    again = await async_get_or_register_display(hass, "test_display")
+    await hass.async_block_till_done()
+
+    assert again is not display
+    assert again.entities["current_url"].hass is hass
+    assert again.entities["current_url"].entity_id == entity_id
+    assert hass.states.get(entity_id) is not None
+
+async def test_max_displays_evicts_least_recently_active(hass, mock_adders, displays, setup_config_entry):
+    """Test registering past the cap evicts the oldest idle display."""
+    hass.config_entries.async_update_entry(
+        setup_config_entry, options={"max_displays": 2}
+    )
+    oldest = get_or_register_display(hass, "oldest")
+    get_or_register_display(hass, "newer")
+    oldest.last_activity -= timedelta(hours=1)
+
+    get_or_register_display(hass, "new")
+
+    assert set(displays) == {"newer", "new"}
+
+async def test_max_displays_with_every_display_connected(hass, mock_adders, displays, setup_config_entry):
+    """Test registering past the cap fails when no display is idle."""
+    hass.config_entries.async_update_entry(
+        setup_config_entry, options={"max_displays": 1}
+    )
+    display = get_or_register_display(hass, "busy")
+    display._connections.append((Mock(), 1))
+
+    with pytest.raises(DisplayLimitError):
+        get_or_register_display(hass, "new")
+    assert set(displays) == {"busy"}
+
+async def test_evict_idle_displays_purges_devices(hass, displays, registered_display, setup_config_entry):
+    """Test idle displays can also be removed from the registries."""
+    hass.config_entries.async_update_entry(
+        setup_config_entry,
+        options={"idle_display_ttl": 1, "purge_idle_displays": True},
+    )
+    displays["test_display"] = registered_display
+    registered_display.last_activity -= timedelta(hours=2)
+    entity_ids = [e.entity_id for e in registered_display.entities.values()]
+
+    assert evict_idle_displays(hass) == ["test_display"]
+    await hass.async_block_till_done()
+    assert "test_display" not in displays
+    assert registered_display.entities == {}
+    await verify_display_deleted(hass, entity_ids)
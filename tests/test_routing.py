@@ -0,0 +1,39 @@
+"""Test the Remote Assist Display intent routing."""
+import pytest
+import voluptuous as vol
+
+from custom_components.remote_assist_display.routing import RoutingTable
+
+ROUTES = [
+    {"intent": "HassTurnOn", "slots": {"area": "kitchen*"}, "path": "/kitchen"},
+    {"intent": "HassTurnOn", "area_id": "lobby", "path": "/lobby"},
+    {"intent": "HassTurnOn", "display_id": "hall", "path": "/hall"},
+    {"intent": "HassGetWeather", "path": "/weather"},
+]
+
+
+def test_routes_match_on_slot_patterns():
+    """Test slot patterns match case-insensitively and on slot dicts."""
+    table = RoutingTable(ROUTES)
+
+    assert table.match("HassTurnOn", {"area": "Kitchen Island"}, "any") == "/kitchen"
+    assert table.match("HassTurnOn", {"area": {"value": "kitchen"}}, "any") == "/kitchen"
+    assert table.match("HassGetWeather", {}, "any") == "/weather"
+    assert table.match("HassTurnOff", {}, "any") is None
+
+
+def test_routes_match_on_display_and_area():
+    """Test routes limited to displays or areas only match those."""
+    table = RoutingTable(ROUTES)
+
+    assert table.match("HassTurnOn", {}, "hall") == "/hall"
+    assert table.match("HassTurnOn", {}, "other", lambda: "lobby") == "/lobby"
+    assert table.match("HassTurnOn", {}, "other", lambda: "garage") is None
+    assert table.match("HassTurnOn", {}, "other") is None
+
+
+def test_invalid_routes_are_rejected():
+    """Test a route without a path fails to compile."""
+    with pytest.raises(vol.Invalid):
+        RoutingTable([{"intent": "HassTurnOn"}])
+    assert not RoutingTable()
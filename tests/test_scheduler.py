@@ -0,0 +1,148 @@
+"""Test the Remote Assist Display command scheduler."""
+from datetime import timedelta
+import math
+from unittest.mock import Mock
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.remote_assist_display.const import (
+    DATA_DISPLAYS,
+    DOMAIN,
+    REFRESH_WS_COMMAND,
+)
+from custom_components.remote_assist_display.scheduler import (
+    STORAGE_KEY,
+    DisplayScheduler,
+    next_due,
+)
+
+
+async def test_due_schedules_fire_in_one_pass(hass):
+    """Test schedules due at the same tick share frames and settings updates."""
+    displays = {"one": Mock(), "two": Mock()}
+    hass.data[DOMAIN][DATA_DISPLAYS] = displays
+    scheduler = DisplayScheduler(hass)
+    at = (dt_util.utcnow() + timedelta(seconds=30)).isoformat()
+    for schedule in (
+        {"command": "navigate", "path": "/night", "target": ["all"], "at": at},
+        {"command": "navigate", "path": "/night", "target": ["all"], "at": at},
+        {"command": "settings", "settings": {"hide_header": True}, "target": ["all"], "at": at},
+        {"command": "settings", "settings": {"brightness": 0.2}, "target": ["all"], "at": at},
+    ):
+        await scheduler.async_add(schedule)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+
+    frames = [d.send_frame.call_args.args[0] for d in displays.values()]
+    assert frames[0] is frames[1]
+    assert frames[0].payload == {"path": "/night"}
+    for display in displays.values():
+        display.send_frame.assert_called_once()
+        display.apply_settings.assert_called_once_with(
+            hass, {"hide_header": True, "brightness": 0.2}
+        )
+    assert scheduler.schedules == {}
+    scheduler.async_stop()
+
+
+async def test_recurring_schedule_is_put_back(hass):
+    """Test an interval schedule fires again one interval later."""
+    display = Mock()
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"one": display}
+    scheduler = DisplayScheduler(hass)
+    schedule = await scheduler.async_add(
+        {"command": "refresh", "target": ["all"], "interval": 60}
+    )
+
+    for minutes in (1, 2):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=minutes, seconds=1))
+        await hass.async_block_till_done()
+        assert display.send_frame.call_count == minutes
+
+    assert schedule["schedule_id"] in scheduler.schedules
+    await scheduler.async_remove(schedule["schedule_id"])
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=3, seconds=1))
+    await hass.async_block_till_done()
+    assert display.send_frame.call_count == 2
+    assert scheduler._unsub is None
+
+
+async def test_schedules_are_restored(hass, hass_storage):
+    """Test stored schedules are put back on the wheel on load."""
+    display = Mock()
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"one": display}
+    past = dt_util.utcnow() - timedelta(hours=1)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "schedules": [
+                {"schedule_id": "missed", "command": "refresh", "target": ["all"],
+                 "at": past.isoformat(), "next": past.isoformat()},
+                {"schedule_id": "nightly", "command": "refresh", "target": ["all"],
+                 "time": "04:00:00", "next": past.isoformat()},
+            ]
+        },
+    }
+    scheduler = DisplayScheduler(hass)
+    await scheduler.async_load()
+
+    assert dt_util.parse_datetime(scheduler.schedules["nightly"]["next"]) > dt_util.utcnow()
+    display.send_frame.assert_not_called()
+
+    # The one-shot missed while stopped is sent on the next tick
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    display.send_frame.assert_called_once()
+    assert display.send_frame.call_args.args[0].command == REFRESH_WS_COMMAND
+    assert "missed" not in scheduler.schedules
+    assert "nightly" in scheduler.schedules
+    scheduler.async_stop()
+
+
+async def test_failing_display_does_not_stop_the_scheduler(hass):
+    """Test a display raising while sending neither blocks others nor the timer."""
+    broken, working = Mock(), Mock()
+    broken.send_frame.side_effect = RuntimeError("boom")
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"broken": broken, "working": working}
+    scheduler = DisplayScheduler(hass)
+    await scheduler.async_add({"command": "refresh", "target": ["all"], "interval": 60})
+
+    for minutes in (1, 2):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=minutes, seconds=1))
+        await hass.async_block_till_done()
+        assert working.send_frame.call_count == minutes
+
+    assert broken.send_frame.call_count == 2
+    scheduler.async_stop()
+
+
+async def test_schedules_never_fire_early(hass):
+    """Test a late timer only fires the ticks that have fully passed."""
+    display = Mock()
+    hass.data[DOMAIN][DATA_DISPLAYS] = {"one": display}
+    scheduler = DisplayScheduler(hass)
+    tick = math.ceil(dt_util.utcnow().timestamp()) + 60
+    first = dt_util.utc_from_timestamp(tick - 0.5)
+    second = dt_util.utc_from_timestamp(tick + 0.5)
+    for at in (first, second):
+        await scheduler.async_add({"command": "refresh", "target": ["all"], "at": at.isoformat()})
+
+    # Run the timer callback as if it were called late
+    scheduler._unsub()
+    scheduler._async_fire(dt_util.utc_from_timestamp(tick + 0.2))
+
+    display.send_frame.assert_called_once()
+    assert len(scheduler.schedules) == 1
+    scheduler.async_stop()
+
+
+def test_next_daily_time_is_in_the_future():
+    """Test a daily time falls tomorrow once today's has passed."""
+    now = dt_util.utcnow()
+    due = next_due({"time": "00:00:00"}, now)
+    assert now < due <= now + timedelta(days=1)
+    assert next_due({"at": now.isoformat()}, now, now) is None
@@ -94,4 +94,5 @@ async def test_satellite_select_option(rad_satellite_select):
             await rad_satellite_select.async_select_option("assist_satellite.kitchen")
             
             assert rad_satellite_select._attr_current_option == "assist_satellite.kitchen"
+            rad_satellite_select.display.satellite_changed.assert_called_once()
             mock_update.assert_called_once()
\ No newline at end of file
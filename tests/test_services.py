@@ -1,12 +1,25 @@
 """Test the Remote Assist Display services."""
+from datetime import timedelta
 from unittest.mock import Mock
 import pytest
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
-from custom_components.remote_assist_display.const import DOMAIN, NAVIGATE_SERVICE, NAVIGATE_URL_SERVICE
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import device_registry as dr, entity_registry as er, restore_state
+from homeassistant.util import dt as dt_util
+from custom_components.remote_assist_display.const import APPLY_SETTINGS_SERVICE, DATA_CONFIG_ENTRY, DOMAIN, MIN_VERSION_PLAYLIST, NAVIGATE_SERVICE, NAVIGATE_URL_SERVICE
+from custom_components.remote_assist_display.last_seen import async_get_last_seen
+from custom_components.remote_assist_display.scheduler import DisplayScheduler
 from custom_components.remote_assist_display.service import async_setup_services
 
 
+def assert_frame_sent(display, command, payload):
+    """Assert a single command frame was sent to a display."""
+    display.send_frame.assert_called_once()
+    frame = display.send_frame.call_args.args[0]
+    assert frame.command == command
+    assert frame.payload == payload
+
+
 @pytest.fixture
 async def mock_device(hass: HomeAssistant, config_entry):
     """Create a mock device for testing."""
@@ -34,7 +47,7 @@ async def test_service_call_with_device_id_target(hass: HomeAssistant, mock_devi
             target={"device_id": mock_device.id}
         )
     
-    mock_display.send.assert_called_once_with("remote_assist_display/navigate", path="/test")
+    assert_frame_sent(mock_display, "remote_assist_display/navigate", {"path": "/test"})
 
 
 
@@ -51,7 +64,7 @@ async def test_service_call_with_correct_target_succeeds(hass: HomeAssistant, mo
         }
     )
     
-    mock_display.send.assert_called_once_with("remote_assist_display/navigate", path="/test")
+    assert_frame_sent(mock_display, "remote_assist_display/navigate", {"path": "/test"})
 
 async def test_service_call_with_invalid_target_fails(hass: HomeAssistant, setup_services):
     """Test service call fails with invalid target."""
@@ -82,7 +95,7 @@ async def test_url_service_call_with_device_id_target(hass: HomeAssistant, mock_
             target={"device_id": mock_device.id}
         )
     
-    mock_display.send.assert_called_once_with("remote_assist_display/navigate_url", url="http://test.com")
+    assert_frame_sent(mock_display, "remote_assist_display/navigate_url", {"url": "http://test.com"})
 
 async def test_url_service_call_with_correct_target_succeeds(hass: HomeAssistant, mock_device, mock_display, setup_services):
     """Test service call succeeds with proper target in service data."""
@@ -97,7 +110,7 @@ async def test_url_service_call_with_correct_target_succeeds(hass: HomeAssistant
         }
     )
     
-    mock_display.send.assert_called_once_with("remote_assist_display/navigate_url", url="http://test.com")
+    assert_frame_sent(mock_display, "remote_assist_display/navigate_url", {"url": "http://test.com"})
 
 async def test_url_service_call_with_invalid_target_fails(hass: HomeAssistant, setup_services):
     """Test service call fails with invalid target."""
@@ -164,4 +177,416 @@ async def test_refresh_service_with_supported_display_succeeds(hass: HomeAssista
         return_response=True 
     )
 
-    assert response["success"] is True
\ No newline at end of file
+    assert response["success"] is True
+
+async def test_apply_settings_to_device_target(hass: HomeAssistant, mock_device, mock_display, setup_services):
+    """Test apply_settings applies one patch to the targeted display."""
+    hass.data[DOMAIN] = {"displays": {mock_device.name: mock_display}}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        APPLY_SETTINGS_SERVICE,
+        service_data={
+            "target": [mock_device.id],
+            "hide_header": True,
+            "brightness": 255,
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["success"] is True
+    mock_display.apply_settings.assert_called_once_with(
+        hass, {"hide_header": True, "brightness": 1.0}
+    )
+
+async def test_apply_settings_to_all_displays(hass: HomeAssistant, setup_services):
+    """Test apply_settings with the all target updates every display."""
+    displays = {"one": Mock(), "two": Mock()}
+    hass.data[DOMAIN] = {"displays": displays}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        APPLY_SETTINGS_SERVICE,
+        service_data={"target": "all", "default_dashboard": "/lovelace/0"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["success"] is True
+    assert [r["display_id"] for r in response["results"]] == ["one", "two"]
+    for display in displays.values():
+        display.apply_settings.assert_called_once_with(
+            hass, {"default_dashboard": "/lovelace/0"}
+        )
+
+async def test_apply_settings_to_area(hass: HomeAssistant, mock_device, mock_display, setup_services):
+    """Test apply_settings resolves displays by area."""
+    hass.data[DOMAIN] = {"displays": {mock_device.name: mock_display}}
+    dr.async_get(hass).async_update_device(mock_device.id, area_id="kitchen")
+
+    await hass.services.async_call(
+        DOMAIN,
+        APPLY_SETTINGS_SERVICE,
+        service_data={"area_id": "kitchen", "hide_sidebar": False},
+        blocking=True,
+        return_response=True,
+    )
+
+    mock_display.apply_settings.assert_called_once_with(hass, {"hide_sidebar": False})
+
+async def test_apply_settings_without_match_fails(hass: HomeAssistant, setup_services):
+    """Test apply_settings reports failure when nothing matches."""
+    hass.data[DOMAIN] = {"displays": {}}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        APPLY_SETTINGS_SERVICE,
+        service_data={"target": ["invalid-device"], "hide_header": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["success"] is False
+
+async def test_refresh_service_with_stagger_reports_progress(hass: HomeAssistant, mock_device, mock_display, setup_services):
+    """Test a staggered refresh returns the broadcast progress and can be cancelled."""
+    hass.data[DOMAIN] = {"displays": {mock_device.name: mock_display}}
+    mock_display.data.get.return_value = "1.2.0"
+    response = await hass.services.async_call(
+        DOMAIN,
+        "refresh",
+        service_data={
+            "target": [mock_device.id],
+            "stagger": 30,
+        },
+        blocking=True,
+        return_response=True
+    )
+
+    assert response["success"] is True
+    assert response["broadcast"]["total"] == 1
+    assert response["broadcast"]["sent"] == 1
+    assert response["broadcast"]["done"] is True
+
+async def test_cancel_broadcast_with_unknown_id_fails(hass: HomeAssistant, setup_services):
+    """Test cancelling an unknown broadcast reports an error."""
+    hass.data[DOMAIN] = {"displays": {}}
+    response = await hass.services.async_call(
+        DOMAIN,
+        "cancel_broadcast",
+        service_data={"broadcast_id": "missing"},
+        blocking=True,
+        return_response=True
+    )
+
+    assert response["success"] is False
+
+async def test_broadcast_status_reports_progress(hass: HomeAssistant, mock_device, mock_display, setup_services):
+    """Test the progress of a broadcast can be looked up after it started."""
+    hass.data[DOMAIN] = {"displays": {mock_device.name: mock_display}}
+    mock_display.data.get.return_value = "1.2.0"
+    started = await hass.services.async_call(
+        DOMAIN,
+        "refresh",
+        service_data={"target": [mock_device.id], "stagger": 30},
+        blocking=True,
+        return_response=True
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "broadcast_status",
+        service_data={"broadcast_id": started["broadcast"]["broadcast_id"]},
+        blocking=True,
+        return_response=True
+    )
+
+    assert response["success"] is True
+    assert response["broadcast"]["sent"] == 1
+    assert response["broadcast"]["done"] is True
+
+async def test_navigate_encodes_command_once_for_all_targets(hass: HomeAssistant, config_entry, setup_services):
+    """Test every targeted display receives the same pre-serialized frame."""
+    dev_reg = dr.async_get(hass)
+    displays = {}
+    device_ids = []
+    for name in ("one", "two"):
+        device = dev_reg.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            identifiers={(DOMAIN, name)},
+            name=name,
+        )
+        device_ids.append(device.id)
+        displays[name] = Mock()
+    hass.data[DOMAIN] = {"displays": displays}
+
+    await hass.services.async_call(
+        DOMAIN,
+        NAVIGATE_SERVICE,
+        service_data={"target": device_ids, "path": "/test"},
+        blocking=True,
+    )
+
+    frames = [d.send_frame.call_args.args[0] for d in displays.values()]
+    assert frames[0] is frames[1]
+
+async def test_prefetch_service_sends_hints(hass: HomeAssistant, mock_device, mock_display, setup_services):
+    """Test prefetch sends the display's hints when no paths are given."""
+    hass.data[DOMAIN] = {"displays": {mock_device.name: mock_display}}
+    mock_display.prefetch_hints.return_value = ["lovelace", "/recent"]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "prefetch",
+        service_data={"target": [mock_device.id]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["results"][0]["paths"] == ["lovelace", "/recent"]
+    mock_display.prefetch_hints.assert_called_once_with(3)
+    assert_frame_sent(mock_display, "remote_assist_display/prefetch", {"paths": ["lovelace", "/recent"]})
+
+async def test_prefetch_service_with_explicit_paths(hass: HomeAssistant, mock_device, mock_display, setup_services):
+    """Test prefetch sends explicit paths as given."""
+    hass.data[DOMAIN] = {"displays": {mock_device.name: mock_display}}
+
+    await hass.services.async_call(
+        DOMAIN,
+        "prefetch",
+        service_data={"target": [mock_device.id], "paths": ["/a", "/b"]},
+        blocking=True,
+        return_response=True,
+    )
+
+    mock_display.prefetch_hints.assert_not_called()
+    assert_frame_sent(mock_display, "remote_assist_display/prefetch", {"paths": ["/a", "/b"]})
+
+@pytest.fixture
+def purge_fleet(hass: HomeAssistant, config_entry):
+    """Register a fleet of displays with different ages, hostnames and versions."""
+    dev_reg = dr.async_get(hass)
+    now = dt_util.utcnow()
+    displays = {}
+    for name, hostname, version, age in (
+        ("kiosk-old", "kiosk-1", "1.1.0", timedelta(days=40)),
+        ("kiosk-new", "kiosk-2", "1.2.0", timedelta(minutes=5)),
+        ("office", "office", "1.0.0", timedelta(minutes=5)),
+    ):
+        display = Mock(connection=[], last_activity=now - age)
+        display.settings = {"hostname": hostname, "last_seen": (now - age).isoformat()}
+        display.data = {"client_version": version}
+        displays[name] = display
+    for name in (*displays, "ghost", "unloaded-old", "unloaded-new"):
+        dev_reg.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            identifiers={(DOMAIN, name)},
+            name=name,
+        )
+    hass.data[DOMAIN] = {"displays": displays, DATA_CONFIG_ENTRY: config_entry}
+    last_seen = async_get_last_seen(hass)
+    last_seen.async_touch("unloaded-old", now - timedelta(days=40))
+    last_seen.async_touch("unloaded-new", now - timedelta(minutes=5))
+    return displays
+
+async def test_purge_dry_run_lists_matches(hass: HomeAssistant, purge_fleet, setup_services):
+    """Test a dry run reports the matching displays without removing them."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        "purge",
+        service_data={"hostname": "KIOSK-*", "client_version_below": "1.2.0", "dry_run": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["dry_run"] is True
+    assert [r["display_id"] for r in response["results"]] == ["kiosk-old"]
+    assert response["results"][0]["hostname"] == "kiosk-1"
+    assert len(purge_fleet) == 3
+    assert dr.async_get(hass).async_get_device({(DOMAIN, "kiosk-old")}) is not None
+
+async def test_purge_removes_stale_displays(hass: HomeAssistant, purge_fleet, setup_services):
+    """Test purging removes displays last seen before the cutoff.
+
+    Devices that are not loaded are matched on their persisted last seen time,
+    and a device without one is kept while recording has only just started.
+    """
+    old = purge_fleet["kiosk-old"]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "purge",
+        service_data={"older_than": {"days": 30}},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert sorted(r["display_id"] for r in response["results"]) == [
+        "kiosk-old",
+        "unloaded-old",
+    ]
+    assert set(purge_fleet) == {"kiosk-new", "office"}
+    old.release.assert_called_once()
+    dev_reg = dr.async_get(hass)
+    assert dev_reg.async_get_device({(DOMAIN, "kiosk-old")}) is None
+    assert dev_reg.async_get_device({(DOMAIN, "unloaded-old")}) is None
+    assert dev_reg.async_get_device({(DOMAIN, "unloaded-new")}) is not None
+    assert dev_reg.async_get_device({(DOMAIN, "ghost")}) is not None
+    assert dev_reg.async_get_device({(DOMAIN, "office")}) is not None
+    assert async_get_last_seen(hass).get("unloaded-old") is None
+
+async def test_purge_matches_devices_registered_before_recording(
+    hass: HomeAssistant, config_entry, purge_fleet, setup_services
+):
+    """Test devices without a last seen record are matched on what is still known.
+
+    They were last seen when their entities were last alive, if Home Assistant
+    remembers that, and before the store started recording at the latest.
+    """
+    now = dt_util.utcnow()
+    since = now - timedelta(days=2)
+    async_get_last_seen(hass)._since = since
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    for name, alive in (("legacy-old", 40), ("legacy-new", 5)):
+        device = dev_reg.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            identifiers={(DOMAIN, name)},
+        )
+        entry = ent_reg.async_get_or_create(
+            "sensor", DOMAIN, f"{name}-Current_URL", device_id=device.id
+        )
+        restore_state.async_get(hass).last_states[entry.entity_id] = restore_state.StoredState(
+            State(entry.entity_id, "/"), None, now - timedelta(days=alive)
+        )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "purge",
+        service_data={"older_than": {"days": 1}, "dry_run": True},
+        blocking=True,
+        return_response=True,
+    )
+    matched = {r["display_id"]: r["last_seen"] for r in response["results"]}
+    assert matched["ghost"] == since.isoformat()
+    assert matched["legacy-new"] == (now - timedelta(days=5)).isoformat()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "purge",
+        service_data={"older_than": {"days": 7}},
+        blocking=True,
+        return_response=True,
+    )
+    assert sorted(r["display_id"] for r in response["results"]) == [
+        "kiosk-old",
+        "legacy-old",
+        "unloaded-old",
+    ]
+    assert dev_reg.async_get_device({(DOMAIN, "legacy-old")}) is None
+    assert dev_reg.async_get_device({(DOMAIN, "legacy-new")}) is not None
+    assert dev_reg.async_get_device({(DOMAIN, "ghost")}) is not None
+
+async def test_schedule_service_stores_schedule(hass: HomeAssistant, setup_services):
+    """Test the schedule service returns the stored schedule."""
+    scheduler = DisplayScheduler(hass)
+    response = await hass.services.async_call(
+        DOMAIN,
+        "schedule",
+        service_data={"target": "all", "command": "settings", "brightness": 51, "time": "22:00"},
+        blocking=True,
+        return_response=True,
+    )
+
+    schedule = response["schedule"]
+    assert schedule["settings"] == {"brightness": 0.2}
+    assert schedule["time"] == "22:00:00"
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "unschedule",
+        service_data={"schedule_id": schedule["schedule_id"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["success"] is True
+    assert scheduler.schedules == {}
+    scheduler.async_stop()
+
+async def test_schedule_service_requires_command_args(hass: HomeAssistant, setup_services):
+    """Test a scheduled navigation without a path is rejected."""
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            "schedule",
+            service_data={"target": "all", "command": "navigate", "interval": "01:00:00"},
+            blocking=True,
+            return_response=True,
+        )
+
+async def test_start_and_stop_playlist(hass: HomeAssistant, setup_services):
+    """Test a playlist is sent to every selected display and can be stopped."""
+    displays = {"one": Mock(), "two": Mock()}
+    hass.data[DOMAIN] = {"displays": displays}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "start_playlist",
+        service_data={
+            "target": "all",
+            "items": [{"path": "/a", "dwell": 30}, {"path": "/b", "dwell": "15"}],
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["success"] is True
+    playlist = displays["one"].set_playlist.call_args.args[1]
+    assert playlist["playlist_id"] == response["playlist_id"]
+    assert playlist["items"] == [{"path": "/a", "dwell": 30.0}, {"path": "/b", "dwell": 15.0}]
+    assert playlist["loop"] is True
+    displays["two"].set_playlist.assert_called_once_with(hass, playlist)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "stop_playlist",
+        service_data={"target": "all"},
+        blocking=True,
+        return_response=True,
+    )
+    displays["one"].set_playlist.assert_called_with(hass, None)
+
+
+async def test_start_playlist_refuses_old_clients(hass: HomeAssistant, setup_services):
+    """Test a playlist is only sent to clients that can rotate through it."""
+    displays = {"old": Mock(), "new": Mock()}
+    displays["old"].supports.return_value = False
+    displays["old"].data = {"client_version": "1.2.0"}
+    hass.data[DOMAIN] = {"displays": displays}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "start_playlist",
+        service_data={"target": "all", "items": [{"path": "/a", "dwell": 30}]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["success"] is False
+    assert response["results"][0]["status"] == "error"
+    assert "1.2.0" in response["results"][0]["error"]
+    assert response["results"][1] == {"display_id": "new", "status": "success"}
+    displays["old"].supports.assert_called_once_with(MIN_VERSION_PLAYLIST)
+    displays["old"].set_playlist.assert_not_called()
+    displays["new"].set_playlist.assert_called_once()
+
+    # Stopping is always allowed, so a playlist is never left running
+    await hass.services.async_call(
+        DOMAIN,
+        "stop_playlist",
+        service_data={"target": "all"},
+        blocking=True,
+        return_response=True,
+    )
+    displays["old"].set_playlist.assert_called_once_with(hass, None)
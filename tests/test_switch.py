@@ -65,18 +65,14 @@ async def test_header_switch_turn_on(mock_coordinator, mock_display):
         with patch.object(entity, 'schedule_update_ha_state') as mock_schedule_update:
             await entity.async_turn_on()
             
-            mock_display.update_settings.assert_called_once_with(
-                entity.hass,
-                {
-                    "hide_header": True,
-                    "display": {"hide_header": True},
-                }
+            mock_display.apply_settings.assert_called_once_with(
+                entity.hass, {"hide_header": True}
             )
             
             assert entity.is_on
             
-            mock_write_state.assert_called_once()
-            mock_schedule_update.assert_called_once()
+            mock_write_state.assert_not_called()
+            mock_schedule_update.assert_not_called()
 
 async def test_header_switch_turn_off(mock_coordinator, mock_display):
     """Test turning off the switch."""
@@ -90,16 +86,12 @@ async def test_header_switch_turn_off(mock_coordinator, mock_display):
         with patch.object(entity, 'schedule_update_ha_state') as mock_schedule_update:
             await entity.async_turn_off()
             
-            mock_display.update_settings.assert_called_once_with(
-                entity.hass,
-                {
-                    "hide_header": False,
-                    "display": {"hide_header": False},
-                }
+            mock_display.apply_settings.assert_called_once_with(
+                entity.hass, {"hide_header": False}
             )
             
-            mock_write_state.assert_called_once()
-            mock_schedule_update.assert_called_once()
+            mock_write_state.assert_not_called()
+            mock_schedule_update.assert_not_called()
 
 async def test_sidebar_switch_initialization(mock_coordinator, mock_display):
     """Test RADHideSidebarSwitch initialization."""
@@ -161,17 +153,13 @@ async def test_sidebar_switch_turn_on(mock_coordinator, mock_display):
     with patch.object(entity, 'async_write_ha_state') as mock_write_state:
         await entity.async_turn_on()
         
-        mock_display.update_settings.assert_called_once_with(
-            entity.hass,
-            {
-                "hide_sidebar": True,
-                "display": {"hide_sidebar": True},
-            }
+        mock_display.apply_settings.assert_called_once_with(
+            entity.hass, {"hide_sidebar": True}
         )
         
         assert entity.is_on
         
-        mock_write_state.assert_called_once()
+        mock_write_state.assert_not_called()
 
 async def test_sidebar_switch_turn_off(mock_coordinator, mock_display):
     """Test turning off the switch."""
@@ -184,14 +172,10 @@ async def test_sidebar_switch_turn_off(mock_coordinator, mock_display):
     with patch.object(entity, 'async_write_ha_state') as mock_write_state:
         await entity.async_turn_off()
         
-        mock_display.update_settings.assert_called_once_with(
-            entity.hass,
-            {
-                "hide_sidebar": False,
-                "display": {"hide_sidebar": False},
-            }
+        mock_display.apply_settings.assert_called_once_with(
+            entity.hass, {"hide_sidebar": False}
         )
         
-        mock_write_state.assert_called_once()
+        mock_write_state.assert_not_called()
 
 
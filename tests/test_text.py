@@ -93,17 +93,13 @@ async def test_dashboard_async_set_value(hass, mock_coordinator, mock_display):
     with patch.object(entity, 'async_write_ha_state') as mock_write_state:
         await entity.async_set_value("/lovelace/new")
         
-        mock_display.update_settings.assert_called_once_with(
-            hass,
-            {
-                "default_dashboard": "/lovelace/new",
-                "display": {"default_dashboard": "/lovelace/new"},
-            }
+        mock_display.apply_settings.assert_called_once_with(
+            hass, {"default_dashboard": "/lovelace/new"}
         )
         
         assert entity._value == "/lovelace/new"
         
-        mock_write_state.assert_called_once()
+        mock_write_state.assert_not_called()
 
 async def test_device_storage_key_text_initialization(mock_coordinator, mock_display):
     """Test DeviceStorageKeyText initialization."""
@@ -169,14 +165,10 @@ async def test_device_storage_key_async_set_value(hass, mock_coordinator, mock_d
     with patch.object(entity, 'async_write_ha_state') as mock_write_state:
         await entity.async_set_value("new-key")
 
-        mock_display.update_settings.assert_called_once_with(
-            hass,
-            {
-                "device_name_storage_key": "new-key",
-                "display": {"device_name_storage_key": "new-key"},
-            }
+        mock_display.apply_settings.assert_called_once_with(
+            hass, {"device_name_storage_key": "new-key"}
         )
 
         assert entity._value == "new-key"
 
-        mock_write_state.assert_called_once()
\ No newline at end of file
+        mock_write_state.assert_not_called()
\ No newline at end of file
@@ -10,11 +10,15 @@ from pytest_homeassistant_custom_component.typing import WebSocketGenerator
 from homeassistant.core import HomeAssistant
 
 from custom_components.remote_assist_display.const import (
+    BATCH_WS_COMMAND,
+    CONNECT_MANY_WS_COMMAND,
     CONNECT_WS_COMMAND,
     REGISTER_WS_COMMAND,
     SETTINGS_WS_COMMAND,
+    SUBSCRIBE_FLEET_WS_COMMAND,
     UPDATE_WS_COMMAND,
 )
+from custom_components.remote_assist_display.dispatcher import DisplayDispatcher
 from custom_components.remote_assist_display.remote_assist_display import (
     get_or_register_display,
 )
@@ -59,6 +63,83 @@ async def test_connect_command_registers_new_display(
     assert display.data.get("connected") is True
 
 
+async def test_connect_command_sends_single_initial_frame(
+    hass: HomeAssistant,
+    init_integration,
+    ws_client,
+    mock_datetime,
+) -> None:
+    """Test connect sends settings and data to the client in one frame."""
+    await ws_client.send_json({
+        "id": 1,
+        "type": CONNECT_WS_COMMAND,
+        "display_id": "test-display-id",
+        "client_version": "1.5.0",
+    })
+
+    msg = await ws_client.receive_json()
+    assert msg["result"] == "registered"
+
+    msg = await ws_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["type"] == "event"
+    assert msg["event"]["command"] == "remote_assist_display/update_settings"
+    assert msg["event"]["settings"]["last_seen"] == "2025-01-23T12:00:00"
+    assert msg["event"]["result"]["connected"] is True
+
+
+async def test_connect_command_without_version_sends_two_frames(
+    hass: HomeAssistant,
+    init_integration,
+    ws_client,
+    mock_datetime,
+) -> None:
+    """Test a client that does not report its version gets the old sequence."""
+    await ws_client.send_json({
+        "id": 1,
+        "type": CONNECT_WS_COMMAND,
+        "display_id": "test-display-id",
+    })
+
+    msg = await ws_client.receive_json()
+    assert msg["result"] == "registered"
+
+    msg = await ws_client.receive_json()
+    assert msg["event"]["command"] == "remote_assist_display/update_settings"
+    assert "result" not in msg["event"]
+
+    msg = await ws_client.receive_json()
+    assert msg["event"]["result"]["connected"] is True
+
+
+async def test_connect_many_binds_displays_to_one_subscription(
+    hass: HomeAssistant,
+    init_integration,
+    ws_client,
+    mock_datetime,
+) -> None:
+    """Test connect_many registers each display on a single subscription."""
+    await ws_client.send_json({
+        "id": 1,
+        "type": CONNECT_MANY_WS_COMMAND,
+        "display_ids": ["wall-1", "wall-2"],
+    })
+
+    msg = await ws_client.receive_json()
+    assert msg["result"] == "registered"
+
+    recipients = []
+    for _ in range(2):
+        msg = await ws_client.receive_json()
+        assert msg["id"] == 1
+        assert msg["event"]["result"]["connected"] is True
+        recipients.extend(msg["recipients"])
+    assert recipients == ["wall-1", "wall-2"]
+
+    for display_id in ("wall-1", "wall-2"):
+        assert get_or_register_display(hass, display_id).data["connected"] is True
+
+
 @pytest.mark.xfail(reason="Multiple connections are not properly handled yet - connections should be replaced rather than added")
 async def test_connect_command_replaces_existing_connection(
     hass: HomeAssistant,
@@ -302,4 +383,79 @@ async def test_update_command_updates_client_version(
     assert msg["success"]
 
     display = get_or_register_display(hass, "test-display-id")
-    assert display.data["client_version"] == test_version
\ No newline at end of file
+    assert display.data["client_version"] == test_version
+
+async def test_batch_command_applies_operations_in_one_update(
+    hass: HomeAssistant,
+    init_integration,
+    ws_client,
+) -> None:
+    """Test a batch applies its operations in order with one entity update."""
+    display = get_or_register_display(hass, "test-display-id")
+    display.update(hass, {"existing_key": "existing_value"})
+    revision = display.revision
+
+    with patch.object(
+        DisplayDispatcher,
+        "async_set_updated_data",
+        wraps=display.coordinator.async_set_updated_data,
+    ) as mock_set_data:
+        await ws_client.send_json({
+            "id": 1,
+            "type": BATCH_WS_COMMAND,
+            "display_id": "test-display-id",
+            "ops": [
+                {"op": "update", "data": {"current_url": "/a", "brightness": 0.5}},
+                {"op": "ack", "revision": revision},
+                {"op": "update", "data": {"current_url": "/b"}},
+            ],
+        })
+        msg = await ws_client.receive_json()
+
+    assert msg["success"]
+    # Only the acknowledged revision is known to have reached the client
+    assert msg["result"] == {"revision": revision}
+    mock_set_data.assert_called_once()
+    assert display.data["existing_key"] == "existing_value"
+    assert display.data["current_url"] == "/b"
+    assert display.data["brightness"] == 0.5
+    assert display.acked_revision == revision
+
+async def test_batch_command_rejects_unknown_operation(
+    hass: HomeAssistant,
+    init_integration,
+    ws_client,
+) -> None:
+    """Test a batch with an invalid operation is rejected as a whole."""
+    display = get_or_register_display(hass, "test-display-id")
+
+    await ws_client.send_json({
+        "id": 1,
+        "type": BATCH_WS_COMMAND,
+        "display_id": "test-display-id",
+        "ops": [
+            {"op": "update", "data": {"current_url": "/a"}},
+            {"op": "reboot"},
+        ],
+    })
+    msg = await ws_client.receive_json()
+
+    assert not msg["success"]
+    assert "current_url" not in display.data
+
+async def test_subscribe_fleet_sends_snapshot(
+    hass: HomeAssistant,
+    init_integration,
+    ws_client,
+) -> None:
+    """Test subscribing to the fleet returns a snapshot of every display."""
+    display = get_or_register_display(hass, "test-display-id")
+    display.update(hass, {"client_version": "1.2.0"})
+
+    await ws_client.send_json({"id": 1, "type": SUBSCRIBE_FLEET_WS_COMMAND})
+
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    msg = await ws_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["event"]["snapshot"]["test-display-id"]["client_version"] == "1.2.0"